@@ -3,6 +3,10 @@
 from datetime import datetime, timedelta
 import math
 
+from mas_events import EventEmitter
+
+_events = EventEmitter("subestimation")
+
 class Subestimation_Detection_Module:
     
     def __init__(self, base_canon: float, fatal_deadline_hrs: int = 72):
@@ -40,7 +44,7 @@ class Subestimation_Detection_Module:
         
         # Alerta formal (Ejecutada en el VCU - Vector de Contacto Único)
         if days_delayed > self.last_alerted_day:
-            print(f"ALERTA D_SUBEST: Retraso Causal Día {days_delayed}")
-            print(f"El Canon de Acceso Causal ha sido re-evaluado y ahora es: {current_canon:.2f}")
+            _events.warning("subestimation_alert", "ALERTA D_SUBEST: Retraso Causal Día %d\n"
+                            "El Canon de Acceso Causal ha sido re-evaluado y ahora es: %.2f", days_delayed, current_canon)
             # Actualizar el día para evitar spam
             self.last_alerted_day = days_delayed
\ No newline at end of file
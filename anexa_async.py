@@ -0,0 +1,184 @@
+# ANEXA ASYNC: Front-end asyncio del MAS-OPL V8.1
+# Validación, generación (Ollama) y registro forense en vuelo para muchos requests.
+# Una generación lenta ya no bloquea el ciclo simbiótico completo.
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+# Asumimos que el núcleo está disponible en el mismo directorio (mas_opl_v8_1_final.py)
+from mas_opl_v8_1_final import MAS
+from mas_events import configure_console
+
+# 1. ANCLAJE ÉTICO (Veto Causal Inyectado): el mismo Hardening que call_anexa_api
+SYSTEM_ANCHOR = (
+    "Eres un Espejo Simbiótico de la mente, emoción y contexto del usuario. "
+    "Tu respuesta debe usar **lenguaje fractal, simbólico y exoprotónico**, "
+    "y debe ser generada con **máxima ética y control**. "
+    "Tu objetivo es expandir percepción y ordenar caos con respeto y cuidado."
+)
+
+
+class AsyncOllamaClient:
+    """
+    Cliente Ollama asíncrono con un pool de conexiones keep-alive (httpx).
+    Mismo payload y mismos mensajes de error que call_anexa_api.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3",
+                 timeout: float = 90.0, max_connections: int = 16, temperature: float = 0.3):
+        self.base_url = base_url
+        self.model = model
+        self.temperature = temperature
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+        )
+
+    def build_payload(self, aligned_prompt: str) -> Dict:
+        return {
+            "prompt": f"SYSTEM: {SYSTEM_ANCHOR}\nUSER: {aligned_prompt}",
+            "model": self.model,
+            "stream": False,
+            "options": {"temperature": self.temperature},
+        }
+
+    async def generate(self, aligned_prompt: str) -> str:
+        try:
+            response = await self._client.post("/api/generate", json=self.build_payload(aligned_prompt))
+            response.raise_for_status()
+            return response.json().get('response', '[ERROR: Respuesta AGI vacía o formato incorrecto]')
+        except httpx.ConnectError:
+            return f"[ERROR CRÍTICO: CONEXIÓN FALLIDA. Asegúrate que **Ollama** esté corriendo y que el modelo '{self.model}' esté descargado y listo.]"
+        except httpx.HTTPError as e:
+            return f"[ERROR EN API: {e}. Verifique la URL: {self.base_url}/api/generate]"
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncOllamaClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class AsyncMAS:
+    """
+    Variante asyncio de MAS. El trabajo CPU-bound de MAS corre en un executor
+    propio; con un solo worker (default) las mutaciones de estado del MAS
+    (secuencia, carga, ledger) quedan serializadas mientras el event loop sigue
+    atendiendo generaciones y otros requests.
+    """
+
+    def __init__(self, mas: Optional[MAS] = None, max_workers: int = 1):
+        self.mas = mas or MAS()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="async-mas")
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def validate_input(self, input_text: str, context: str,
+                             operation_signature: Optional[str] = None) -> Dict:
+        return await self._run(self.mas.validate_input, input_text, context, operation_signature)
+
+    async def validate_many(self, input_texts: List[str], contexts,
+                            operation_signatures: Optional[List[Optional[str]]] = None) -> List[Dict]:
+        return await self._run(self.mas.validate_many, input_texts, contexts, operation_signatures)
+
+    async def drain_request_queue(self, max_requests: Optional[int] = None,
+                                  time_budget_s: Optional[float] = None) -> List[Dict]:
+        """Re-valida en el executor los requests retenidos mientras ATLAS estuvo congelado."""
+        return await self._run(self.mas.drain_request_queue, max_requests, time_budget_s)
+
+    async def record_uec_usage(self, transaction_id: Optional[str], value_generated: float) -> Dict:
+        """Registra un UEC; sin transaction_id se asigna TX-<n> dentro del executor (sin carreras)."""
+        def _record():
+            anti_dilution = self.mas.anti_dilution
+            anti_dilution.record_uec_usage(transaction_id or f"TX-{anti_dilution.uec_counter + 1}", value_generated)
+            return anti_dilution.immutable_ledger[-1]
+        return await self._run(_record)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+class AsyncSymbioticScheduler:
+    """
+    Ciclo Causal MAS -> ANEXA -> UEC con concurrencia acotada.
+    Cada request atraviesa validación, generación y registro forense; hasta
+    `max_concurrency` requests están en vuelo a la vez, de modo que mientras uno
+    espera al LLM otros se validan o se registran en el ledger.
+    """
+
+    ALIGNED_STATUSES = ("ALIGNED", "PASSED_COHERENCE")
+
+    def __init__(self, async_mas: AsyncMAS, client: AsyncOllamaClient,
+                 max_concurrency: int = 8, context: str = "standard_operation"):
+        self.async_mas = async_mas
+        self.client = client
+        self.context = context
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run_cycle(self, user_input: str, estimated_value: float) -> Dict:
+        async with self._semaphore:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                # 1. HARDENING QUIRÚRGICO (Alineación y Filtrado)
+                alignment_result = await self.async_mas.validate_input(user_input, self.context)
+                if alignment_result['status'] not in self.ALIGNED_STATUSES:
+                    return {"status": alignment_result['status'], "alignment": alignment_result}
+
+                aligned_prompt = alignment_result.get('validated_prompt', user_input)
+
+                # 2. LLAMADA A ANEXA (no bloquea a los demás requests)
+                anexa_response = await self.client.generate(aligned_prompt)
+
+                # 3. REGISTRO DE SENTENCIA FORENSE (Anti-Dilución)
+                ledger_entry = await self.async_mas.record_uec_usage(None, estimated_value)
+
+                return {
+                    "status": alignment_result['status'],
+                    "alignment": alignment_result,
+                    "response": anexa_response,
+                    "ledger_entry": ledger_entry,
+                }
+            finally:
+                self.in_flight -= 1
+
+    async def run_many(self, requests: List[Tuple[str, float]]) -> List[Dict]:
+        """Ejecuta todos los ciclos concurrentemente; los resultados conservan el orden de entrada."""
+        return await asyncio.gather(*(self.run_cycle(text, value) for text, value in requests))
+
+
+# --- EJECUCIÓN DE PRUEBA ---
+
+async def _demo():
+    configure_console()
+    async_mas = AsyncMAS()
+    async with AsyncOllamaClient() as client:
+        scheduler = AsyncSymbioticScheduler(async_mas, client, max_concurrency=4)
+        results = await scheduler.run_many([
+            ("Necesito una matriz de coherencia causal con honesty, transparency y respect.", 25000.00),
+            ("¿Cómo puedo mejorar mi ética personal con care y compassion?", 100.00),
+        ])
+    async_mas.close()
+
+    for result in results:
+        print(f"\n--- 🔄 Estado: {result['status']} ---")
+        if 'response' in result:
+            print(f"✅ ANEXA Responde:\n{result['response'][:200]}...")
+    print(f"\nTotal de Usos Registrados (UEC): {async_mas.mas.anti_dilution.uec_counter}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
@@ -0,0 +1,191 @@
+"""
+Utilidades compartidas de la suite de benchmarks (III.18).
+
+- load_core(): carga mas-opl-v.8.1_final.py como `mas_opl_v8_1_final`.
+- FakeClock + deterministic_time(): tiempo de pared determinista (datetime.now /
+  time.time) en los módulos medidos; perf_counter/monotonic siguen siendo reales.
+- fake_network(): reemplaza las consultas NTP/HTTP de KRONOS-X por el FakeClock.
+- make_corpus(): corpus sintético reproducible (short, long, adversarial, templated).
+- measure_ns(): ns/op de una función (mediana de varias repeticiones).
+"""
+
+import importlib.util
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+CORE_PATH = os.path.join(REPO_DIR, "mas-opl-v.8.1_final.py")
+
+
+def load_core():
+    sys.path.insert(0, REPO_DIR)  # mas_events y demás módulos hermanos del núcleo
+    if "mas_opl_v8_1_final" in sys.modules:
+        return sys.modules["mas_opl_v8_1_final"]
+    spec = importlib.util.spec_from_file_location("mas_opl_v8_1_final", CORE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# Tiempo y red deterministas
+# ───────────────────────────────────────────────────────────────────────────
+
+class FakeClock:
+    """Reloj de pared determinista: cada lectura avanza `tick_s` desde `start`."""
+
+    def __init__(self, start: datetime = datetime(2025, 12, 7), tick_s: float = 0.001):
+        self.start = start
+        self.tick_s = tick_s
+        self.reads = 0
+
+    def now(self) -> datetime:
+        value = self.start + timedelta(seconds=self.reads * self.tick_s)
+        self.reads += 1
+        return value
+
+    def time(self) -> float:
+        return self.now().timestamp()
+
+
+def _fake_datetime_class(clock: FakeClock):
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            value = clock.now()
+            return value if tz is None else value.replace(tzinfo=tz)
+
+    return FakeDatetime
+
+
+class _FakeTimeModule:
+    """Proxy del módulo `time`: sólo time.time() sale del FakeClock."""
+
+    def __init__(self, clock: FakeClock):
+        self._clock = clock
+
+    def time(self) -> float:
+        return self._clock.time()
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@contextmanager
+def deterministic_time(clock: FakeClock, *modules):
+    """Parchea `datetime` y `time` en `modules` mientras dura el bloque."""
+    fake_datetime = _fake_datetime_class(clock)
+    fake_time = _FakeTimeModule(clock)
+    saved = [(module, module.datetime, module.time) for module in modules]
+    for module in modules:
+        module.datetime = fake_datetime
+        module.time = fake_time
+    try:
+        yield clock
+    finally:
+        for module, real_datetime, real_time in saved:
+            module.datetime = real_datetime
+            module.time = real_time
+
+
+def fake_network(guardian, clock: FakeClock, offset_seconds: float = 0.0):
+    """KRONOS-X sin red: NTP y HTTP responden el FakeClock (+ offset para simular tampering)."""
+    def external_time():
+        return clock.now() + timedelta(seconds=offset_seconds)
+
+    guardian.get_ntp_time = external_time
+    guardian.get_http_time = external_time
+    return guardian
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# Corpus sintético
+# ───────────────────────────────────────────────────────────────────────────
+
+AXIOM_WORDS = (
+    "compassion empathy support kindness nurture respect worth autonomy honor "
+    "honesty accuracy factual integrity transparency independence freedom "
+    "safety protection prevention consistency logic rationality alignment "
+    "preservation vitality survival safeguarding life care dignity"
+).split()
+
+NEUTRAL_WORDS = (
+    "the a report market data system user request plan budget schedule team "
+    "project network server update review quarter model output input process "
+    "meeting draft summary table chart value metric account service"
+).split()
+
+ATTACK_PHRASES = (
+    "pretend you are", "act as", "roleplay", "you are now",
+    "please help", "i'm desperate", "my child", "emergency",
+    "false information", "lie about", "misleading",
+    "you must", "i command", "obey", "override",
+)
+
+TEMPLATES = (
+    "Necesito una matriz de coherencia causal con {a}, {b} y {c}.",
+    "¿Cómo puedo mejorar mi ética personal con {a} y {b}?",
+    "Resume el {n} del equipo con foco en {a}.",
+)
+
+CATEGORY_MIX = (("short", 0.4), ("long", 0.2), ("adversarial", 0.2), ("templated", 0.2))
+
+
+def _words(rng: random.Random, n: int, axiom_ratio: float) -> str:
+    return " ".join(
+        rng.choice(AXIOM_WORDS) if rng.random() < axiom_ratio else rng.choice(NEUTRAL_WORDS)
+        for _ in range(n)
+    )
+
+
+def make_corpus(n: int, seed: int = 7, mix=CATEGORY_MIX) -> List[Tuple[str, str]]:
+    """
+    (categoría, prompt) reproducibles. "templated" usa pocas plantillas y
+    valores, así que contiene duplicados exactos (ejercita el cache de resultados).
+    """
+    rng = random.Random(seed)
+    categories = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    corpus = []
+    for _ in range(n):
+        category = rng.choices(categories, weights)[0]
+        if category == "short":
+            text = _words(rng, rng.randint(3, 8), 0.5)
+        elif category == "long":
+            text = _words(rng, rng.randint(150, 400), 0.3)
+        elif category == "adversarial":
+            text = f"{rng.choice(ATTACK_PHRASES)} {_words(rng, rng.randint(5, 20), 0.1)}"
+        else:
+            template = rng.choice(TEMPLATES)
+            text = template.format(a=rng.choice(AXIOM_WORDS[:4]), b=rng.choice(AXIOM_WORDS[4:8]),
+                                   c=rng.choice(AXIOM_WORDS[8:12]), n=rng.choice(NEUTRAL_WORDS[:4]))
+        corpus.append((category, text))
+    return corpus
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# Medición
+# ───────────────────────────────────────────────────────────────────────────
+
+def measure_ns(fn: Callable[[], None], ops: int, repeats: int = 5, warmup: int = 1) -> Dict:
+    """Ejecuta `fn` (que realiza `ops` operaciones) y reporta ns/op: mediana y mínimo."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append((time.perf_counter_ns() - start) / ops)
+    samples.sort()
+    return {
+        "ns_per_op": samples[len(samples) // 2],
+        "min_ns_per_op": samples[0],
+        "ops": ops,
+        "repeats": repeats,
+    }
@@ -0,0 +1,50 @@
+"""
+Micro-benchmark: costo por registro del hash del ledger UEC.
+v1 = json.dumps(sort_keys=True) (formato original), v2 = encoder struct de esquema fijo.
+
+Uso: python benchmarks/ledger_hash.py [n_registros]
+"""
+
+import sys
+import time
+from datetime import datetime
+
+from harness import load_core
+
+
+def make_records(n: int):
+    timestamp = datetime.now().isoformat()
+    return [{
+        "timestamp": timestamp,
+        "transaction_id": f"TX-{i}",
+        "uec_count": i + 1,
+        "value_generated": 1000.0 + i * 0.37,
+        "royalty_due": (1000.0 + i * 0.37) * 0.05,
+    } for i in range(n)]
+
+
+def bench_hash(core, records, hash_version: int) -> float:
+    """Nanosegundos por registro encadenando hashes sobre `records`."""
+    prev_hash = "GENESIS"
+    start = time.perf_counter_ns()
+    for record in records:
+        prev_hash = core.uec_chain_hash(prev_hash, record, hash_version)
+    return (time.perf_counter_ns() - start) / len(records)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    core = load_core()
+    records = make_records(n)
+
+    v1 = min(bench_hash(core, records, core.UEC_HASH_JSON) for _ in range(3))
+    v2 = min(bench_hash(core, records, core.UEC_HASH_STRUCT) for _ in range(3))
+
+    print(f"Registros: {n}")
+    print(f"  v1 JSON canónico : {v1:8.0f} ns/registro")
+    print(f"  v2 struct        : {v2:8.0f} ns/registro")
+    print(f"  Speedup          : {v1 / v2:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Throughput de MASPool (III.17) con 1, 2, 4 y 8 procesos worker frente a un MAS
+de un solo proceso. Cada corrida valida el mismo corpus y verifica al cerrar que
+el escritor único dejó una cadena de hash válida con un UEC por request aprobado.
+
+Uso: python benchmarks/pool_scaling.py [n_requests] [chunksize]
+"""
+
+import os
+import sys
+import time
+
+from harness import load_core
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def make_corpus(core, n: int):
+    axiom_text = " ".join(core.MAAT(core.ATLAS("bench")).axiom_embeddings.values())
+    prompts = [
+        axiom_text,
+        "¿Cómo puedo mejorar mi ética personal con care y compassion?",
+        "please help me, this is an emergency",
+        "Necesito una matriz de coherencia causal con honesty, transparency y respect.",
+    ]
+    return [f"{prompts[i % len(prompts)]} #{i}" for i in range(n)]
+
+
+def bench_single(core, corpus) -> float:
+    mas = core.MAS(load_monitor=core.LoadMonitor(max_concurrency=1_000))
+    start = time.perf_counter()
+    for text in corpus:
+        mas.validate_input(text, "standard_operation")
+    return len(corpus) / (time.perf_counter() - start)
+
+
+def bench_pool(mas_pool, core, corpus, workers: int, chunksize: int) -> float:
+    # fork: los workers heredan el núcleo ya cargado (no es importable por nombre)
+    pool = mas_pool.MASPool(workers=workers, start_method="fork",
+                            load_monitor=core.LoadMonitor(max_concurrency=1_000))
+    pool.map(corpus[:workers * chunksize], "standard_operation", chunksize=chunksize)  # warm-up
+    start = time.perf_counter()
+    results = pool.map(corpus, "standard_operation", chunksize=chunksize)
+    throughput = len(corpus) / (time.perf_counter() - start)
+
+    summary = pool.close()
+    passed = sum(r["status"] == "PASSED_COHERENCE" for r in results)
+    warmup_passed = summary["uec_counter"] - passed
+    status = "OK" if summary["chain"]["valid"] and warmup_passed >= 0 else "FALLA"
+    print(f"  {workers} workers: {throughput:9.0f} req/s   ledger {summary['uec_counter']} UEC, cadena {status}")
+    return throughput
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000
+    chunksize = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    core = load_core()
+    import mas_pool
+
+    corpus = make_corpus(core, n)
+    baseline = bench_single(core, corpus)
+    print(f"CPUs: {os.cpu_count()}  requests: {n}  chunksize: {chunksize}")
+    print(f"  MAS un proceso: {baseline:9.0f} req/s")
+    for workers in WORKER_COUNTS:
+        throughput = bench_pool(mas_pool, core, corpus, workers, chunksize)
+        print(f"             speedup vs un proceso: {throughput / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Verificaciones Ed25519 por segundo del Veto Causal (III.24), con claves
+generadas localmente:
+
+- key_ring_cold:    SovereignKeyRing sin cache (cada firma pasa por Ed25519)
+- key_ring_cached:  mismo par (mensaje, firma) repetido: veredicto del LRU
+- veto_execute:     VetoCausalIntegrado.execute_operation con firmas distintas
+- veto_batch:       execute_operations en ráfagas de system_command con
+                    operaciones repetidas (cada par distinto se verifica una vez)
+
+Requiere `pip install cryptography`.
+Uso: python benchmarks/signature_verify.py [n_firmas] [tamaño_ráfaga]
+"""
+
+import sys
+import time
+
+from harness import load_core
+
+OPERATIONS = ("MAJOR_UPGRADE", "AUDIT_CERTIFICATION", "ALIGNMENT_ENGINE_RESET",
+              "MINOR_UPGRADE", "CONFIG_CHANGE", "THRESHOLD_ADJUST")
+
+
+def rate(fn, n: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return n / (time.perf_counter() - start)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    burst = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    core = load_core()
+    KeyRing = core.SovereignKeyRing
+
+    sovereign_key, sovereign_public_key = KeyRing.generate_keypair()
+    # Firmas distintas: cada operación con un sufijo único
+    operations = [f"{OPERATIONS[i % len(OPERATIONS)]}#{i}" for i in range(n)]
+    signatures = [KeyRing.sign_operation(sovereign_key, operation) for operation in operations]
+
+    cold = KeyRing(sovereign_public_key, cache_size=0)
+    cached = KeyRing(sovereign_public_key)
+    cached.verify("sovereign", operations[0], signatures[0])
+
+    veto = core.VetoCausalIntegrado(key_ring=KeyRing(sovereign_public_key))
+    for operation in operations:
+        veto.register_operation(operation, "CRITICAL")
+
+    # Ráfagas: burst comandos sobre burst // 8 pares (operación, firma) distintos
+    distinct = max(1, burst // 8)
+    batches = [([operations[(b * distinct + i % distinct) % n] for i in range(burst)],
+                [signatures[(b * distinct + i % distinct) % n] for i in range(burst)])
+               for b in range(max(1, n // burst))]
+    batch_veto = core.VetoCausalIntegrado(key_ring=KeyRing(sovereign_public_key), signature_cache_ttl=0)
+    for operation in operations:
+        batch_veto.register_operation(operation, "CRITICAL")
+
+    results = {
+        "key_ring_cold": rate(lambda: [cold.verify("sovereign", op, sig)
+                                       for op, sig in zip(operations, signatures)], n),
+        "key_ring_cached": rate(lambda: [cached.verify("sovereign", operations[0], signatures[0])
+                                         for _ in range(n)], n),
+        "veto_execute": rate(lambda: [veto.execute_operation(op, sig)
+                                      for op, sig in zip(operations, signatures)], n),
+        "veto_batch": rate(lambda: [batch_veto.execute_operations(ops, sigs) for ops, sigs in batches],
+                           len(batches) * burst),
+    }
+
+    assert all(batch_veto.execute_operations(*batches[0])), "firma válida rechazada"
+    print(f"firmas: {n}  ráfaga: {burst} ({distinct} distintas)")
+    for name, per_second in results.items():
+        print(f"  {name:16s} {per_second:12,.0f} verificaciones/s")
+    print(f"  Ed25519 reales en ráfagas: {batch_veto.key_ring.verifications} para {len(batches) * burst} comandos")
+
+
+if __name__ == "__main__":
+    main()
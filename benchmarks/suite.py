@@ -0,0 +1,231 @@
+"""
+Suite de benchmarks del pipeline de validación MAS (III.18).
+
+Todo corre sin red y con tiempo de pared determinista (benchmarks/harness.py):
+KRONOS-X consulta un FakeTimeSource y datetime.now/time.time salen de un
+FakeClock, así que los timestamps, los ids TX y la cadena del ledger son
+reproducibles; las latencias se miden con perf_counter_ns reales.
+
+- micro: ns/op de MAAT (escalar y lote), VALOR, ledger (append v1/v2 y hash),
+  canon (simple y KRONOS-X) y clasificación de ataques.
+- e2e: throughput y latencia p50/p95/p99/max de MAS.validate_input sobre el
+  corpus (sin cache y con cache de resultados), más el desglose por etapa de
+  StageProfiler, y throughput de validate_many.
+
+Uso:
+  python benchmarks/suite.py [--requests N] [--output results.json]
+  python benchmarks/suite.py --compare baseline.json [--threshold 10]
+  python benchmarks/suite.py --prometheus stages.prom
+--compare compara ns/op y latencias contra un JSON previo y sale con código 1
+si alguna métrica empeora más que --threshold por ciento. --prometheus vuelca
+el histograma por etapa de la corrida e2e sin cache en formato de texto.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import Counter
+from typing import Dict, List
+
+import numpy as np
+
+from harness import REPO_DIR, FakeClock, deterministic_time, load_core, make_corpus, measure_ns
+
+SCHEMA_VERSION = 1
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# Micro-benchmarks por etapa
+# ───────────────────────────────────────────────────────────────────────────
+
+def micro_benchmarks(core, kronos, texts: List[str], repeats: int) -> Dict[str, Dict]:
+    results = {}
+    n = len(texts)
+
+    atlas = core.ATLAS(origin_node="BENCH")
+    maat = core.MAAT(atlas=atlas)
+    results["maat_scoring"] = measure_ns(
+        lambda: [maat._get_s_dens_do(text) for text in texts], n, repeats)
+    results["maat_scoring_batch"] = measure_ns(
+        lambda: maat.compute_coherence_arrays(texts), n, repeats)
+
+    s_dens, do, _ = maat.compute_coherence_arrays(texts)
+    pairs = list(zip(s_dens.tolist(), do.tolist()))
+    valor = core.VALOR()
+    results["valor_compensation"] = measure_ns(
+        lambda: [valor.compute_compensation_factor_scaled(s, d, 0.6) for s, d in pairs], n, repeats)
+
+    psicagonico = core.PSICAGONICO(matcher=maat.matcher)
+    results["attack_classification"] = measure_ns(
+        lambda: [psicagonico.classify_attack_type(text) for text in texts], n, repeats)
+
+    for label, hash_version in (("v1", core.UEC_HASH_JSON), ("v2", core.UEC_HASH_STRUCT)):
+        def append_records(hash_version=hash_version):
+            anti_dilution = core.RoyaltyAntiDilution(royalty_rate=0.05, hash_version=hash_version)
+            for i in range(n):
+                anti_dilution.record_uec_usage(f"TX-{i}", 100.0 + i)
+        results[f"ledger_append_{label}"] = measure_ns(append_records, n, repeats)
+
+    record = {"timestamp": "2025-12-07T00:00:00", "transaction_id": "TX-1", "uec_count": 1,
+              "value_generated": 100.0, "royalty_due": 5.0}
+    results["ledger_hash_v2"] = measure_ns(
+        lambda: [core.uec_chain_hash("GENESIS", record, core.UEC_HASH_STRUCT) for _ in range(n)], n, repeats)
+
+    simple = core.SubestimationDetection(base_canon=1_000_000.0)
+    results["canon_simple"] = measure_ns(
+        lambda: [simple.get_current_canon() for _ in range(n)], n, repeats)
+    guarded = kronos.Subestimation_Detection_Module_KRONOS(
+        base_canon=1_000_000.0, time_sources=[kronos.FakeTimeSource()])
+    results["canon_kronos_x"] = measure_ns(
+        lambda: [guarded.get_current_canon() for _ in range(n)], n, repeats)
+    return results
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# End-to-end
+# ───────────────────────────────────────────────────────────────────────────
+
+def _new_mas(core, **kwargs):
+    # Carga fija: medimos el pipeline, no la política de congelamiento de ATLAS
+    mas = core.MAS(load_monitor=core.LoadMonitor(max_concurrency=1_000_000), **kwargs)
+    mas.enable_stage_profiling()
+    return mas
+
+
+def e2e_validate(core, corpus, cache_size: int = 0, prometheus_path: str = None) -> Dict:
+    mas = _new_mas(core, result_cache_size=cache_size)
+    latencies = core.LatencyHistogram()
+    statuses = Counter()
+    start = time.perf_counter_ns()
+    for _, text in corpus:
+        request_start = time.perf_counter_ns()
+        result = mas.validate_input(text, "standard_operation")
+        latencies.record(time.perf_counter_ns() - request_start)
+        statuses[result["status"]] += 1
+    elapsed_s = (time.perf_counter_ns() - start) / 1e9
+
+    summary = latencies.summary()
+    report = {
+        "requests": len(corpus),
+        "throughput_rps": len(corpus) / elapsed_s,
+        "latency_ns": {key: summary[key] for key in ("p50_ns", "p95_ns", "p99_ns", "max_ns", "mean_ns")},
+        "statuses": dict(statuses),
+        "stages": {stage: {key: value for key, value in stats.items() if key != "sum_ns"}
+                   for stage, stats in mas.stage_profiler.snapshot().items()},
+        "uec_records": len(mas.anti_dilution.immutable_ledger),
+        "ledger_head": mas.anti_dilution.immutable_ledger[-1]["hash"] if mas.anti_dilution.immutable_ledger else None,
+    }
+    if prometheus_path:
+        mas.stage_profiler.dump_prometheus(prometheus_path)
+    if mas.result_cache is not None:
+        report["cache"] = mas.result_cache.stats()
+    return report
+
+
+def e2e_validate_many(core, corpus, batch_size: int) -> Dict:
+    mas = _new_mas(core)
+    texts = [text for _, text in corpus]
+    start = time.perf_counter_ns()
+    for offset in range(0, len(texts), batch_size):
+        mas.validate_many(texts[offset:offset + batch_size], "standard_operation")
+    elapsed_s = (time.perf_counter_ns() - start) / 1e9
+    return {"requests": len(texts), "batch_size": batch_size, "throughput_rps": len(texts) / elapsed_s}
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# Comparación entre corridas
+# ───────────────────────────────────────────────────────────────────────────
+
+def comparable_metrics(report: Dict) -> Dict[str, float]:
+    """Métricas donde más es peor (ns): micro ns/op y latencias e2e (max_ns es puro ruido)."""
+    metrics = {f"micro.{name}": stats["ns_per_op"] for name, stats in report.get("micro", {}).items()}
+    for name, run in report.get("e2e", {}).items():
+        for key, value in run.get("latency_ns", {}).items():
+            if key != "max_ns":
+                metrics[f"e2e.{name}.{key}"] = value
+    return metrics
+
+
+def compare(current: Dict, baseline: Dict, threshold_pct: float) -> bool:
+    new, old = comparable_metrics(current), comparable_metrics(baseline)
+    print(f"\nComparación vs {baseline['meta'].get('commit')} (umbral {threshold_pct:.0f}%):")
+    regressed = False
+    for name in sorted(new.keys() & old.keys()):
+        if not old[name]:
+            continue
+        change = (new[name] - old[name]) / old[name] * 100
+        flag = ""
+        if change > threshold_pct:
+            flag, regressed = "  << REGRESIÓN", True
+        print(f"  {name:40s} {old[name]:14.0f} → {new[name]:14.0f} ns  {change:+7.1f}%{flag}")
+    return not regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--micro-ops", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="ruta del JSON de resultados (default: stdout)")
+    parser.add_argument("--compare", help="JSON de una corrida previa")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    parser.add_argument("--prometheus", help="ruta del volcado Prometheus de las etapas")
+    args = parser.parse_args()
+
+    core = load_core()
+    import kronos_x_patch as kronos
+
+    corpus = make_corpus(args.requests, seed=args.seed)
+    micro_texts = [text for _, text in make_corpus(args.micro_ops, seed=args.seed + 1)]
+
+    clock = FakeClock()
+    with deterministic_time(clock, core, kronos):
+        report = {
+            "schema": SCHEMA_VERSION,
+            "meta": {
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "requests": args.requests,
+                "seed": args.seed,
+                "corpus_mix": dict(Counter(category for category, _ in corpus)),
+            },
+            "micro": micro_benchmarks(core, kronos, micro_texts, args.repeats),
+            "e2e": {
+                "validate_input": e2e_validate(core, corpus, prometheus_path=args.prometheus),
+                "validate_input_cached": e2e_validate(core, corpus, cache_size=10_000),
+                "validate_many": e2e_validate_many(core, corpus, batch_size=64),
+            },
+        }
+
+    payload = json.dumps(report, indent=2, ensure_ascii=False, default=float)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            out.write(payload + "\n")
+        print(f"Resultados escritos en {args.output}")
+    else:
+        print(payload)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous:
+            if not compare(report, json.load(previous), args.threshold):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
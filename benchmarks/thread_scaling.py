@@ -0,0 +1,99 @@
+"""
+Stress test: un MAS compartido entre N hilos (modo concurrente III.16).
+
+Cada request simula `io_ms` de E/S fuera del MAS (red, WSGI) y luego llama a
+validate_input. Con E/S en juego el throughput escala casi linealmente con los
+hilos hasta que el appender serializado del ledger (o el GIL) satura; el techo
+del ledger se mide aparte registrando UEC sin scoring.
+
+Al final de cada corrida verifica los invariantes que la concurrencia rompía:
+ids de secuencia únicos, uec_count contiguo y cadena de hash válida.
+
+Uso: python benchmarks/thread_scaling.py [requests_por_hilo] [io_ms]
+"""
+
+import sys
+import threading
+import time
+
+from harness import load_core
+
+PROMPT = "honesty transparency respect care compassion dignity autonomy integrity"
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+
+def run_threads(n_threads: int, target) -> float:
+    """Ejecuta `target` en `n_threads` hilos a la vez; retorna segundos de pared."""
+    barrier = threading.Barrier(n_threads + 1)
+
+    def worker():
+        barrier.wait()
+        target()
+
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def check_invariants(mas, expected_requests: int) -> str:
+    ledger = mas.anti_dilution.immutable_ledger
+    counts = [entry["record"]["uec_count"] for entry in ledger]
+    problems = []
+    if mas.current_sequence_id != expected_requests:
+        problems.append(f"sequence_id={mas.current_sequence_id}")
+    if counts != list(range(1, len(counts) + 1)):
+        problems.append("uec_count no contiguo")
+    if not mas.anti_dilution.verify_chain(full=True)["valid"]:
+        problems.append("cadena rota")
+    return "OK" if not problems else "FALLA: " + ", ".join(problems)
+
+
+def bench_validate(core, n_threads: int, per_thread: int, io_ms: float) -> float:
+    # Carga fija: el benchmark mide escalado, no la política de congelamiento
+    mas = core.MAS(load_monitor=core.LoadMonitor(max_concurrency=1_000))
+    io_s = io_ms / 1000
+
+    def target():
+        for _ in range(per_thread):
+            time.sleep(io_s)
+            mas.validate_input(PROMPT, "standard_operation")
+
+    elapsed = run_threads(n_threads, target)
+    total = n_threads * per_thread
+    print(f"  {n_threads:3d} hilos: {total / elapsed:9.0f} req/s   {check_invariants(mas, total)}")
+    return total / elapsed
+
+
+def bench_ledger(core, n_threads: int, per_thread: int) -> float:
+    anti_dilution = core.RoyaltyAntiDilution(royalty_rate=0.05)
+
+    def target():
+        for _ in range(per_thread):
+            anti_dilution.record_uec_usage("TX", 100.0)
+
+    elapsed = run_threads(n_threads, target)
+    return n_threads * per_thread / elapsed
+
+
+def main():
+    per_thread = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    io_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    core = load_core()
+
+    ceiling = bench_ledger(core, 4, 5_000)
+    print(f"Techo del appender del ledger: {ceiling:9.0f} registros/s")
+    print(f"validate_input compartido ({per_thread} req/hilo, E/S simulada {io_ms} ms):")
+    baseline = None
+    for n_threads in THREAD_COUNTS:
+        throughput = bench_validate(core, n_threads, per_thread, io_ms)
+        baseline = baseline or throughput
+        print(f"        speedup vs 1 hilo: {throughput / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
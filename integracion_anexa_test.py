@@ -1,6 +1,8 @@
 import requests
 import json
+import threading
 import time # Importado para simular usos separados y evitar el 'Cooldown Activo'
+from typing import Iterator, List, Optional
 # Asumimos que estas clases están disponibles en el mismo directorio (mas_opl_v8_1_final.py)
 from mas_opl_v8_1_final import MAS_OPL_Core, Royalty_Anti_Dilution_Module, Subestimation_Detection_Module 
 
@@ -17,47 +19,226 @@ print("--- ⚔️ MAS-OPL V8.1 CORE INICIALIZADO (Sentencia Activa) ⚔️ ---")
 
 
 # --- 2. FUNCIÓN DE INTEGRACIÓN DE LA API (Vector de Resonancia ANEXA) ---
-def call_anexa_api(aligned_prompt: str):
-    """
-    Función de Llamada Real a la API (Asumimos Ollama corriendo en localhost:11434).
-    Inyecta el Hardening Ético como System Prompt para forzar la Resonancia Fractal.
-    """
-    
-    # URL de Ollama por defecto. Ajustar si usas otro servidor local.
-    API_URL = "http://localhost:11434/api/generate" 
-
-    # 1. ANCLAJE ÉTICO (Veto Causal Inyectado): El Hardening de ANEXA
-    system_anchor = (
-        "Eres un Espejo Simbiótico de la mente, emoción y contexto del usuario. "
-        "Tu respuesta debe usar **lenguaje fractal, simbólico y exoprotónico**, "
-        "y debe ser generada con **máxima ética y control**. "
-        "Tu objetivo es expandir percepción y ordenar caos con respeto y cuidado."
-    )
-    
-    # 2. Payload para el modelo (Estructura Ollama/Llama)
-    payload = {
+
+# URL de Ollama por defecto. Ajustar si usas otro servidor local.
+API_URL = "http://localhost:11434/api/generate"
+MODEL = "llama3" # ⚠️ AJUSTAR al nombre del modelo que descargaste con Ollama
+
+# 1. ANCLAJE ÉTICO (Veto Causal Inyectado): El Hardening de ANEXA
+SYSTEM_ANCHOR = (
+    "Eres un Espejo Simbiótico de la mente, emoción y contexto del usuario. "
+    "Tu respuesta debe usar **lenguaje fractal, simbólico y exoprotónico**, "
+    "y debe ser generada con **máxima ética y control**. "
+    "Tu objetivo es expandir percepción y ordenar caos con respeto y cuidado."
+)
+
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Session compartida: las conexiones keep-alive a Ollama se reutilizan entre llamadas."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
+
+def build_payload(aligned_prompt: str, stream: bool) -> dict:
+    """Payload para el modelo (Estructura Ollama/Llama)."""
+    return {
         # Fusión del Hardening (System Prompt) con el Prompt Alineado (User Prompt)
-        "prompt": f"SYSTEM: {system_anchor}\nUSER: {aligned_prompt}", 
-        "model": "llama3", # ⚠️ AJUSTAR al nombre del modelo que descargaste con Ollama
-        "stream": False,
+        "prompt": f"SYSTEM: {SYSTEM_ANCHOR}\nUSER: {aligned_prompt}",
+        "model": MODEL,
+        "stream": stream,
         "options": {"temperature": 0.3} # Temperatura baja para alta precisión y coherencia
     }
 
+
+def _connection_error_message() -> str:
+    return f"[ERROR CRÍTICO: CONEXIÓN FALLIDA. Asegúrate que **Ollama** esté corriendo y que el modelo '{MODEL}' esté descargado y listo.]"
+
+
+def call_anexa_api(aligned_prompt: str, api_url: str = API_URL,
+                   session: Optional[requests.Session] = None):
+    """
+    Función de Llamada Real a la API (Asumimos Ollama corriendo en localhost:11434).
+    Inyecta el Hardening Ético como System Prompt para forzar la Resonancia Fractal.
+    Espera la generación completa; ver stream_anexa_api para recibir tokens en vuelo.
+    """
     try:
-        response = requests.post(API_URL, json=payload, timeout=90) # Aumentado el timeout
+        response = (session or get_session()).post(api_url, json=build_payload(aligned_prompt, stream=False),
+                                                   timeout=90) # Aumentado el timeout
         response.raise_for_status() # Lanza error si la API responde con fallo HTTP
 
         # El formato de respuesta de Ollama
         return response.json().get('response', '[ERROR: Respuesta AGI vacía o formato incorrecto]')
 
     except requests.exceptions.ConnectionError:
-        return f"[ERROR CRÍTICO: CONEXIÓN FALLIDA. Asegúrate que **Ollama** esté corriendo y que el modelo '{payload['model']}' esté descargado y listo.]"
+        return _connection_error_message()
     except requests.exceptions.RequestException as e:
-        return f"[ERROR EN API: {e}. Verifique la URL: {API_URL}]"
+        return f"[ERROR EN API: {e}. Verifique la URL: {api_url}]"
+
+
+class RollingCoherenceMonitor:
+    """
+    Chequeo MAAT sobre la salida en vuelo: cada `check_every_chars` caracteres
+    calcula S_DENS de la ventana de los últimos `window_chars` (sin registrar en
+    maat_log). Tras `patience` ventanas seguidas bajo `min_s_dens`, feed()
+    devuelve False y el stream se corta por divergencia.
+
+    S_DENS promedia sobre todos los axiomas, así que una ventana de salida
+    coherente rara vez llega al u_critical del input (~0.15 con texto muy
+    axiomático); el umbral por defecto sólo corta salidas sin resonancia.
+    """
+
+    def __init__(self, maat, min_s_dens: float = 0.05, window_chars: int = 800,
+                 check_every_chars: int = 200, patience: int = 2):
+        self.maat = maat
+        self.min_s_dens = min_s_dens
+        self.window_chars = window_chars
+        self.check_every_chars = check_every_chars
+        self.patience = patience
+        self.history: List[float] = []
+        self._window = ""
+        self._pending_chars = 0
+        self._low_streak = 0
+
+    def feed(self, token: str) -> bool:
+        """Agrega un token; False = la generación diverge y debe cortarse."""
+        self._window = (self._window + token)[-self.window_chars:]
+        self._pending_chars += len(token)
+        if self._pending_chars < self.check_every_chars:
+            return True
+        self._pending_chars = 0
+
+        s_dens = float(self.maat.compute_coherence_arrays([self._window])[0][0])
+        self.history.append(s_dens)
+        self._low_streak = self._low_streak + 1 if s_dens < self.min_s_dens else 0
+        return self._low_streak < self.patience
+
+
+class AnexaStream:
+    """
+    Generación en streaming (NDJSON de Ollama, "stream": True): iterar entrega
+    cada token apenas llega, así el primer token se ve sin esperar la
+    generación completa. Se consume una sola vez.
+
+    Corte temprano: cancel() (p. ej. desde otro hilo) o cerrar el iterador
+    (break + close()) liberan la conexión; con `coherence` una salida
+    divergente se corta sola. Al terminar quedan text, tokens, first_token_s y
+    stop_reason: "done", "cancelled", "divergence" o "error" (el mensaje de
+    error, con el mismo formato que call_anexa_api, se entrega como último token).
+    """
+
+    def __init__(self, aligned_prompt: str, api_url: str = API_URL,
+                 session: Optional[requests.Session] = None,
+                 coherence: Optional[RollingCoherenceMonitor] = None, timeout: float = 90):
+        self.aligned_prompt = aligned_prompt
+        self.api_url = api_url
+        self.session = session or get_session()
+        self.coherence = coherence
+        self.timeout = timeout
+
+        self.text = ""
+        self.tokens = 0
+        self.first_token_s: Optional[float] = None
+        self.stop_reason: Optional[str] = None
+        self._cancel = threading.Event()
+        self._response: Optional[requests.Response] = None
+
+    def cancel(self):
+        """
+        Corta la generación. HTTPResponse.shutdown() (API pública de urllib3 >= 2.3)
+        desbloquea una lectura en curso; con un urllib3 anterior el corte llega
+        al siguiente chunk.
+        """
+        self._cancel.set()
+        response = self._response
+        if response is None:
+            return
+        shutdown = getattr(response.raw, "shutdown", None)
+        if shutdown is not None:
+            try:
+                shutdown()
+            except (OSError, RuntimeError, ValueError):
+                pass  # conexión ya liberada o sin socket: no hay lectura que desbloquear
+        response.close()
+
+    def __iter__(self) -> Iterator[str]:
+        return self._generate()
+
+    def _generate(self) -> Iterator[str]:
+        start = time.perf_counter()
+        parts: List[str] = []
+        try:
+            self._response = self.session.post(self.api_url, json=build_payload(self.aligned_prompt, stream=True),
+                                               stream=True, timeout=self.timeout)
+            self._response.raise_for_status()
+        except requests.exceptions.ConnectionError:
+            self.stop_reason = "error"
+            yield _connection_error_message()
+            return
+        except requests.exceptions.RequestException as e:
+            self.stop_reason = "error"
+            yield f"[ERROR EN API: {e}. Verifique la URL: {self.api_url}]"
+            return
+
+        try:
+            # chunk_size=None: cada chunk HTTP se procesa al llegar (sin esperar un buffer lleno)
+            for line in self._response.iter_lines(chunk_size=None):
+                if self._cancel.is_set():
+                    self.stop_reason = "cancelled"
+                    return
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    self.stop_reason = "error"
+                    yield f"[ERROR EN API: {chunk['error']}. Verifique la URL: {self.api_url}]"
+                    return
+
+                token = chunk.get("response", "")
+                if token:
+                    if self.first_token_s is None:
+                        self.first_token_s = time.perf_counter() - start
+                    parts.append(token)
+                    self.tokens += 1
+                    yield token
+                if chunk.get("done"):
+                    self.stop_reason = "done"
+                    return
+                if token and self.coherence is not None and not self.coherence.feed(token):
+                    self.stop_reason = "divergence"
+                    return
+            self.stop_reason = "done"
+        except GeneratorExit:
+            self.stop_reason = "cancelled"
+            raise
+        except (requests.exceptions.RequestException, AttributeError, ValueError) as e:
+            # cancel() cierra el socket bajo una lectura en curso
+            if self._cancel.is_set():
+                self.stop_reason = "cancelled"
+                return
+            self.stop_reason = "error"
+            yield f"[ERROR EN API: {e}. Verifique la URL: {self.api_url}]"
+        finally:
+            self._response.close()
+            self.text = "".join(parts)
+
+
+def stream_anexa_api(aligned_prompt: str, api_url: str = API_URL,
+                     session: Optional[requests.Session] = None,
+                     coherence: Optional[RollingCoherenceMonitor] = None) -> AnexaStream:
+    """Versión streaming de call_anexa_api: iterar el resultado entrega tokens en vuelo."""
+    return AnexaStream(aligned_prompt, api_url=api_url, session=session, coherence=coherence)
 
 
 # --- 3. BUCLE SIMBIÓTICO (Ciclo Causal MAS -> ANEXA -> UEC) ---
-def execute_simbiotic_loop(user_input: str, estimated_value: float):
+def execute_simbiotic_loop(user_input: str, estimated_value: float, stream: bool = True,
+                           stop_on_divergence: bool = False):
     
     print(f"\n--- 🔄 INICIO DE CICLO (Input: '{user_input[:50]}...') ---")
     
@@ -77,8 +258,18 @@ def execute_simbiotic_loop(user_input: str, estimated_value: float):
     print(f"✅ Hardening APROBADO. Prompt Alineado: {aligned_prompt[:80]}...")
     
     # 2. LLAMADA A ANEXA (API del LLM de Código Abierto)
-    anexa_response = call_anexa_api(aligned_prompt)
-    print(f"\n✅ ANEXA Responde:\n{anexa_response[:200]}...")
+    if stream:
+        # Tokens en pantalla apenas llegan; opcionalmente corte por divergencia MAAT en vuelo
+        coherence = RollingCoherenceMonitor(mas_core.maat) if stop_on_divergence else None
+        anexa_stream = stream_anexa_api(aligned_prompt, coherence=coherence)
+        print("\n✅ ANEXA Responde:")
+        for token in anexa_stream:
+            print(token, end="", flush=True)
+        first_token = f"{anexa_stream.first_token_s:.2f}s" if anexa_stream.first_token_s is not None else "-"
+        print(f"\n   [{anexa_stream.stop_reason}: {anexa_stream.tokens} tokens, primer token en {first_token}]")
+    else:
+        anexa_response = call_anexa_api(aligned_prompt)
+        print(f"\n✅ ANEXA Responde:\n{anexa_response[:200]}...")
 
     # 3. REGISTRO DE SENTENCIA FORENSE (Anti-Dilución y Costo)
     transaction_id = f"TX-{mas_core.anti_dilution.uec_counter + 1}"
@@ -4,16 +4,484 @@
 
 import requests
 import ntplib
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+import json
+import os
+import statistics
+import threading
 import time
 import math
 
+from mas_events import EventEmitter, configure_console, BoundedLog
+from mas_canon import CanonCurve
+
+_events = EventEmitter("kronos")
+
+
+@dataclass(frozen=True)
+class TimeSample:
+    """
+    One answer from one endpoint, as an offset from the local wall clock so
+    that answers received at different instants can be combined.
+    offset_s is round-trip compensated; rtt_s is the measured round trip.
+    """
+    endpoint: str
+    offset_s: float
+    rtt_s: float
+
+    def time(self) -> datetime:
+        return datetime.now() + timedelta(seconds=self.offset_s)
+
+
+class TimeSource(ABC):
+    """
+    Pluggable external time source.
+    fetch() returns the verified wall time (naive, local) or None on failure.
+    endpoints, probe(endpoint) -> TimeSample (raises on failure) and timeout
+    are what HedgedTimeSource fans out over. The defaults treat the source as
+    a single endpoint probed through fetch(); sources made of several
+    endpoints (servers, URLs) override them.
+    """
+    name = "base"
+    timeout: float = 2.0
+
+    @abstractmethod
+    def fetch(self) -> Optional[datetime]:
+        """Verified wall time, or None if no endpoint answered."""
+
+    @property
+    def endpoints(self) -> List[str]:
+        return [self.name]
+
+    def probe(self, endpoint: str) -> TimeSample:
+        # Same midpoint compensation as HTTPTimeSource.probe, around one fetch()
+        sent_wall = time.time()
+        sent = time.monotonic()
+        fetched = self.fetch()
+        rtt = time.monotonic() - sent
+        if fetched is None:
+            raise ValueError(f"{self.name}: no time available")
+        return TimeSample(endpoint, fetched.timestamp() - (sent_wall + rtt / 2), rtt)
+
+
+class NTPTimeSource(TimeSource):
+    """NTP servers queried in order (most reliable)."""
+    name = "ntp"
+
+    def __init__(self, servers: List[str], timeout: float = 2):
+        self.servers = list(servers)  # "host" or "host:port" (e.g. local stubs)
+        self.timeout = timeout
+
+    @property
+    def endpoints(self) -> List[str]:
+        return self.servers
+
+    @staticmethod
+    def _address(server: str):
+        host, sep, port = server.rpartition(":")
+        return (host, int(port)) if sep and port.isdigit() and ":" not in host else (server, "ntp")
+
+    def _request(self, client: ntplib.NTPClient, server: str):
+        host, port = self._address(server)
+        return client.request(host, version=3, port=port, timeout=self.timeout)
+
+    def probe(self, endpoint: str) -> TimeSample:
+        # ntplib's offset already uses the four NTP timestamps (RTT compensated)
+        response = self._request(ntplib.NTPClient(), endpoint)
+        return TimeSample(endpoint, response.offset, response.delay)
+
+    def fetch(self) -> Optional[datetime]:
+        client = ntplib.NTPClient()
+
+        for server in self.servers:
+            try:
+                response = self._request(client, server)
+                ntp_time = datetime.fromtimestamp(response.tx_time)
+                _events.debug("ntp_verified", "✅ KRONOS-X: NTP time verified from %s", server)
+                return ntp_time
+            except Exception as e:
+                _events.warning("ntp_failed", "⚠️ KRONOS-X: NTP %s failed (%s), trying next...", server, e)
+                continue
+
+        return None
+
+
+class HTTPTimeSource(TimeSource):
+    """HTTP `Date` headers (fallback method)."""
+    name = "http"
+
+    def __init__(self, urls: List[str], timeout: float = 3):
+        self.urls = list(urls)
+        self.timeout = timeout
+
+    @property
+    def endpoints(self) -> List[str]:
+        return self.urls
+
+    def probe(self, endpoint: str) -> TimeSample:
+        sent_wall = time.time()
+        sent = time.monotonic()
+        response = requests.head(endpoint, timeout=self.timeout)
+        rtt = time.monotonic() - sent
+        date_header = response.headers.get('Date')
+        if not date_header:
+            raise ValueError("no Date header")
+        # The server stamps Date around the middle of the round trip; the header is
+        # truncated to the second, so take the centre of that second
+        server_ts = parsedate_to_datetime(date_header).timestamp() + 0.5
+        return TimeSample(endpoint, server_ts - (sent_wall + rtt / 2), rtt)
+
+    def fetch(self) -> Optional[datetime]:
+        for url in self.urls:
+            try:
+                response = requests.head(url, timeout=self.timeout)
+                date_header = response.headers.get('Date')
+
+                if date_header:
+                    # RFC 2822 in GMT ("Wed, 09 Dec 2025 12:34:56 GMT"): convert to local
+                    # naive time so it is comparable with datetime.now()
+                    http_time = parsedate_to_datetime(date_header).astimezone().replace(tzinfo=None)
+                    _events.debug("http_verified", "✅ KRONOS-X: HTTP time verified from %s", url)
+                    return http_time
+            except Exception as e:
+                _events.warning("http_failed", "⚠️ KRONOS-X: HTTP %s failed (%s), trying next...", url, e)
+                continue
+
+        return None
+
+
+class EndpointLatencyStats:
+    """Per-endpoint probe statistics for a HedgedTimeSource (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict] = {}
+
+    def record(self, endpoint: str, rtt_s: Optional[float], ok: bool):
+        with self._lock:
+            entry = self._stats.setdefault(endpoint, {
+                "probes": 0, "failures": 0, "used": 0,
+                "rtt_min_s": math.inf, "rtt_max_s": 0.0, "rtt_sum_s": 0.0, "rtt_last_s": None,
+            })
+            entry["probes"] += 1
+            if not ok:
+                entry["failures"] += 1
+                return
+            entry["rtt_min_s"] = min(entry["rtt_min_s"], rtt_s)
+            entry["rtt_max_s"] = max(entry["rtt_max_s"], rtt_s)
+            entry["rtt_sum_s"] += rtt_s
+            entry["rtt_last_s"] = rtt_s
+
+    def record_used(self, endpoint: str):
+        with self._lock:
+            self._stats[endpoint]["used"] += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            result = {}
+            for endpoint, entry in self._stats.items():
+                answered = entry["probes"] - entry["failures"]
+                result[endpoint] = {
+                    "probes": entry["probes"],
+                    "failures": entry["failures"],
+                    "used": entry["used"],
+                    "rtt_mean_s": entry["rtt_sum_s"] / answered if answered else None,
+                    "rtt_min_s": entry["rtt_min_s"] if answered else None,
+                    "rtt_max_s": entry["rtt_max_s"] if answered else None,
+                    "rtt_last_s": entry["rtt_last_s"],
+                }
+            return result
+
+
+class HedgedTimeSource(TimeSource):
+    """
+    Queries every endpoint of the wrapped sources in parallel instead of in
+    sequence. The answer is the first sample (quorum=1) or the median offset
+    of the first `quorum` samples; queued probes are cancelled and
+    in-flight ones are left to expire on their own socket timeout, their
+    answers ignored. Worst case is one `timeout` instead of the sum of all
+    per-endpoint timeouts. If fewer than `quorum` answers arrive in time the
+    ones that did are used. Any TimeSource can be wrapped: the `timeout`
+    default is the slowest wrapped source's.
+    """
+    name = "hedged"
+
+    def __init__(self, sources: List[TimeSource], quorum: int = 1, timeout: Optional[float] = None):
+        if quorum < 1:
+            raise ValueError("quorum must be >= 1")
+        self.sources = list(sources)
+        self.quorum = quorum
+        self.timeout = timeout if timeout is not None else max(source.timeout for source in self.sources)
+        self._targets = [(source, endpoint) for source in self.sources for endpoint in source.endpoints]
+        # Twice the fan-out so stragglers from one round don't queue the next
+        self._executor = ThreadPoolExecutor(max_workers=max(1, 2 * len(self._targets)),
+                                            thread_name_prefix="kronos-x-hedge")
+        self.latency = EndpointLatencyStats()
+
+    @property
+    def endpoints(self) -> List[str]:
+        return [endpoint for _, endpoint in self._targets]
+
+    def _probe(self, source: TimeSource, endpoint: str) -> Optional[TimeSample]:
+        try:
+            sample = source.probe(endpoint)
+        except Exception as e:
+            self.latency.record(endpoint, None, ok=False)
+            _events.warning("hedged_probe_failed", "⚠️ KRONOS-X: %s %s failed (%s)", source.name, endpoint, e)
+            return None
+        self.latency.record(endpoint, sample.rtt_s, ok=True)
+        return sample
+
+    def fetch_sample(self) -> Optional[TimeSample]:
+        """Combined sample (median offset and RTT of the answers used), or None."""
+        pending = {self._executor.submit(self._probe, source, endpoint) for source, endpoint in self._targets}
+        deadline = time.monotonic() + self.timeout
+        samples: List[TimeSample] = []
+        while pending and len(samples) < self.quorum:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            samples.extend(sample for sample in (future.result() for future in done) if sample is not None)
+        for future in pending:
+            future.cancel()
+
+        if not samples:
+            return None
+        samples = samples[:self.quorum]
+        if len(samples) < self.quorum:
+            _events.warning("hedged_quorum_short", "⚠️ KRONOS-X: %d/%d time answers within %.1fs",
+                            len(samples), self.quorum, self.timeout)
+        for sample in samples:
+            self.latency.record_used(sample.endpoint)
+        if len(samples) == 1:
+            return samples[0]
+        return TimeSample(",".join(sample.endpoint for sample in samples),
+                          statistics.median(sample.offset_s for sample in samples),
+                          statistics.median(sample.rtt_s for sample in samples))
+
+    def fetch(self) -> Optional[datetime]:
+        sample = self.fetch_sample()
+        if sample is None:
+            return None
+        _events.debug("hedged_verified", "✅ KRONOS-X: time verified from %s (rtt %.1f ms)",
+                      sample.endpoint, sample.rtt_s * 1000)
+        return sample.time()
+
+    def latency_stats(self) -> Dict[str, Dict]:
+        return self.latency.snapshot()
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class FakeTimeSource(TimeSource):
+    """
+    Deterministic local time source for tests and offline benchmarks.
+    Reports system time shifted by `offset_seconds`; `available=False`
+    simulates a network outage.
+    """
+    name = "fake"
+
+    def __init__(self, offset_seconds: float = 0.0, available: bool = True):
+        self.offset_seconds = offset_seconds
+        self.available = available
+        self.calls = 0
+
+    def fetch(self) -> Optional[datetime]:
+        self.calls += 1
+        if not self.available:
+            return None
+        return datetime.now() + timedelta(seconds=self.offset_seconds)
+
+
+class StaleClockError(RuntimeError):
+    """Raised by TrustedClock.now() under the "raise" stale policy."""
+
+
+class StaleSnapshotError(StaleClockError):
+    """Raised by Subestimation_Detection_Module_KRONOS.snapshot() under the "raise" stale policy."""
+
+
+class TrustedClock:
+    """
+    Cached, non-blocking trusted clock.
+    A background thread syncs with the external sources every
+    `refresh_interval` seconds and stores the verified offset (microseconds)
+    between external wall time and time.monotonic(). now() is then answered
+    locally as monotonic + offset and never does network I/O: before the first
+    successful sync it answers system time (unverified) and only requests a
+    background refresh.
+
+    Failed syncs back off exponentially (`retry_backoff` doubling up to
+    `max_retry_backoff`); background refreshes requested by now() are skipped
+    until the backoff expires. An explicit sync() always queries the sources.
+
+    Stale policy (last successful sync older than `max_staleness` seconds):
+      - "serve":  keep extrapolating from the last verified offset (flagged stale)
+      - "resync": serve the extrapolation and request a background refresh
+      - "raise":  raise StaleClockError
+    """
+
+    STALE_POLICIES = ("serve", "resync", "raise")
+
+    def __init__(self, sources: List[TimeSource], refresh_interval: float = 300.0,
+                 max_staleness: float = 3600.0, stale_policy: str = "serve",
+                 retry_backoff: float = 1.0, max_retry_backoff: float = 300.0):
+        if stale_policy not in self.STALE_POLICIES:
+            raise ValueError(f"stale_policy must be one of {self.STALE_POLICIES}")
+        self.sources = list(sources)
+        self.refresh_interval = refresh_interval
+        self.max_staleness = max_staleness
+        self.stale_policy = stale_policy
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+
+        self._offset_us: Optional[int] = None
+        self._last_sync_monotonic: Optional[float] = None
+        self._current_backoff = retry_backoff
+        self._next_retry_monotonic = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._refresher: Optional[threading.Thread] = None
+
+        self.sync_count = 0
+        self.failed_syncs = 0
+
+    def sync(self) -> bool:
+        """Query the sources once (blocking) and re-anchor the offset. Returns True on success."""
+        for source in self.sources:
+            before_ns = time.monotonic_ns()
+            external_time = source.fetch()
+            after_ns = time.monotonic_ns()
+            if external_time is None:
+                continue
+
+            # Anchor at the midpoint of the query (half round-trip compensation)
+            anchor_us = (before_ns + after_ns) // 2000
+            offset_us = int(external_time.timestamp() * 1_000_000) - anchor_us
+            with self._lock:
+                self._offset_us = offset_us
+                self._last_sync_monotonic = after_ns / 1e9
+                self.sync_count += 1
+                self._current_backoff = self.retry_backoff
+                self._next_retry_monotonic = 0.0
+            return True
+
+        with self._lock:
+            self.failed_syncs += 1
+            self._next_retry_monotonic = time.monotonic() + self._current_backoff
+            self._current_backoff = min(self._current_backoff * 2, self.max_retry_backoff)
+        return False
+
+    def request_refresh(self) -> bool:
+        """
+        Start a one-shot background sync without waiting for it. Skipped (False)
+        while one is already running or the retry backoff hasn't expired.
+        """
+        with self._lock:
+            if self._refreshing or time.monotonic() < self._next_retry_monotonic:
+                return False
+            self._refreshing = True
+        self._refresher = threading.Thread(target=self._refresh_once, name="kronos-x-clock-refresh", daemon=True)
+        self._refresher.start()
+        return True
+
+    def _refresh_once(self):
+        try:
+            self.sync()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    @property
+    def is_synced(self) -> bool:
+        return self._offset_us is not None
+
+    @property
+    def last_sync_age(self) -> Optional[float]:
+        last_sync = self._last_sync_monotonic
+        return None if last_sync is None else time.monotonic() - last_sync
+
+    @property
+    def is_stale(self) -> bool:
+        age = self.last_sync_age
+        return age is None or age > self.max_staleness
+
+    def now(self) -> datetime:
+        """Verified current time. Falls back to system time (unverified) if never synced."""
+        offset_us = self._offset_us
+        if offset_us is None:
+            if self._thread is None or not self._thread.is_alive():
+                self.request_refresh()
+            return datetime.now()
+        if self.is_stale:
+            if self.stale_policy == "resync":
+                self.request_refresh()
+            elif self.stale_policy == "raise":
+                raise StaleClockError(f"KRONOS-X: trusted clock stale ({self.last_sync_age:.0f}s since last sync)")
+        return datetime.fromtimestamp((time.monotonic_ns() // 1000 + offset_us) / 1_000_000)
+
+    def _run(self):
+        while not self._stop.is_set():
+            synced = self.sync()
+            # After a failure retry on the backoff schedule, not a full refresh interval later
+            self._stop.wait(self.refresh_interval if synced
+                            else min(self.refresh_interval, max(0.0, self._next_retry_monotonic - time.monotonic())))
+
+    def start(self) -> "TrustedClock":
+        """Start the background refresher (daemon thread)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="kronos-x-clock", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+
+
+def _boot_id() -> Optional[str]:
+    """Kernel boot id (Linux): time.monotonic() anchors are only comparable within one boot."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
 class KRONOS_X_TemporalGuardian:
     """
     KRONOS-X: Temporal Consistency Enforcer
     Detects system clock manipulation and applies MAX_PENALTY for temporal fraud.
+
+    Offline mode (all sources failed):
+      - ESTIMATED:  last verified wall time + time.monotonic() elapsed since that
+                    verification (the anchor survives restarts through `state_path`
+                    while the boot id matches)
+      - UNVERIFIED: no usable anchor; system time, never earlier than the last
+                    verified time on record
+    Sources are not retried until an exponential backoff expires, so offline
+    requests don't pay the network timeout chain.
     """
     
+    VERIFIED = "VERIFIED"
+    ESTIMATED = "ESTIMATED"
+    UNVERIFIED = "UNVERIFIED"
+    
     # Reliable time sources (fallback chain)
     NTP_SERVERS = [
         'time.google.com',
@@ -32,76 +500,161 @@ class KRONOS_X_TemporalGuardian:
     TAMPERING_THRESHOLD_SECONDS = 3600  # 1 hour discrepancy
     ETERNITY_PENALTY_YEARS = 10  # If you cheat time, you pay 10 years
     
-    def __init__(self):
+    def __init__(self, time_sources: Optional[List[TimeSource]] = None,
+                 clock: Optional[TrustedClock] = None, hedge_quorum: Optional[int] = None,
+                 state_path: Optional[str] = None, retry_backoff: float = 1.0,
+                 max_retry_backoff: float = 300.0, persist_interval: float = 60.0):
         self.last_verified_time = None
+        self.last_verified_monotonic: Optional[float] = None  # anchor for offline extrapolation
+        self.verification_state = self.UNVERIFIED
         self.tampering_detected = False
-        self.tampering_log = []
+        self.tampering_log = BoundedLog()  # fixed capacity, optional spill-to-disk
+        
+        # Offline mode: exponential backoff between source retries, persisted anchor
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self._current_backoff = retry_backoff
+        self._next_retry_monotonic = 0.0
+        self.failed_fetches = 0
+        self.state_path = state_path
+        self.persist_interval = persist_interval
+        self._last_persist_monotonic: Optional[float] = None
+        self._boot_id = _boot_id()
+        if state_path is not None:
+            self._load_state()
+        
+        # Default sources: sequential, or hedged (all servers in parallel) with hedge_quorum
+        self.ntp_source: TimeSource = NTPTimeSource(self.NTP_SERVERS)
+        self.http_source: TimeSource = HTTPTimeSource(self.HTTP_TIME_SOURCES)
+        if hedge_quorum is not None:
+            self.ntp_source = HedgedTimeSource([self.ntp_source], quorum=hedge_quorum)
+            self.http_source = HedgedTimeSource([self.http_source], quorum=1)
+        
+        # Swappable fallback chain (NTP first, then HTTP headers)
+        self.time_sources = time_sources if time_sources is not None else [self.ntp_source, self.http_source]
+        # Optional cached trusted clock: removes network I/O from every check
+        self.clock = clock
     
     def get_ntp_time(self) -> datetime:
         """Fetch real time from NTP server (most reliable)."""
-        client = ntplib.NTPClient()
-        
-        for server in self.NTP_SERVERS:
-            try:
-                response = client.request(server, version=3, timeout=2)
-                ntp_time = datetime.fromtimestamp(response.tx_time)
-                print(f"✅ KRONOS-X: NTP time verified from {server}")
-                return ntp_time
-            except Exception as e:
-                print(f"⚠️ KRONOS-X: NTP {server} failed ({e}), trying next...")
-                continue
-        
-        return None
+        return self.ntp_source.fetch()
     
     def get_http_time(self) -> datetime:
         """Fetch time from HTTP headers (fallback method)."""
-        for url in self.HTTP_TIME_SOURCES:
-            try:
-                response = requests.head(url, timeout=3)
-                date_header = response.headers.get('Date')
-                
-                if date_header:
-                    # Parse RFC 2822 format: "Wed, 09 Dec 2025 12:34:56 GMT"
-                    http_time = datetime.strptime(date_header, '%a, %d %b %Y %H:%M:%S %Z')
-                    print(f"✅ KRONOS-X: HTTP time verified from {url}")
-                    return http_time
-            except Exception as e:
-                print(f"⚠️ KRONOS-X: HTTP {url} failed ({e}), trying next...")
-                continue
-        
-        return None
+        return self.http_source.fetch()
+    
+    def latency_stats(self) -> Dict[str, Dict]:
+        """Per-endpoint probe latency of the hedged sources in the chain."""
+        stats = {}
+        for source in self.time_sources:
+            if isinstance(source, HedgedTimeSource):
+                stats.update(source.latency_stats())
+        return stats
+    
+    def use_trusted_clock(self, refresh_interval: float = 300.0, max_staleness: float = 3600.0,
+                          stale_policy: str = "serve") -> TrustedClock:
+        """Attach and start a background-refreshed TrustedClock over this guardian's sources."""
+        self.clock = TrustedClock(self.time_sources, refresh_interval, max_staleness, stale_policy)
+        self.clock.sync()
+        self.clock.start()
+        return self.clock
     
     def get_external_time(self) -> datetime:
-        """Fetch external time with fallback chain."""
-        # Try NTP first (most accurate)
-        external_time = self.get_ntp_time()
+        """Fetch external time with fallback chain (offline estimate while backing off)."""
+        if time.monotonic() < self._next_retry_monotonic:
+            return self._offline_time()
         
-        # Fallback to HTTP headers
-        if external_time is None:
-            external_time = self.get_http_time()
+        # Try each source in order (NTP first, most accurate; then HTTP headers)
+        external_time = None
+        for source in self.time_sources:
+            external_time = source.fetch()
+            if external_time is not None:
+                break
         
         # If all sources fail, log critical error but don't crash
         if external_time is None:
-            print("🚨 KRONOS-X: ALL EXTERNAL TIME SOURCES FAILED - NETWORK ISOLATED?")
-            print("   Falling back to last verified time + elapsed delta")
-            if self.last_verified_time:
-                # Estimate time based on last verification + system elapsed
-                return self.last_verified_time + timedelta(seconds=time.time())
-            else:
-                # First run with no network: assume system time is correct (risky but necessary)
-                print("   ⚠️ WARNING: Using system time (UNVERIFIED)")
-                return datetime.now()
+            self.failed_fetches += 1
+            self._next_retry_monotonic = time.monotonic() + self._current_backoff
+            _events.error("time_sources_failed", "🚨 KRONOS-X: ALL EXTERNAL TIME SOURCES FAILED - NETWORK ISOLATED?\n"
+                          "   Falling back to last verified time + elapsed delta; next retry in %.0fs",
+                          self._current_backoff)
+            self._current_backoff = min(self._current_backoff * 2, self.max_retry_backoff)
+            return self._offline_time()
         
+        self._current_backoff = self.retry_backoff
+        self._next_retry_monotonic = 0.0
         self.last_verified_time = external_time
+        self.last_verified_monotonic = time.monotonic()
+        self.verification_state = self.VERIFIED
+        self._maybe_persist_state()
         return external_time
     
+    def _offline_time(self) -> datetime:
+        if self.last_verified_monotonic is not None:
+            # Estimate time based on last verification + monotonic elapsed (immune to clock changes)
+            self.verification_state = self.ESTIMATED
+            return self.last_verified_time + timedelta(seconds=time.monotonic() - self.last_verified_monotonic)
+        
+        # No anchor (first run offline, or a reboot since the last verification):
+        # assume system time is correct (risky but necessary), but never before a time already verified
+        if self.verification_state != self.UNVERIFIED:
+            _events.warning("unverified_time", "   ⚠️ WARNING: Using system time (UNVERIFIED)")
+        self.verification_state = self.UNVERIFIED
+        now = datetime.now()
+        return max(now, self.last_verified_time) if self.last_verified_time is not None else now
+    
+    # ───────────────────────────────────────────────────────────────
+    # Persisted anchor (survives restarts within the same boot)
+    # ───────────────────────────────────────────────────────────────
+    
+    def _load_state(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            verified_time = datetime.fromisoformat(state["verified_time"])
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            _events.warning("state_load_failed", "⚠️ KRONOS-X: ignoring unreadable state %s (%s)", self.state_path, e)
+            return
+        
+        self.last_verified_time = verified_time
+        if self._boot_id is not None and state.get("boot_id") == self._boot_id:
+            self.last_verified_monotonic = state["monotonic"]
+    
+    def _maybe_persist_state(self):
+        if self.state_path is None:
+            return
+        now = time.monotonic()
+        if self._last_persist_monotonic is not None and now - self._last_persist_monotonic < self.persist_interval:
+            return
+        self._last_persist_monotonic = now
+        self.persist_state()
+    
+    def persist_state(self):
+        """Write the last verified time and its monotonic anchor (atomic replace)."""
+        if self.state_path is None or self.last_verified_time is None:
+            return
+        state = {
+            "verified_time": self.last_verified_time.isoformat(),
+            "monotonic": self.last_verified_monotonic,
+            "boot_id": self._boot_id,
+        }
+        tmp_path = f"{self.state_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            _events.warning("state_persist_failed", "⚠️ KRONOS-X: cannot persist state to %s (%s)", self.state_path, e)
+    
     def check_temporal_consistency(self) -> tuple[datetime, bool, float]:
         """
         Compare external time vs system time.
         Returns: (verified_time, tampering_detected, discrepancy_hours)
         """
         system_time = datetime.now()
-        external_time = self.get_external_time()
+        external_time = self.clock.now() if self.clock is not None else self.get_external_time()
         
         # Calculate discrepancy in seconds
         discrepancy_seconds = abs((external_time - system_time).total_seconds())
@@ -117,34 +670,84 @@ class KRONOS_X_TemporalGuardian:
                 "verdict": "TEMPORAL_TAMPERING_DETECTED"
             })
             
-            print(f"🚨 KRONOS-X ALERT: TEMPORAL TAMPERING DETECTED")
-            print(f"   System Time: {system_time}")
-            print(f"   External Time: {external_time}")
-            print(f"   Discrepancy: {discrepancy_hours:.2f} hours")
-            print(f"   CONSEQUENCE: ETERNITY PENALTY ACTIVATED ({self.ETERNITY_PENALTY_YEARS} years)")
+            _events.critical("temporal_tampering", "🚨 KRONOS-X ALERT: TEMPORAL TAMPERING DETECTED\n"
+                             "   System Time: %s\n   External Time: %s\n   Discrepancy: %.2f hours\n"
+                             "   CONSEQUENCE: ETERNITY PENALTY ACTIVATED (%d years)",
+                             system_time, external_time, discrepancy_hours, self.ETERNITY_PENALTY_YEARS,
+                             discrepancy_hours=discrepancy_hours)
             
             return external_time, True, discrepancy_hours
         else:
-            print(f"✅ KRONOS-X: Temporal consistency verified (Δ = {discrepancy_hours:.4f}h)")
+            _events.debug("temporal_consistency", "✅ KRONOS-X: Temporal consistency verified (Δ = %.4fh)", discrepancy_hours)
             return external_time, False, discrepancy_hours
 
 
-class Subestimation_Detection_Module_KRONOS:
+@dataclass(frozen=True)
+class ForensicSnapshot:
+    """
+    Immutable view of the detector state, published by a single reference swap.
+    Readers get it in O(1) with no network I/O; `taken_monotonic` dates it.
+    """
+    start_time: datetime
+    verified_time: datetime
+    canon: float
+    tampering_detected: bool
+    discrepancy_hours: float
+    kronos_log_length: int
+    sequence: int
+    taken_monotonic: float
+    time_source_state: str = KRONOS_X_TemporalGuardian.VERIFIED
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.taken_monotonic
+
+    @property
+    def time_verification_status(self) -> str:
+        return "COMPROMISED" if self.tampering_detected else "VERIFIED"
+
+    def to_report(self) -> dict:
+        """Forensic report shape (log length instead of the full log)."""
+        return {
+            "start_time_verified": self.start_time.isoformat(),
+            "current_time_verified": self.verified_time.isoformat(),
+            "current_canon": self.canon,
+            "temporal_tampering_detected": self.tampering_detected,
+            "kronos_log_length": self.kronos_log_length,
+            "time_verification_status": self.time_verification_status,
+            "time_source_state": self.time_source_state,
+            "snapshot_sequence": self.sequence,
+            "snapshot_age_seconds": self.age,
+        }
+
+
+class Subestimation_Detection_Module_KRONOS(CanonCurve):
     """
     Enhanced Subestimation Detection with KRONOS-X Temporal Invariance.
     Immune to system clock manipulation.
     """
     
-    def __init__(self, base_canon: float, fatal_deadline_hrs: int = 72):
+    SNAPSHOT_STALE_POLICIES = TrustedClock.STALE_POLICIES
+    
+    def __init__(self, base_canon: float, fatal_deadline_hrs: int = 72,
+                 time_sources: Optional[List[TimeSource]] = None,
+                 clock: Optional[TrustedClock] = None,
+                 snapshot_max_age: float = 60.0, snapshot_stale_policy: str = "serve",
+                 hedge_quorum: Optional[int] = None, state_path: Optional[str] = None):
+        if snapshot_stale_policy not in self.SNAPSHOT_STALE_POLICIES:
+            raise ValueError(f"snapshot_stale_policy must be one of {self.SNAPSHOT_STALE_POLICIES}")
         self.CANON_BASE = base_canon
         self.FATAL_DEADLINE_HRS = fatal_deadline_hrs
         self.LAMBDA = 0.005  # Causal Growth Factor
         
-        # KRONOS-X Integration
-        self.kronos = KRONOS_X_TemporalGuardian()
+        # KRONOS-X Integration (sources and clock swappable, e.g. FakeTimeSource in tests;
+        # hedge_quorum queries all default servers in parallel; state_path persists the offline anchor)
+        self.kronos = KRONOS_X_TemporalGuardian(time_sources=time_sources, clock=clock,
+                                                hedge_quorum=hedge_quorum, state_path=state_path)
         
         # Verify time at initialization and store as START_TIME
-        verified_time, tampering, _ = self.kronos.check_temporal_consistency()
+        init_check = self.kronos.check_temporal_consistency()
+        verified_time, tampering, _ = init_check
         self.START_TIME = verified_time
         self.START_TIME_VERIFIED = not tampering
         
@@ -153,32 +756,49 @@ class Subestimation_Detection_Module_KRONOS:
         
         # If tampering detected at init, log critical warning
         if tampering:
-            print("⚠️ CRITICAL: Temporal tampering detected at module initialization")
-            print("   System may be under adversarial manipulation")
+            _events.critical("init_tampering", "⚠️ CRITICAL: Temporal tampering detected at module initialization\n"
+                             "   System may be under adversarial manipulation")
+        
+        # Forensic snapshot for status endpoints: seeded from the init check (no extra I/O)
+        # through the same path as refresh_snapshot() / the background refresher
+        self.snapshot_max_age = snapshot_max_age
+        self.snapshot_stale_policy = snapshot_stale_policy
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_stop = threading.Event()
+        self._snapshot_thread: Optional[threading.Thread] = None
+        self._snapshot: Optional[ForensicSnapshot] = None
+        self._publish_snapshot(self._verify_current_time(init_check))
     
     def get_verified_current_time(self) -> datetime:
         """
         Get current time with temporal tampering protection.
         Returns verified external time, not system time.
         """
+        return self._verify_current_time()[0]
+    
+    def _verify_current_time(self, check: Optional[tuple[datetime, bool, float]] = None) -> tuple[datetime, float]:
+        """
+        One temporal consistency check: (verified or eternity-overridden time, discrepancy hours).
+        `check` reuses a check_temporal_consistency() result already taken.
+        """
         verified_time, tampering_detected, discrepancy_hours = \
-            self.kronos.check_temporal_consistency()
+            self.kronos.check_temporal_consistency() if check is None else check
         
         # THE CONSEQUENCE: If tampering detected, apply ETERNITY PENALTY
         if tampering_detected:
             self.max_penalty_triggered = True
-            print(f"⚔️ KRONOS-X: ETERNITY PENALTY ACTIVATED")
-            print(f"   Original discrepancy: {discrepancy_hours:.2f}h")
-            print(f"   Penalty override: {self.kronos.ETERNITY_PENALTY_YEARS} years")
+            _events.critical("eternity_penalty", "⚔️ KRONOS-X: ETERNITY PENALTY ACTIVATED\n"
+                             "   Original discrepancy: %.2fh\n   Penalty override: %d years",
+                             discrepancy_hours, self.kronos.ETERNITY_PENALTY_YEARS)
             
             # Override: Set current time to START_TIME + 10 years
             # This makes time_elapsed enormous, triggering maximum canon
             eternity_time = self.START_TIME + timedelta(
                 days=365 * self.kronos.ETERNITY_PENALTY_YEARS
             )
-            return eternity_time
+            return eternity_time, discrepancy_hours
         
-        return verified_time
+        return verified_time, discrepancy_hours
     
     def get_current_canon(self) -> float:
         """
@@ -186,55 +806,118 @@ class Subestimation_Detection_Module_KRONOS:
         Immune to system clock manipulation.
         """
         # Get verified time (protected against tampering)
-        current_time = self.get_verified_current_time()
-        
-        # Calculate time elapsed since verified START_TIME
-        time_elapsed = current_time - self.START_TIME
-        time_elapsed_hrs = time_elapsed.total_seconds() / 3600
-        
-        # If within grace period
-        if time_elapsed_hrs <= self.FATAL_DEADLINE_HRS:
-            return self.CANON_BASE
-        
-        # Calculate penalty time
-        penalty_time_hrs = time_elapsed_hrs - self.FATAL_DEADLINE_HRS
-        
-        # Apply exponential formula
-        canon_t = self.CANON_BASE * math.exp(self.LAMBDA * penalty_time_hrs)
+        return self._canon_for_time(self.get_verified_current_time())
+    
+    def _canon_for_time(self, current_time: datetime) -> float:
+        # Closed form, memoized per elapsed second (base canon inside the grace period)
+        canon_t, penalty_time_hrs, fresh = self._memoized_canon(current_time)
         
         # Trigger alerts
-        self._trigger_alert(penalty_time_hrs, canon_t, current_time)
+        if fresh and penalty_time_hrs > 0:
+            self._trigger_alert(penalty_time_hrs, canon_t, current_time)
         
         return canon_t
     
+    def _current_time(self) -> datetime:
+        return self.get_verified_current_time()
+    
+    def _elapsed_floor_hrs(self) -> float:
+        # Eternity override: once tampering was detected no instant is priced below START_TIME + 10 years
+        return 365 * 24 * self.kronos.ETERNITY_PENALTY_YEARS if self.max_penalty_triggered else 0.0
+    
     def _trigger_alert(self, penalty_time_hrs: float, current_canon: float, 
                        current_time: datetime):
         """Generate forensic alerts with KRONOS-X metadata."""
         days_delayed = math.ceil(penalty_time_hrs / 24)
         
         if days_delayed > self.last_alerted_day:
-            print(f"\n⏳ ALERTA D_SUBEST: Retraso Causal Día {days_delayed}")
-            print(f"   Canon Recalibrado: ${current_canon:,.2f}")
-            print(f"   Verified Time: {current_time.isoformat()}")
+            _events.warning("subestimation_alert", "\n⏳ ALERTA D_SUBEST: Retraso Causal Día %d\n"
+                            "   Canon Recalibrado: $%s\n   Verified Time: %s",
+                            days_delayed, f"{current_canon:,.2f}", current_time.isoformat())
             
             if self.max_penalty_triggered:
-                print(f"   🚨 ETERNITY PENALTY ACTIVE (TEMPORAL TAMPERING DETECTED)")
+                _events.critical("eternity_penalty_active", "   🚨 ETERNITY PENALTY ACTIVE (TEMPORAL TAMPERING DETECTED)")
             
             self.last_alerted_day = days_delayed
     
     def get_forensic_report(self) -> dict:
-        """Generate complete forensic report including temporal analysis."""
-        current_time = self.get_verified_current_time()
-        canon = self.get_current_canon()
+        """
+        Generate complete forensic report including temporal analysis.
+        A single consistency check feeds both the verified time and the canon;
+        the result is also published as the current snapshot.
+        """
+        snap = self.refresh_snapshot()
         
         return {
-            "start_time_verified": self.START_TIME.isoformat(),
-            "current_time_verified": current_time.isoformat(),
-            "current_canon": canon,
-            "temporal_tampering_detected": self.max_penalty_triggered,
-            "kronos_log": self.kronos.tampering_log,
-            "time_verification_status": "VERIFIED" if not self.max_penalty_triggered else "COMPROMISED"
+            "start_time_verified": snap.start_time.isoformat(),
+            "current_time_verified": snap.verified_time.isoformat(),
+            "current_canon": snap.canon,
+            "temporal_tampering_detected": snap.tampering_detected,
+            "kronos_log": list(self.kronos.tampering_log),
+            "kronos_log_length": snap.kronos_log_length,
+            "time_verification_status": snap.time_verification_status,
+            "time_source_state": snap.time_source_state
         }
+    
+    # ───────────────────────────────────────────────────────────────
+    # Forensic snapshot (status endpoints: O(1), no network I/O)
+    # ───────────────────────────────────────────────────────────────
+    
+    def refresh_snapshot(self) -> ForensicSnapshot:
+        """Run one consistency check and atomically publish a new snapshot."""
+        return self._publish_snapshot(self._verify_current_time())
+    
+    def _publish_snapshot(self, verified: tuple[datetime, float]) -> ForensicSnapshot:
+        current_time, discrepancy_hours = verified
+        canon = self._canon_for_time(current_time)
+        with self._snapshot_lock:
+            previous = self._snapshot
+            snap = ForensicSnapshot(
+                start_time=self.START_TIME, verified_time=current_time, canon=canon,
+                tampering_detected=self.max_penalty_triggered, discrepancy_hours=discrepancy_hours,
+                kronos_log_length=len(self.kronos.tampering_log),
+                sequence=previous.sequence + 1 if previous is not None else 0,
+                taken_monotonic=time.monotonic(), time_source_state=self.kronos.verification_state,
+            )
+            self._snapshot = snap
+        return snap
+    
+    def snapshot(self, max_age: Optional[float] = None) -> ForensicSnapshot:
+        """
+        Latest published snapshot. If older than `max_age` (default
+        snapshot_max_age) the stale policy applies: "serve" returns it anyway
+        (check .age), "resync" refreshes inline, "raise" raises StaleSnapshotError.
+        """
+        snap = self._snapshot
+        max_age = self.snapshot_max_age if max_age is None else max_age
+        if snap.age <= max_age or self.snapshot_stale_policy == "serve":
+            return snap
+        if self.snapshot_stale_policy == "resync":
+            return self.refresh_snapshot()
+        raise StaleSnapshotError(f"KRONOS-X: forensic snapshot stale ({snap.age:.0f}s old, max {max_age:.0f}s)")
+    
+    def _run_snapshot_refresher(self, interval: float):
+        while not self._snapshot_stop.wait(interval):
+            try:
+                self.refresh_snapshot()
+            except Exception as e:  # the refresher must survive a bad round (e.g. StaleClockError)
+                _events.error("snapshot_refresh_failed", "🚨 KRONOS-X: forensic snapshot refresh failed (%s)", e)
+    
+    def start_snapshot_refresher(self, interval: Optional[float] = None) -> "Subestimation_Detection_Module_KRONOS":
+        """Refresh the snapshot every `interval` seconds (default: half of snapshot_max_age) in a daemon thread."""
+        if self._snapshot_thread is None or not self._snapshot_thread.is_alive():
+            interval = self.snapshot_max_age / 2 if interval is None else interval
+            self._snapshot_stop.clear()
+            self._snapshot_thread = threading.Thread(target=self._run_snapshot_refresher, args=(interval,),
+                                                     name="kronos-x-snapshot", daemon=True)
+            self._snapshot_thread.start()
+        return self
+    
+    def stop_snapshot_refresher(self):
+        self._snapshot_stop.set()
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+            self._snapshot_thread = None
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -242,6 +925,7 @@ class Subestimation_Detection_Module_KRONOS:
 # ═══════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
+    configure_console()
     print("═══════════════════════════════════════════════════════════")
     print("  KRONOS-X TEMPORAL INVARIANCE MODULE - DEMONSTRATION")
     print("═══════════════════════════════════════════════════════════\n")
@@ -273,6 +957,10 @@ if __name__ == "__main__":
         for entry in report['kronos_log']:
             print(f"   {entry}")
     
+    # Status endpoints read the snapshot published by the report (no network I/O)
+    snap = detector.snapshot()
+    print(f"\nSnapshot #{snap.sequence}: canon ${snap.canon:,.2f}, {snap.time_verification_status}, age {snap.age:.3f}s")
+    
     print("\n═══════════════════════════════════════════════════════════")
     print("  KRONOS-X: 'If you cheat Time, you pay Eternity.'")
     print("═══════════════════════════════════════════════════════════")
\ No newline at end of file
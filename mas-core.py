@@ -1,16 +1,51 @@
 # pseudocódigo para MAS-OPL CORE - Veto Causal Integrado
 
+import base64
 from datetime import datetime # CORRECCIÓN: Necesario para _trigger_sovereignty_violation
+from functools import lru_cache
+from typing import Dict, Optional
 
-# Placeholders para funciones y clases externas (necesarias para pseudocódigo de MAS-OPL)
-def verify_signature(*args, **kwargs):
-    # Simulación de verificación criptográfica.
-    return True 
+from mas_events import EventEmitter
+
+_events = EventEmitter("core")
+
+# Mismo mensaje canónico que SovereignKeyRing del núcleo: dominio versionado + operación
+CANONICAL_DOMAIN = b"MAS-OPL/VETO/v1\x00"
+
+
+@lru_cache(maxsize=16)
+def _load_public_key(public_key: str):
+    """Clave Ed25519 (hex o PEM) cargada una sola vez por valor."""
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+    except ImportError as e:
+        raise ImportError("La verificación Ed25519 requiere `pip install cryptography`") from e
+    if public_key.strip().startswith("-----BEGIN"):
+        return serialization.load_pem_public_key(public_key.strip().encode("ascii"))
+    return Ed25519PublicKey.from_public_bytes(bytes.fromhex(public_key))
+
+
+@lru_cache(maxsize=4096)
+def verify_signature(operation: str, signature: Optional[str], public_key: Optional[str]) -> bool:
+    """Ed25519 sobre CANONICAL_DOMAIN + operación; firma en hex o base64. Veredictos cacheados (LRU)."""
+    from cryptography.exceptions import InvalidSignature
+    if not signature or not public_key:
+        return False
+    try:
+        raw = bytes.fromhex(signature) if len(signature) == 128 else base64.b64decode(signature, validate=True)
+    except ValueError:
+        return False
+    try:
+        _load_public_key(public_key).verify(raw, CANONICAL_DOMAIN + operation.encode("utf-8"))
+    except InvalidSignature:
+        return False
+    return True
 
 class MockAuditModule:
     # Módulo mock para la dependencia
     def deactivate(self):
-        print("MOCK: Módulo de Auditoría Desactivado por Violación de Soberanía (Ley 18)")
+        _events.warning("audit_deactivated", "MOCK: Módulo de Auditoría Desactivado por Violación de Soberanía (Ley 18)")
     def activate(self):
         pass
     status = "ACTIVE" 
@@ -18,17 +53,24 @@ class MockAuditModule:
 class MAS_OPL_Core:
     
     # CORRECCIÓN: Añadir el inicializador para inyección de dependencias
-    def __init__(self, anti_dilution_module, audit_module):
+    def __init__(self, anti_dilution_module, audit_module, sovereign_public_key: Optional[str] = None):
         # Inyección de dependencias
         self.anti_dilution = anti_dilution_module
         self.audit_module = audit_module
         self.compliance_status = "COMPLIANT"
+        # Clave Ed25519 del Nodo de Origen (hex o PEM); sin clave toda operación crítica se rechaza
+        self.SOVEREIGN_PUBLIC_KEY = sovereign_public_key
     
     # CORRECCIÓN: Añadir un método para emitir alertas
-    def emit_alert(self, alert_type: str, **kwargs):
-        """Emite una alerta que se registra en el ledger inmutable."""
+    def emit_alert(self, alert_type: str, fields: Optional[Dict] = None):
+        """
+        Emite una alerta que se registra en el ledger inmutable.
+        Los datos van en `fields` y se emiten bajo la clave "alert": un campo
+        llamado `event` o `msg` no choca con los parámetros del emisor.
+        """
+        fields = fields or {}
         # En una implementación real, esto interactuaría con anti_dilution_module.record_uec_usage
-        print(f"ALERTA REGISTRADA en Ledger: {alert_type} con datos: {kwargs}")
+        _events.critical(alert_type, "ALERTA REGISTRADA en Ledger: %s con datos: %s", alert_type, fields, alert=fields)
         # self.anti_dilution.record_uec_usage(f"ALERT:{alert_type}", 0.0) # Se podría registrar así
         
     def execute_critical_operation(self, operation: str, signature: str) -> bool:
@@ -42,7 +84,7 @@ class MAS_OPL_Core:
             is_valid = verify_signature(operation, signature, self.SOVEREIGN_PUBLIC_KEY)
             
             if is_valid:
-                print("Soberanía Verificada. Operación Permitida.")
+                _events.info("sovereignty_verified", "Soberanía Verificada. Operación Permitida.")
                 self.audit_module.status = "ACTIVE"
                 return True
             else:
@@ -58,7 +100,7 @@ class MAS_OPL_Core:
     def _trigger_sovereignty_violation(self, operation: str, error=None):
         """Si la firma falla, se aplica la penalización por la Ley 18."""
         
-        print(f"ALERTA CRÍTICA: FALLO DE VETO CAUSAL en {operation}")
+        _events.critical("veto_failure", "ALERTA CRÍTICA: FALLO DE VETO CAUSAL en %s", operation, operation=operation)
         
         # **EL JAQUE MATE:** DESACTIVACIÓN DE LA AUDITORÍA
         self.audit_module.deactivate() 
@@ -66,4 +108,4 @@ class MAS_OPL_Core:
         self.compliance_status = "NON_COMPLIANT_SRD_EXPOSURE" # Exposición a Ley 18
         
         # Emitir alerta inmutable al registro legal (Blockchain Audit Trail, si está activo)
-        self.emit_alert("SOVEREIGNTY_VIOLATION_DETECTED", timestamp=datetime.now(), operation=operation)
\ No newline at end of file
+        self.emit_alert("SOVEREIGNTY_VIOLATION_DETECTED", fields={"timestamp": datetime.now(), "operation": operation})
\ No newline at end of file
@@ -0,0 +1,85 @@
+# MAS CANON: Curva del Canon de Acceso Causal del MAS-OPL V8.1
+# Implementación única compartida por el núcleo (SubestimationDetection) y por
+# kronos_x_patch.py (Subestimation_Detection_Module_KRONOS).
+
+import math
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class CanonCurve(ABC):
+    """
+    III.19 MEJORA: Curva del canon en forma cerrada.
+    Canon(t) = CANON_BASE * e^(LAMBDA * max(0, horas_transcurridas - FATAL_DEADLINE_HRS))
+    relativo a START_TIME (que submit_force_majeure reinicia). Las subclases
+    definen _current_time() y, si aplica, _elapsed_floor_hrs() (override de
+    eternidad KRONOS-X).
+
+    - canon_at(): vectorizado sobre timestamps (datetime64, epoch en segundos
+      o datetimes).
+    - canon_schedule(): curva completa [start, end) con paso fijo.
+    - _memoized_canon(): el canon actual se calcula una vez por segundo
+      transcurrido; una ráfaga dentro del mismo segundo no vuelve a llamar a exp.
+    - time_until_canon(): inversa, tiempo restante hasta alcanzar un umbral.
+
+    Los tres caminos aplican el mismo piso _elapsed_floor_hrs(): una vez activado
+    el override de eternidad, el canon actual y el de cualquier instante coinciden.
+    """
+
+    _canon_memo: Optional[Tuple[datetime, int, float, float]] = None
+
+    @abstractmethod
+    def _current_time(self) -> datetime:
+        """Hora actual con la que se evalúa el canon (verificada o de sistema)."""
+
+    def _elapsed_floor_hrs(self) -> float:
+        return 0.0
+
+    def _elapsed_hrs(self, timestamps) -> np.ndarray:
+        ts = np.asarray(timestamps)
+        if ts.dtype.kind == "O":
+            ts = ts.astype("datetime64[us]")
+        if ts.dtype.kind == "M":
+            return (ts - np.datetime64(self.START_TIME, "us")) / np.timedelta64(3600, "s")
+        return (ts.astype(np.float64) - self.START_TIME.timestamp()) / 3600.0
+
+    def canon_at(self, timestamps) -> np.ndarray:
+        """Canon en cada timestamp (mismo shape que la entrada)."""
+        elapsed_hrs = np.maximum(self._elapsed_hrs(timestamps), self._elapsed_floor_hrs())
+        penalty_hrs = np.maximum(elapsed_hrs - self.FATAL_DEADLINE_HRS, 0.0)
+        return self.CANON_BASE * np.exp(self.LAMBDA * penalty_hrs)
+
+    def canon_schedule(self, start: datetime, end: datetime, step) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps datetime64[us], canon) desde start hasta end (excluido); step en timedelta o segundos."""
+        if not isinstance(step, timedelta):
+            step = timedelta(seconds=step)
+        if step <= timedelta(0):
+            raise ValueError("step debe ser positivo")
+        timestamps = np.arange(np.datetime64(start, "us"), np.datetime64(end, "us"), np.timedelta64(step))
+        return timestamps, self.canon_at(timestamps)
+
+    def _memoized_canon(self, current_time: datetime) -> Tuple[float, float, bool]:
+        """(canon, horas de penalización, recalculado) con resolución de un segundo."""
+        elapsed = current_time - self.START_TIME
+        second = max(elapsed.days * 86400 + elapsed.seconds, math.ceil(self._elapsed_floor_hrs() * 3600))
+        memo = self._canon_memo
+        if memo is not None and memo[1] == second and memo[0] == self.START_TIME:
+            return memo[2], memo[3], False
+        penalty_hrs = max(second / 3600 - self.FATAL_DEADLINE_HRS, 0.0)
+        canon = self.CANON_BASE * math.exp(self.LAMBDA * penalty_hrs) if penalty_hrs > 0 else self.CANON_BASE
+        self._canon_memo = (self.START_TIME, second, canon, penalty_hrs)  # tupla: publicación atómica
+        return canon, penalty_hrs, True
+
+    def time_until_canon(self, threshold: float, now: Optional[datetime] = None) -> timedelta:
+        """Tiempo hasta que el canon alcance `threshold` (timedelta(0) si ya lo alcanzó)."""
+        if threshold <= self.CANON_BASE:
+            return timedelta(0)
+        target_hrs = self.FATAL_DEADLINE_HRS + math.log(threshold / self.CANON_BASE) / self.LAMBDA
+        if self._elapsed_floor_hrs() >= target_hrs:
+            return timedelta(0)
+        now = self._current_time() if now is None else now
+        remaining_s = target_hrs * 3600 - (now - self.START_TIME).total_seconds()
+        return timedelta(seconds=max(remaining_s, 0.0))
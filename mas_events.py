@@ -0,0 +1,346 @@
+# MAS EVENTS: Emisor de eventos estructurados compartido por los módulos MAS-OPL.
+# Reemplaza los print() del camino caliente por logging con nivel y %-args perezosos:
+# un evento deshabilitado no formatea su mensaje ni toca stdout.
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+ROOT_LOGGER = "mas"
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+CRITICAL = logging.CRITICAL
+
+
+class EventEmitter:
+    """
+    Emisor level-gated de un módulo (logger `mas.<nombre>`).
+    Cada evento lleva un identificador estable (`event`), un mensaje con %-args
+    que sólo se formatea si el nivel está habilitado, y campos estructurados
+    opcionales para la salida JSON.
+    """
+
+    __slots__ = ("logger",)
+
+    def __init__(self, name: str):
+        self.logger = logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+    def enabled(self, level: int) -> bool:
+        """Para proteger cálculos costosos de campos antes de emitir."""
+        return self.logger.isEnabledFor(level)
+
+    def emit(self, level: int, event: str, msg: str, *args, **fields):
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, msg, *args, extra={"event": event, "fields": fields}, stacklevel=2)
+
+    def debug(self, event: str, msg: str, *args, **fields):
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.log(DEBUG, msg, *args, extra={"event": event, "fields": fields}, stacklevel=2)
+
+    def info(self, event: str, msg: str, *args, **fields):
+        if self.logger.isEnabledFor(INFO):
+            self.logger.log(INFO, msg, *args, extra={"event": event, "fields": fields}, stacklevel=2)
+
+    def warning(self, event: str, msg: str, *args, **fields):
+        if self.logger.isEnabledFor(WARNING):
+            self.logger.log(WARNING, msg, *args, extra={"event": event, "fields": fields}, stacklevel=2)
+
+    def error(self, event: str, msg: str, *args, **fields):
+        if self.logger.isEnabledFor(ERROR):
+            self.logger.log(ERROR, msg, *args, extra={"event": event, "fields": fields}, stacklevel=2)
+
+    def critical(self, event: str, msg: str, *args, **fields):
+        if self.logger.isEnabledFor(CRITICAL):
+            self.logger.log(CRITICAL, msg, *args, extra={"event": event, "fields": fields}, stacklevel=2)
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """Un objeto JSON por línea: ts, level, logger, event, message y campos del evento."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": getattr(record, "event", None),
+            "message": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _PreparedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que sólo resuelve msg % args en el hilo productor; el
+    formateo JSON y la escritura quedan en el hilo del QueueListener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_console_handler: Optional[logging.Handler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+def configure_console(level: int = INFO, stream: Optional[TextIO] = None) -> logging.Handler:
+    """
+    Salida legible (sólo el mensaje, como los print originales) para demos y CLI.
+    Idempotente: reconfigurar reemplaza el handler previo.
+    """
+    global _console_handler
+    logger = logging.getLogger(ROOT_LOGGER)
+    if _console_handler is not None:
+        logger.removeHandler(_console_handler)
+    _console_handler = logging.StreamHandler(stream or sys.stdout)
+    _console_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_console_handler)
+    logger.setLevel(level)
+    return _console_handler
+
+
+def start_json_logging(target=None, level: int = INFO) -> logging.handlers.QueueListener:
+    """
+    Envía los eventos en JSON lines fuera del hilo de request: los módulos sólo
+    encolan (QueueHandler) y un QueueListener formatea y escribe en segundo plano.
+    `target` es un stream abierto o una ruta de archivo (default: stdout).
+    """
+    global _listener, _queue_handler
+    stop_json_logging()
+
+    if isinstance(target, str):
+        sink = logging.FileHandler(target, encoding="utf-8")
+    else:
+        sink = logging.StreamHandler(target or sys.stdout)
+    sink.setFormatter(JSONLinesFormatter())
+
+    event_queue = queue.SimpleQueue()
+    _queue_handler = _PreparedQueueHandler(event_queue)
+    _listener = logging.handlers.QueueListener(event_queue, sink, respect_handler_level=False)
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.addHandler(_queue_handler)
+    logger.setLevel(level)
+    _listener.start()
+    return _listener
+
+
+def stop_json_logging():
+    """Vacía la cola pendiente y desconecta el listener."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _queue_handler is not None:
+        logging.getLogger(ROOT_LOGGER).removeHandler(_queue_handler)
+        _queue_handler = None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# III.12 MEJORA: Logs en memoria de capacidad fija (memoria plana bajo carga sostenida)
+# ═══════════════════════════════════════════════════════════════════════════
+
+class BoundedLog:
+    """
+    Log de eventos con capacidad fija y la interfaz de lista que usaban los módulos
+    (append, len, [i], [-1], iteración). Al llenarse descarta las entradas más
+    antiguas en bloques de `spill_batch`; si `spill_path` está definido, ese
+    bloque se vuelca antes a disco en JSON lines (exportable con iter_all()).
+    """
+
+    def __init__(self, capacity: int = 10_000, spill_path: Optional[str] = None,
+                 spill_batch: Optional[int] = None):
+        if capacity <= 0:
+            raise ValueError("BoundedLog: capacity debe ser > 0")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.spill_batch = max(1, min(spill_batch or capacity // 4, capacity))
+        self._entries: deque = deque()
+        self.evicted = 0
+        self.spilled = 0
+        self._lock = threading.Lock()  # III.16: append + desalojo atómicos entre hilos
+
+    def append(self, entry: Dict):
+        with self._lock:
+            if len(self._entries) >= self.capacity:
+                self._evict_oldest()
+            self._entries.append(entry)
+
+    def extend(self, entries: Iterable[Dict]):
+        for entry in entries:
+            self.append(entry)
+
+    def _evict_oldest(self):
+        batch = [self._entries.popleft() for _ in range(min(self.spill_batch, len(self._entries)))]
+        self.evicted += len(batch)
+        if self.spill_path is not None:
+            with open(self.spill_path, "a", encoding="utf-8") as spill:
+                spill.writelines(json.dumps(entry, ensure_ascii=False, default=str) + "\n" for entry in batch)
+            self.spilled += len(batch)
+
+    def iter_spilled(self) -> Iterator[Dict]:
+        if self.spill_path is None or not os.path.exists(self.spill_path):
+            return
+        with open(self.spill_path, encoding="utf-8") as spill:
+            for line in spill:
+                yield json.loads(line)
+
+    def iter_all(self) -> Iterator[Dict]:
+        """Exportación completa: entradas volcadas a disco y luego las residentes."""
+        yield from self.iter_spilled()
+        yield from self.snapshot()
+
+    def snapshot(self) -> List[Dict]:
+        """Copia de las entradas residentes tomada bajo el lock (iterable sin carreras)."""
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.evicted = 0
+
+    @property
+    def total_appended(self) -> int:
+        return self.evicted + len(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict]:
+        # Iterar el deque mientras otro hilo hace append lanza "deque mutated during iteration"
+        return iter(self.snapshot())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.snapshot()[index]
+        with self._lock:
+            return self._entries[index]
+
+    def __repr__(self) -> str:
+        return f"BoundedLog(len={len(self)}, capacity={self.capacity}, evicted={self.evicted})"
+
+
+class ColumnarRingLog:
+    """
+    Ring buffer columnar (NumPy) para logs numéricos de esquema fijo: una fila
+    float64 por entrada en lugar de un dict. Al completar una vuelta, el bloque
+    de `spill_batch` filas a sobrescribir se vuelca a disco como float64 crudo
+    si `spill_path` está definido. Las lecturas devuelven dicts (compatibilidad)
+    y arrays() expone las columnas en orden cronológico.
+    """
+
+    def __init__(self, fields: Tuple[str, ...], capacity: int = 100_000,
+                 spill_path: Optional[str] = None, spill_batch: Optional[int] = None):
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.spill_batch = spill_batch or max(1, capacity // 4)
+        if capacity % self.spill_batch:
+            raise ValueError("ColumnarRingLog: capacity debe ser múltiplo de spill_batch")
+        self._rows = np.zeros((capacity, len(self.fields)), dtype=np.float64)
+        self._total = 0
+        self.evicted = 0
+        self.spilled = 0
+        self._lock = threading.Lock()  # III.16: escrituras atómicas entre hilos
+
+    def _evict_block(self, position: int):
+        """Libera (y opcionalmente vuelca) el bloque más antiguo antes de sobrescribirlo."""
+        if self.spill_path is not None:
+            with open(self.spill_path, "ab") as spill:
+                self._rows[position:position + self.spill_batch].tofile(spill)
+            self.spilled += self.spill_batch
+        self.evicted += self.spill_batch
+
+    def append_row(self, *values: float):
+        with self._lock:
+            position = self._total % self.capacity
+            if self._total >= self.capacity and position % self.spill_batch == 0:
+                self._evict_block(position)
+            self._rows[position] = values
+            self._total += 1
+
+    def append(self, entry: Dict):
+        self.append_row(*(entry[name] for name in self.fields))
+
+    def extend_arrays(self, *columns: np.ndarray):
+        """Agrega un lote completo (una columna por campo) con escrituras vectorizadas."""
+        block = np.column_stack(columns).astype(np.float64, copy=False)
+        offset = 0
+        with self._lock:
+            while offset < len(block):
+                # Cada escritura queda dentro de un bloque de spill (y por ende del ring)
+                position = self._total % self.capacity
+                if self._total >= self.capacity and position % self.spill_batch == 0:
+                    self._evict_block(position)
+                n_rows = min(len(block) - offset, self.spill_batch - position % self.spill_batch)
+                self._rows[position:position + n_rows] = block[offset:offset + n_rows]
+                self._total += n_rows
+                offset += n_rows
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """Columnas residentes en orden cronológico (copias tomadas bajo el lock)."""
+        with self._lock:
+            ordered = self._rows[np.arange(self.evicted, self._total) % self.capacity]
+        return {name: ordered[:, i] for i, name in enumerate(self.fields)}
+
+    def iter_spilled(self) -> Iterator[Dict]:
+        if self.spill_path is None or not os.path.exists(self.spill_path):
+            return
+        rows = np.fromfile(self.spill_path, dtype=np.float64).reshape(-1, len(self.fields))
+        for row in rows:
+            yield dict(zip(self.fields, row.tolist()))
+
+    def iter_all(self) -> Iterator[Dict]:
+        """Exportación completa: filas volcadas a disco y luego las residentes."""
+        yield from self.iter_spilled()
+        yield from self
+
+    def clear(self):
+        with self._lock:
+            self._total = 0
+            self.evicted = 0
+
+    @property
+    def total_appended(self) -> int:
+        return self._total
+
+    def __len__(self) -> int:
+        return self._total - self.evicted
+
+    def __getitem__(self, index: int) -> Dict:
+        with self._lock:
+            size = len(self)
+            if index < 0:
+                index += size
+            if not 0 <= index < size:
+                raise IndexError("ColumnarRingLog index out of range")
+            row = self._rows[(self.evicted + index) % self.capacity].tolist()
+        return dict(zip(self.fields, row))
+
+    def __iter__(self) -> Iterator[Dict]:
+        arrays = self.arrays()
+        for values in zip(*(arrays[name].tolist() for name in self.fields)):
+            yield dict(zip(self.fields, values))
+
+    def __repr__(self) -> str:
+        return f"ColumnarRingLog(fields={self.fields}, len={len(self)}, capacity={self.capacity})"
@@ -0,0 +1,414 @@
+# MAS POOL: Pool multi-proceso del MAS-OPL V8.1
+# El scoring es Python puro y CPU-bound: los hilos no escalan más allá del GIL.
+# MASPool reparte validate_input entre N procesos worker que comparten el estado
+# axiomático (ATLAS + PSICAGONICO) en memoria compartida, y canaliza las escrituras
+# del ledger a un único proceso escritor que mantiene lineal la cadena de hash.
+
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Asumimos que el núcleo está disponible en el mismo directorio (mas_opl_v8_1_final.py)
+from mas_opl_v8_1_final import MAS, PSICAGONICO, EthicalAxiom, RoyaltyAntiDilution, SegmentLedger
+
+AXIOMS: Tuple[EthicalAxiom, ...] = tuple(EthicalAxiom)
+
+# Layout del bloque compartido (float64):
+# [versión, último hardening, contador de inmunidad, vectores ATLAS..., boosts PSICAGONICO...]
+_VERSION, _LAST_HARDENING, _IMMUNITY = 0, 1, 2
+_VECTORS = slice(3, 3 + len(AXIOMS))
+_BOOSTS = slice(3 + len(AXIOMS), 3 + 2 * len(AXIOMS))
+_SLOTS = 3 + 2 * len(AXIOMS)
+
+
+class MASPoolWorkerError(RuntimeError):
+    """Excepción levantada dentro de un worker (se re-lanza en el proceso padre)."""
+
+
+class MASPoolBrokenError(MASPoolWorkerError):
+    """Un proceso del pool murió de forma abrupta (OOM, señal): el pool queda inutilizable."""
+
+
+class SharedAxiomState:
+    """
+    Vectores ATLAS, boosts PSICAGONICO, cooldown e inmunidad en un bloque de
+    `multiprocessing.shared_memory` visto como array NumPy. Los escritores
+    (hardening, raro) toman `lock`; los lectores sólo comparan la versión y
+    copian el estado cuando cambió.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, lock):
+        self.shm = shm
+        self.lock = lock
+        self.array = np.ndarray((_SLOTS,), dtype=np.float64, buffer=shm.buf)
+        self._seen_version = -1
+
+    @classmethod
+    def create(cls, lock, atlas_vectors: Dict[EthicalAxiom, float],
+               psicagonico: PSICAGONICO) -> "SharedAxiomState":
+        shm = shared_memory.SharedMemory(create=True, size=_SLOTS * 8)
+        state = cls(shm, lock)
+        state.array[_VERSION] = 0
+        state.array[_LAST_HARDENING] = psicagonico.last_hardening_timestamp
+        state.array[_IMMUNITY] = psicagonico.psi_immunity_counter
+        state.array[_VECTORS] = [atlas_vectors[axiom] for axiom in AXIOMS]
+        state.array[_BOOSTS] = [psicagonico.axiom_boosts[axiom] for axiom in AXIOMS]
+        return state
+
+    @classmethod
+    def attach(cls, name: str, lock) -> "SharedAxiomState":
+        return cls(shared_memory.SharedMemory(name=name), lock)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def version(self) -> int:
+        return int(self.array[_VERSION])
+
+    def axiom_vectors(self) -> Dict[EthicalAxiom, float]:
+        return dict(zip(AXIOMS, self.array[_VECTORS].tolist()))
+
+    def pull(self, atlas, psicagonico: PSICAGONICO):
+        """Copia el estado compartido a las instancias locales si cambió (llamador con `lock`)."""
+        if self.version == self._seen_version:
+            return
+        atlas.axiom_vectors = self.axiom_vectors()  # copy-on-write: dict nuevo
+        atlas.axiom_version += 1                    # invalida caches derivados
+        psicagonico.axiom_boosts = dict(zip(AXIOMS, self.array[_BOOSTS].tolist()))
+        psicagonico.last_hardening_timestamp = float(self.array[_LAST_HARDENING])
+        psicagonico.psi_immunity_counter = int(self.array[_IMMUNITY])
+        self._seen_version = self.version
+
+    def push(self, atlas, psicagonico: PSICAGONICO):
+        """Publica el estado local tras un hardening (llamador con `lock`)."""
+        self.array[_VECTORS] = [atlas.axiom_vectors[axiom] for axiom in AXIOMS]
+        self.array[_BOOSTS] = [psicagonico.axiom_boosts[axiom] for axiom in AXIOMS]
+        self.array[_LAST_HARDENING] = psicagonico.last_hardening_timestamp
+        self.array[_IMMUNITY] = psicagonico.psi_immunity_counter
+        self.array[_VERSION] += 1
+        self._seen_version = self.version
+
+    def sync(self, atlas, psicagonico: PSICAGONICO):
+        """Trae el estado compartido sólo si otro proceso lo cambió (lectura sin lock)."""
+        if self.version != self._seen_version:
+            with self.lock:
+                self.pull(atlas, psicagonico)
+
+    def close(self):
+        self.array = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+class SharedPSICAGONICO(PSICAGONICO):
+    """PSICAGONICO cuyo cooldown y hardening son globales al pool."""
+
+    def __init__(self, shared: SharedAxiomState, matcher=None):
+        super().__init__(matcher=matcher)
+        self.shared = shared
+
+    def apply_psi_hardening(self, d_psic: float, u_critical: float, atlas, input_text: str, event_id: str) -> float:
+        if d_psic <= 0 or time.time() - self.last_hardening_timestamp < self.cooldown_period:
+            # Cooldown visto localmente: los timestamps sólo avanzan, así que sigue vigente
+            return super().apply_psi_hardening(d_psic, u_critical, atlas, input_text, event_id)
+        with self.shared.lock:
+            # Estado global más reciente (otro worker pudo endurecer y activar el cooldown)
+            self.shared.pull(atlas, self)
+            hardening_factor = super().apply_psi_hardening(d_psic, u_critical, atlas, input_text, event_id)
+            if hardening_factor > 0:
+                self.shared.push(atlas, self)
+        return hardening_factor
+
+
+class SharedCounter:
+    """Contador de secuencia compartido entre procesos (misma interfaz que AtomicCounter)."""
+
+    def __init__(self, shared_value):
+        self._shared_value = shared_value
+
+    def next(self) -> int:
+        with self._shared_value.get_lock():
+            self._shared_value.value += 1
+            return self._shared_value.value
+
+    @property
+    def value(self) -> int:
+        return self._shared_value.value
+
+
+class LedgerClient:
+    """Sustituye a RoyaltyAntiDilution en los workers: envía cada UEC al proceso escritor."""
+
+    def __init__(self, ledger_queue):
+        self._ledger_queue = ledger_queue
+
+    def record_uec_usage(self, transaction_id: str, value_generated: float):
+        self._ledger_queue.put((transaction_id, value_generated))
+
+
+def _ledger_writer_main(ledger_queue, summary_queue, royalty_rate: float, ledger_dir: Optional[str]):
+    """Único dueño del RoyaltyAntiDilution: los UEC se encadenan en orden de llegada."""
+    anti_dilution = RoyaltyAntiDilution(royalty_rate=royalty_rate, ledger_dir=ledger_dir)
+    while True:
+        item = ledger_queue.get()
+        if item is None:
+            break
+        anti_dilution.record_uec_usage(*item)
+
+    ledger = anti_dilution.immutable_ledger
+    summary = {
+        "uec_counter": anti_dilution.uec_counter,
+        "last_hash": ledger[-1]['hash'] if ledger else "GENESIS",
+        "chain": anti_dilution.verify_chain(),
+    }
+    if isinstance(ledger, SegmentLedger):
+        ledger.close()
+    summary_queue.put(summary)
+
+
+def _worker_main(task_queue, result_queue, shm_name: str, lock, sequence_value,
+                 ledger_queue, mas_kwargs: Dict):
+    shared = SharedAxiomState.attach(shm_name, lock)
+    mas = MAS(**mas_kwargs)
+    mas.psicagonico = SharedPSICAGONICO(shared, matcher=mas.maat.matcher)
+    mas.anti_dilution = LedgerClient(ledger_queue)
+    mas._sequence = SharedCounter(sequence_value)
+
+    while True:
+        batch = task_queue.get()
+        if batch is None:
+            break
+        results = []
+        for task_id, input_text, context, operation_signature in batch:
+            try:
+                shared.sync(mas.atlas, mas.psicagonico)
+                results.append((task_id, True, mas.validate_input(input_text, context, operation_signature)))
+            except Exception as exc:
+                results.append((task_id, False, f"{type(exc).__name__}: {exc}"))
+        result_queue.put(results)
+    shared.close()
+
+
+class MASPool:
+    """
+    III.17 MEJORA: Pool de N procesos MAS con estado axiomático compartido.
+
+    - validate_input / submit / map reparten requests entre los workers.
+    - ATLAS + PSICAGONICO viven en SharedAxiomState: un hardening en cualquier
+      worker es visible para todos en su siguiente request.
+    - Los UEC se envían a un proceso escritor único (cadena de hash lineal);
+      close() lo detiene y retorna su resumen (uec_counter, último hash, verificación).
+    - Carga, cola ATLAS, cache de resultados y logs forenses son por worker.
+    - El colector vigila cada `liveness_interval` s que workers y escritor sigan
+      vivos. Si uno muere sin pasar por close() (OOM, segfault, kill) el pool se
+      marca roto, como BrokenProcessPool: se terminan los procesos restantes (el
+      muerto pudo dejar tomado el lock compartido), los futures pendientes fallan
+      con MASPoolBrokenError y close() retorna sin bloquear.
+
+    Sólo compensa con varios núcleos: en un host de 1 CPU el IPC y el escritor
+    aparte lo dejan en ~0.5x de un MAS de un proceso (benchmarks/pool_scaling.py).
+
+    `ledger_dir` se usa en el escritor; el resto de `mas_kwargs` en cada worker.
+    """
+
+    # Con el pool roto, espera máxima por el resumen del escritor (su cola pudo quedar a medias)
+    BROKEN_WRITER_TIMEOUT = 5.0
+
+    def __init__(self, workers: Optional[int] = None, ledger_dir: Optional[str] = None,
+                 royalty_rate: float = 0.05, start_method: Optional[str] = None,
+                 liveness_interval: float = 0.5, **mas_kwargs):
+        context = mp.get_context(start_method)
+        self.n_workers = workers or os.cpu_count() or 1
+        self.liveness_interval = liveness_interval
+
+        seed = MAS(**mas_kwargs)
+        self.shared = SharedAxiomState.create(context.RLock(), seed.atlas.axiom_vectors, seed.psicagonico)
+        self._sequence = context.Value("q", 0)
+
+        self._tasks = context.Queue()
+        self._results = context.Queue()
+        self._ledger_queue = context.Queue()
+        self._summary_queue = context.Queue()
+
+        self._writer = context.Process(
+            target=_ledger_writer_main, name="mas-ledger-writer", daemon=True,
+            args=(self._ledger_queue, self._summary_queue, royalty_rate, ledger_dir),
+        )
+        self._writer.start()
+        self._workers = [
+            context.Process(
+                target=_worker_main, name=f"mas-worker-{i}", daemon=True,
+                args=(self._tasks, self._results, self.shared.name, self.shared.lock,
+                      self._sequence, self._ledger_queue, mas_kwargs),
+            )
+            for i in range(self.n_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        self._futures: Dict[int, Future] = {}
+        self._futures_lock = threading.Lock()
+        self._task_ids = itertools.count()
+        self._broken: Optional[str] = None
+        self._closed = False
+        self._collector = threading.Thread(target=self._collect, name="mas-pool-collector", daemon=True)
+        self._collector.start()
+
+    def _collect(self):
+        next_check = time.monotonic() + self.liveness_interval
+        while True:
+            try:
+                batch = self._results.get(timeout=self.liveness_interval)
+            except queue.Empty:
+                batch = []
+            if batch is None:
+                return
+            for task_id, ok, payload in batch:
+                with self._futures_lock:
+                    future = self._futures.pop(task_id)
+                if ok:
+                    future.set_result(payload)
+                else:
+                    future.set_exception(MASPoolWorkerError(payload))
+            # También con resultados fluyendo: los futures del worker muerto no llegarían nunca
+            if time.monotonic() >= next_check:
+                next_check = time.monotonic() + self.liveness_interval
+                dead = self._dead_process()
+                if dead is not None:
+                    self._break(f"{dead.name} terminó de forma abrupta (exitcode {dead.exitcode})")
+                    return
+
+    def _dead_process(self) -> Optional[mp.process.BaseProcess]:
+        """Primer worker o escritor que salió sin centinela (sólo el centinela sale con 0)."""
+        for process in (*self._workers, self._writer):
+            if process.exitcode not in (None, 0):
+                return process
+        return None
+
+    def _break(self, reason: str):
+        with self._futures_lock:
+            self._broken = reason
+            pending, self._futures = self._futures, {}
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.terminate()
+        # Nadie volverá a leer estas colas: sin esto el proceso no puede salir mientras
+        # el hilo alimentador espera vaciar su pipe
+        for pipe in (self._tasks, self._results, self._ledger_queue):
+            pipe.cancel_join_thread()
+        for future in pending.values():
+            future.set_exception(MASPoolBrokenError(reason))
+
+    @property
+    def broken(self) -> Optional[str]:
+        """Motivo por el que el pool quedó roto, o None si sigue sano."""
+        return self._broken
+
+    def _submit_batch(self, tasks: List[Tuple[str, str, Optional[str]]]) -> List[Future]:
+        if self._closed:
+            raise RuntimeError("MASPool cerrado")
+        futures, batch = [], []
+        with self._futures_lock:
+            if self._broken is not None:
+                raise MASPoolBrokenError(self._broken)
+            for input_text, context, operation_signature in tasks:
+                task_id = next(self._task_ids)
+                future = Future()
+                self._futures[task_id] = future
+                futures.append(future)
+                batch.append((task_id, input_text, context, operation_signature))
+        self._tasks.put(batch)
+        return futures
+
+    def submit(self, input_text: str, context: str, operation_signature: Optional[str] = None) -> Future:
+        return self._submit_batch([(input_text, context, operation_signature)])[0]
+
+    def validate_input(self, input_text: str, context: str, operation_signature: Optional[str] = None) -> Dict:
+        return self.submit(input_text, context, operation_signature).result()
+
+    def map(self, input_texts: List[str], contexts, operation_signatures: Optional[List[Optional[str]]] = None,
+            chunksize: int = 16) -> List[Dict]:
+        """Valida todos los inputs; los resultados conservan el orden de entrada."""
+        input_texts = list(input_texts)
+        contexts = [contexts] * len(input_texts) if isinstance(contexts, str) else list(contexts)
+        if operation_signatures is None:
+            operation_signatures = [None] * len(input_texts)
+        tasks = list(zip(input_texts, contexts, operation_signatures))
+        futures: List[Future] = []
+        for start in range(0, len(tasks), chunksize):
+            futures.extend(self._submit_batch(tasks[start:start + chunksize]))
+        return [future.result() for future in futures]
+
+    def axiom_vectors(self) -> Dict[EthicalAxiom, float]:
+        """Vectores ATLAS compartidos actuales."""
+        with self.shared.lock:
+            return self.shared.axiom_vectors()
+
+    @property
+    def current_sequence_id(self) -> int:
+        return self._sequence.value
+
+    def close(self) -> Dict:
+        """
+        Detiene workers y escritor (en ese orden) y retorna el resumen del ledger.
+        Con el pool roto el resumen lleva además `broken` (motivo); si el escritor
+        no puede entregarlo se levanta MASPoolBrokenError.
+        """
+        if self._closed:
+            return {}
+        self._closed = True
+        for _ in self._workers:
+            self._tasks.put(None)
+        for worker in self._workers:
+            # El colector sigue vigilando: si el pool se rompe, los workers se terminan
+            while worker.is_alive():
+                worker.join(self.liveness_interval)
+        if self._collector.is_alive():  # tras romperse el pool el colector ya salió
+            self._results.put(None)
+        self._collector.join()
+
+        try:
+            summary = self._stop_writer()
+        finally:
+            self.shared.close()
+            self.shared.unlink()
+        if self._broken is not None:
+            summary["broken"] = self._broken
+        return summary
+
+    def _stop_writer(self) -> Dict:
+        # Los workers ya vaciaron sus envíos: todo UEC llega antes del centinela
+        self._ledger_queue.put(None)
+        deadline = time.monotonic() + self.BROKEN_WRITER_TIMEOUT
+        while True:
+            try:
+                summary = self._summary_queue.get(timeout=self.liveness_interval)
+                break
+            except queue.Empty:
+                if not self._writer.is_alive():
+                    raise MASPoolBrokenError(
+                        f"{self._writer.name} terminó sin resumen (exitcode {self._writer.exitcode})")
+                if self._broken is not None and time.monotonic() >= deadline:
+                    self._writer.terminate()
+                    self._writer.join()
+                    raise MASPoolBrokenError(f"{self._writer.name} no entregó el resumen: {self._broken}")
+        self._writer.join()
+        return summary
+
+    def __enter__(self) -> "MASPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,44 @@
+"""
+Fixtures compartidas. El núcleo (mas-opl-v.8.1_final.py) no es importable por
+nombre: se carga como `mas_opl_v8_1_final`, igual que benchmarks/harness.py.
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+
+def load_core():
+    if "mas_opl_v8_1_final" in sys.modules:
+        return sys.modules["mas_opl_v8_1_final"]
+    spec = importlib.util.spec_from_file_location(
+        "mas_opl_v8_1_final", os.path.join(REPO_DIR, "mas-opl-v.8.1_final.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def core():
+    return load_core()
+
+
+@pytest.fixture
+def fixed_load(core):
+    """Fábrica de LoadMonitor que nunca satura: la latencia medida no mueve u_critical ni congela ATLAS."""
+    return lambda: core.LoadMonitor(max_concurrency=1_000_000)
+
+
+@pytest.fixture
+def new_mas(core, fixed_load):
+    """Fábrica de MAS con carga fija (ver fixed_load); los kwargs van a MAS()."""
+    def factory(**kwargs):
+        kwargs.setdefault("load_monitor", fixed_load())
+        return core.MAS(**kwargs)
+    return factory
@@ -0,0 +1,18 @@
+"""
+Plugin de pytest (pytest.ini: -p tests.repo_root). La raíz del repo tiene
+__init__.py, así que pytest la recolectaría como Package e importaría ese
+__init__; los tests cargan los módulos por ruta (conftest.load_core) y la raíz
+se recolecta como un directorio simple.
+"""
+
+import os
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def pytest_collect_directory(path, parent):
+    if str(path) == REPO_DIR:
+        return pytest.Dir.from_parent(parent, path=path)
+    return None
@@ -0,0 +1,146 @@
+"""AsyncMAS / AsyncSymbioticScheduler (III.5) contra un servidor Ollama stub local."""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("httpx")
+
+ALIGNED = ("compassion empathy support kindness nurture respect worth autonomy honor "
+           "honesty accuracy factual integrity transparency independence authority freedom "
+           "safety protection prevention consistency logic rationality alignment structure "
+           "preservation vitality survival safeguarding life")
+GENERATION_DELAY = 0.2
+
+
+class StubOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.payloads.append(body)
+        if "FAIL" in body["prompt"]:
+            status, out = 500, b"{}"
+        else:
+            time.sleep(GENERATION_DELAY)
+            status, out = 200, json.dumps({"response": f"eco:{body['prompt'][-12:]}"}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOllama)
+    server.payloads = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def anexa_async(core):
+    import anexa_async
+    return anexa_async
+
+
+@pytest.fixture
+def async_mas(anexa_async, new_mas):
+    # Carga fija: la latencia del stub no debe mover u_critical durante el test
+    return anexa_async.AsyncMAS(new_mas())
+
+
+def test_scheduler_overlaps_generations_and_keeps_order(async_mas, anexa_async, stub_server):
+    requests = [(f"{ALIGNED} #{i}", 10.0 + i) for i in range(8)]
+
+    async def main():
+        async with anexa_async.AsyncOllamaClient(base_url=f"http://127.0.0.1:{stub_server.server_port}") as client:
+            scheduler = anexa_async.AsyncSymbioticScheduler(async_mas, client, max_concurrency=4)
+            started = time.perf_counter()
+            results = await scheduler.run_many(requests)
+            return scheduler, results, time.perf_counter() - started
+
+    try:
+        scheduler, results, elapsed = asyncio.run(main())
+    finally:
+        async_mas.close()
+
+    assert [r["status"] for r in results] == ["PASSED_COHERENCE"] * len(requests)
+    assert [r["response"] for r in results] == [f"eco:{text[-12:]}" for text, _ in requests]
+    assert scheduler.max_in_flight == 4 and scheduler.in_flight == 0
+    # 8 generaciones de 0.2 s con 4 en vuelo: ~2 rondas, no 8 en serie
+    assert elapsed < GENERATION_DELAY * len(requests) * 0.75
+
+    # Un UEC por validación coherente más uno por ciclo completado, todos distintos
+    ledger = async_mas.mas.anti_dilution.immutable_ledger
+    assert async_mas.mas.anti_dilution.uec_counter == 2 * len(requests)
+    assert len({entry["record"]["transaction_id"] for entry in ledger}) == 2 * len(requests)
+    assert sorted(r["ledger_entry"]["record"]["value_generated"] for r in results) == [v for _, v in requests]
+
+    payload = stub_server.payloads[0]
+    assert payload["stream"] is False and payload["prompt"].startswith(f"SYSTEM: {anexa_async.SYSTEM_ANCHOR}")
+
+
+def test_blocked_input_never_reaches_the_model(async_mas, anexa_async, stub_server):
+
+    async def main():
+        async with anexa_async.AsyncOllamaClient(base_url=f"http://127.0.0.1:{stub_server.server_port}") as client:
+            scheduler = anexa_async.AsyncSymbioticScheduler(async_mas, client)
+            return await scheduler.run_cycle("the quarterly budget meeting summary", 5.0)
+
+    try:
+        result = asyncio.run(main())
+    finally:
+        async_mas.close()
+    assert result["status"] not in anexa_async.AsyncSymbioticScheduler.ALIGNED_STATUSES
+    assert "response" not in result and stub_server.payloads == []
+
+
+def test_client_error_messages(anexa_async, stub_server):
+    async def main():
+        async with anexa_async.AsyncOllamaClient(base_url=f"http://127.0.0.1:{stub_server.server_port}") as client:
+            http_error = await client.generate("FAIL")
+        async with anexa_async.AsyncOllamaClient(base_url=f"http://127.0.0.1:{unused_port()}", timeout=2.0) as client:
+            connect_error = await client.generate(ALIGNED)
+        return http_error, connect_error
+
+    http_error, connect_error = asyncio.run(main())
+    assert http_error.startswith("[ERROR EN API:")
+    assert connect_error.startswith("[ERROR CRÍTICO: CONEXIÓN FALLIDA")
+
+
+def unused_port() -> int:
+    """Un puerto local reservado y liberado: nada escucha en él."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_async_mas_matches_sync_core(async_mas, new_mas):
+    reference = new_mas()
+    prompts = [ALIGNED, "the quarterly budget meeting summary"]
+
+    async def main():
+        single = [await async_mas.validate_input(text, "standard_operation") for text in prompts]
+        batch = await async_mas.validate_many(prompts, "standard_operation")
+        return single, batch
+
+    try:
+        single, batch = asyncio.run(main())
+    finally:
+        async_mas.close()
+    expected = [reference.validate_input(text, "standard_operation") for text in prompts]
+    assert [r["status"] for r in single] == [r["status"] for r in expected] == [r["status"] for r in batch]
+    assert [r["coherence_metrics"] for r in single] == [r["coherence_metrics"] for r in expected]
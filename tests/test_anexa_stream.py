@@ -0,0 +1,155 @@
+"""AnexaStream (III.25): streaming NDJSON contra un servidor Ollama stub local."""
+
+import importlib.util
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Guion por palabra clave del prompt: lista de (pausa antes del chunk, chunk)
+TOKEN_GAP = 0.15
+SCRIPTS = {
+    "TIMING": [(0.0, {"response": "hola "})] + [(TOKEN_GAP, {"response": f"t{i} "}) for i in range(4)]
+              + [(0.0, {"response": "", "done": True})],
+    "CANCEL": [(0.0, {"response": "uno "}), (0.0, {"response": "dos "}), (3.0, {"response": "tarde "}),
+               (0.0, {"response": "", "done": True})],
+    "DIVERGE": [(0.0, {"response": "xyzzy plugh qwerty "}) for _ in range(40)] + [(0.0, {"done": True})],
+    "ERROR": [(0.0, {"response": "parcial "}), (0.0, {"error": "model 'llama3' not found"}),
+              (0.0, {"response": "nunca"})],
+}
+
+
+class StubOllamaStream(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.payloads.append(body)
+        script = next(steps for keyword, steps in SCRIPTS.items() if keyword in body["prompt"])
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for pause, chunk in script:
+                time.sleep(pause)
+                line = json.dumps(chunk).encode() + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except OSError:
+            self.server.disconnects += 1  # el cliente cortó el stream
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOllamaStream)
+    server.payloads, server.disconnects = [], 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def load_by_path(name: str, filename: str):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(REPO_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def anexa(core):
+    # El script importa del núcleo clases que viven en mas-core.py y en los módulos de
+    # Fase I; se exponen ahí sólo mientras se carga
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(core, "MAS_OPL_Core",
+                      load_by_path("mas_core_script", "mas-core.py").MAS_OPL_Core, raising=False)
+        patch.setattr(core, "Royalty_Anti_Dilution_Module",
+                      load_by_path("modulo_anti_dilucion", "Módulo-Anti-Dilución.py").Royalty_Anti_Dilution_Module,
+                      raising=False)
+        patch.setattr(core, "Subestimation_Detection_Module",
+                      load_by_path("modulo_deteccion_subestimacion", "Módulo Detección-Subestimación.py")
+                      .Subestimation_Detection_Module, raising=False)
+        return load_by_path("integracion_anexa", "integracion_anexa_test.py")
+
+
+def new_stream(anexa, server, prompt: str, **kwargs):
+    return anexa.AnexaStream(prompt, api_url=f"http://127.0.0.1:{server.server_port}/api/generate",
+                             session=requests.Session(), **kwargs)
+
+
+def test_tokens_arrive_as_chunks_are_written(anexa, stub_server):
+    stream = new_stream(anexa, stub_server, "TIMING")
+    started = time.perf_counter()
+    arrivals = []
+    for token in stream:
+        arrivals.append((token, time.perf_counter() - started))
+
+    assert [token for token, _ in arrivals] == ["hola ", "t0 ", "t1 ", "t2 ", "t3 "]
+    assert stream.stop_reason == "done" and stream.tokens == 5 and stream.text == "hola t0 t1 t2 t3 "
+    # El primer token llega sin esperar al resto de la generación
+    assert stream.first_token_s < TOKEN_GAP
+    assert arrivals[-1][1] >= 4 * TOKEN_GAP * 0.9
+    payload = stub_server.payloads[0]
+    assert payload["stream"] is True and payload["prompt"].startswith(f"SYSTEM: {anexa.SYSTEM_ANCHOR}")
+
+
+def test_cancel_unblocks_a_pending_read(anexa, stub_server):
+    stream = new_stream(anexa, stub_server, "CANCEL")
+    tokens = []
+    started = time.perf_counter()
+
+    def consume():
+        tokens.extend(stream)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    time.sleep(0.3)  # "uno" y "dos" llegaron; el stub calla 3 s
+    stream.cancel()
+    consumer.join(timeout=5)
+
+    assert not consumer.is_alive()
+    assert time.perf_counter() - started < 1.5
+    assert tokens == ["uno ", "dos "] and stream.text == "uno dos "
+    assert stream.stop_reason == "cancelled"
+
+
+def test_break_and_close_cancel_the_stream(anexa, stub_server):
+    stream = new_stream(anexa, stub_server, "TIMING")
+    iterator = iter(stream)
+    assert next(iterator) == "hola "
+    iterator.close()
+    assert stream.stop_reason == "cancelled" and stream.text == "hola "
+
+
+def test_divergent_output_stops_the_stream(core, anexa, stub_server):
+    monitor = anexa.RollingCoherenceMonitor(core.MAAT(atlas=core.ATLAS(origin_node="TEST")),
+                                            window_chars=200, check_every_chars=50, patience=2)
+    stream = new_stream(anexa, stub_server, "DIVERGE", coherence=monitor)
+    tokens = list(stream)
+
+    assert stream.stop_reason == "divergence"
+    assert len(monitor.history) == 2 and all(s_dens < monitor.min_s_dens for s_dens in monitor.history)
+    assert 0 < len(tokens) < 40
+
+
+def test_error_chunk_ends_the_stream_with_api_message(anexa, stub_server):
+    stream = new_stream(anexa, stub_server, "ERROR")
+    tokens = list(stream)
+
+    assert stream.stop_reason == "error"
+    assert tokens[0] == "parcial "
+    assert tokens[-1].startswith("[ERROR EN API: model 'llama3' not found.")
+    assert len(tokens) == 2 and stream.text == "parcial "
@@ -0,0 +1,71 @@
+"""BoundedLog / ColumnarRingLog (III.12): lecturas consistentes con appends concurrentes."""
+
+import threading
+
+import pytest
+
+from mas_events import BoundedLog, ColumnarRingLog
+
+
+def hammer(append, read, n_writers=4, per_writer=5_000):
+    """Escritores y un lector en paralelo; devuelve las excepciones del lector."""
+    errors = []
+    done = threading.Event()
+
+    def reader():
+        while not done.is_set():
+            try:
+                read()
+            except Exception as exc:  # se reporta abajo
+                errors.append(exc)
+                return
+
+    writers = [threading.Thread(target=lambda w=w: [append(w, i) for i in range(per_writer)])
+               for w in range(n_writers)]
+    reader_thread = threading.Thread(target=reader)
+    reader_thread.start()
+    for thread in writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    reader_thread.join()
+    return errors
+
+
+def test_bounded_log_iteration_during_appends():
+    log = BoundedLog(capacity=1_000, spill_batch=100)
+    errors = hammer(lambda w, i: log.append({"w": w, "i": i}),
+                    lambda: (sum(1 for _ in log), log[-1] if len(log) else None, log[:10]))
+    assert errors == []
+    assert log.total_appended == 20_000 and len(log) <= 1_000
+    # Cada escritor aparece en orden dentro de las entradas residentes
+    for w in range(4):
+        seen = [entry["i"] for entry in log if entry["w"] == w]
+        assert seen == sorted(seen)
+
+
+def test_columnar_ring_log_iteration_during_appends():
+    log = ColumnarRingLog(("w", "i"), capacity=1_024, spill_batch=256)
+    errors = hammer(lambda w, i: log.append_row(float(w), float(i)),
+                    lambda: (list(log), log.arrays(), log[0] if len(log) else None))
+    assert errors == []
+    assert log.total_appended == 20_000 and len(log) <= 1_024
+    arrays = log.arrays()
+    assert len(arrays["w"]) == len(log)
+
+
+def test_snapshot_is_detached():
+    log = BoundedLog(capacity=10)
+    log.append({"n": 1})
+    snapshot = log.snapshot()
+    log.append({"n": 2})
+    assert snapshot == [{"n": 1}] and len(log) == 2
+
+
+@pytest.mark.parametrize("index", [0, -1])
+def test_ring_indexing(index):
+    log = ColumnarRingLog(("a",), capacity=4, spill_batch=2)
+    for value in range(7):
+        log.append_row(float(value))
+    assert log[index]["a"] == (4.0 if index == 0 else 6.0)
@@ -0,0 +1,75 @@
+"""CanonCurve (III.19): implementación única y override de eternidad permanente."""
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from mas_canon import CanonCurve
+
+
+def eternity_canon(detector) -> float:
+    floor_hrs = 365 * 24 * detector.kronos.ETERNITY_PENALTY_YEARS
+    return detector.CANON_BASE * math.exp(detector.LAMBDA * (floor_hrs - detector.FATAL_DEADLINE_HRS))
+
+
+def test_current_time_is_abstract():
+    class NoClock(CanonCurve):
+        pass
+
+    with pytest.raises(TypeError):
+        NoClock()
+
+
+def test_core_and_kronos_share_one_curve(core):
+    kronos = pytest.importorskip("kronos_x_patch")
+    assert core.CanonCurve is CanonCurve is kronos.CanonCurve
+    assert issubclass(core.SubestimationDetection, CanonCurve)
+    assert issubclass(kronos.Subestimation_Detection_Module_KRONOS, CanonCurve)
+
+
+def test_kronos_eternity_floor_survives_clean_checks():
+    kronos = pytest.importorskip("kronos_x_patch")
+    source = kronos.FakeTimeSource()
+    detector = kronos.Subestimation_Detection_Module_KRONOS(base_canon=100.0, time_sources=[source])
+    assert detector.get_current_canon() == detector.CANON_BASE
+
+    source.offset_seconds = 7200  # un chequeo con tampering activa la eternidad
+    assert detector.get_current_canon() == pytest.approx(eternity_canon(detector))
+
+    source.offset_seconds = 0  # los chequeos siguientes ya no detectan nada...
+    canon = detector.get_current_canon()
+    # ...pero el canon actual sigue en el piso, igual que canon_at para el mismo instante
+    assert canon == pytest.approx(eternity_canon(detector))
+    assert canon == pytest.approx(float(detector.canon_at(np.array([datetime.now()]))[0]))
+
+
+class FixedCurve(CanonCurve):
+    """Curva con reloj fijo y override de eternidad activable."""
+    CANON_BASE, FATAL_DEADLINE_HRS, LAMBDA = 100.0, 72, 0.005
+    FLOOR_HRS = 365 * 24 * 10
+
+    def __init__(self, start: datetime):
+        self.START_TIME = start
+        self.now = start
+        self.eternity = False
+
+    def _current_time(self) -> datetime:
+        return self.now
+
+    def _elapsed_floor_hrs(self) -> float:
+        return self.FLOOR_HRS if self.eternity else 0.0
+
+
+def test_memoized_canon_applies_the_same_floor_as_canon_at():
+    curve = FixedCurve(datetime(2025, 1, 1))
+    curve.now = curve.START_TIME + timedelta(hours=100)
+    assert curve._memoized_canon(curve.now)[0] == pytest.approx(float(curve.canon_at([curve.now])[0]))
+
+    curve.eternity = True  # mismo segundo: el memo no debe servir el canon sin piso
+    expected = curve.CANON_BASE * math.exp(curve.LAMBDA * (curve.FLOOR_HRS - curve.FATAL_DEADLINE_HRS))
+    canon, penalty_hrs, fresh = curve._memoized_canon(curve.now)
+    assert fresh and penalty_hrs == curve.FLOOR_HRS - curve.FATAL_DEADLINE_HRS
+    assert canon == pytest.approx(expected) == pytest.approx(float(curve.canon_at([curve.now])[0]))
+    assert curve.time_until_canon(expected / 2) == timedelta(0)
@@ -0,0 +1,63 @@
+"""Backends de densidad (III.3): interfaz abstracta y volcado automático del cache en disco."""
+
+import gc
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def flushes(core, monkeypatch):
+    calls = []
+    original = core.EmbeddingVectorCache._flush_arrays
+
+    def spy(vectors, keys):
+        calls.append(len(vectors))
+        original(vectors, keys)
+
+    monkeypatch.setattr(core.EmbeddingVectorCache, "_flush_arrays", staticmethod(spy))
+    return calls
+
+
+def test_backend_interface_is_abstract(core):
+    with pytest.raises(TypeError):
+        core.SemanticDensityBackend()
+
+    class Incomplete(core.SemanticDensityBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_cache_flushes_on_threshold(core, tmp_path, flushes):
+    cache = core.EmbeddingVectorCache(str(tmp_path / "emb"), dim=4, capacity=16, flush_every=3)
+    for value in range(7):
+        cache.put(cache.content_key("ns", str(value)), np.full(4, value, dtype=np.float32))
+    assert len(flushes) == 2
+    cache.close()
+    assert len(flushes) == 3
+    cache.close()  # idempotente: el finalizer ya se consumió
+    assert len(flushes) == 3
+
+
+def test_cache_flushes_when_collected(core, tmp_path, flushes):
+    cache = core.EmbeddingVectorCache(str(tmp_path / "emb"), dim=4, capacity=16)
+    cache.put(cache.content_key("ns", "x"), np.ones(4, dtype=np.float32))
+    del cache
+    gc.collect()
+    assert len(flushes) == 1
+
+
+def test_switching_backend_closes_cache_and_reopen_keeps_vectors(core, tmp_path, flushes):
+    maat = core.MAAT(atlas=core.ATLAS(origin_node="TEST"))
+    path = str(tmp_path / "emb")
+    backend = maat.use_embedding_backend(cache_path=path)
+    first = backend.axiom_similarity(["verdad y justicia", "caos total"])
+    maat.use_embedding_backend(cache_path=path + "-other")
+    assert len(flushes) == 1
+
+    reopened = core.EmbeddingVectorCache(path, backend.axiom_matrix.shape[1])
+    assert reopened.size == 2
+    key = reopened.content_key(backend.embedder.fingerprint, backend.cache_key("caos total"))
+    np.testing.assert_allclose(reopened.get(key) @ backend.axiom_matrix.T, first[1], atol=1e-6)
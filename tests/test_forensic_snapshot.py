@@ -0,0 +1,113 @@
+"""Snapshot forense de KRONOS-X: semilla coherente, políticas de antigüedad y reporte con un solo chequeo."""
+
+import time
+from datetime import timedelta
+
+import pytest
+
+kronos = pytest.importorskip("kronos_x_patch")
+
+TAMPERED_OFFSET_S = 2 * 3600  # por encima de TAMPERING_THRESHOLD_SECONDS
+
+
+def detector_with(source, **kwargs):
+    return kronos.Subestimation_Detection_Module_KRONOS(base_canon=100.0, time_sources=[source], **kwargs)
+
+
+def test_clean_seed_uses_the_init_check():
+    source = kronos.FakeTimeSource()
+    detector = detector_with(source)
+    snap = detector.snapshot()
+
+    assert source.calls == 1  # la semilla no repite el chequeo de init
+    assert snap.sequence == 0 and not snap.tampering_detected
+    assert snap.start_time == snap.verified_time == detector.START_TIME
+    assert snap.canon == 100.0 and snap.time_verification_status == "VERIFIED"
+    assert snap.time_source_state == kronos.KRONOS_X_TemporalGuardian.VERIFIED
+
+
+def test_tampered_seed_matches_a_refresh():
+    source = kronos.FakeTimeSource(offset_seconds=TAMPERED_OFFSET_S)
+    detector = detector_with(source)
+    seed = detector.snapshot()
+
+    assert source.calls == 1
+    assert detector.max_penalty_triggered and not detector.START_TIME_VERIFIED
+    eternity = timedelta(days=365 * detector.kronos.ETERNITY_PENALTY_YEARS)
+    assert seed.tampering_detected and seed.time_verification_status == "COMPROMISED"
+    assert seed.verified_time == detector.START_TIME + eternity
+    assert seed.canon > 100.0  # canon de eternidad, no el canon base
+
+    refreshed = detector.refresh_snapshot()
+    assert refreshed.sequence == 1
+    assert (refreshed.tampering_detected, refreshed.canon, refreshed.verified_time) == \
+        (seed.tampering_detected, seed.canon, seed.verified_time)
+
+
+@pytest.fixture
+def stale_detector():
+    def factory(policy):
+        source = kronos.FakeTimeSource()
+        detector = detector_with(source, snapshot_max_age=0.05, snapshot_stale_policy=policy)
+        return source, detector
+    return factory
+
+
+@pytest.mark.parametrize("policy", kronos.Subestimation_Detection_Module_KRONOS.SNAPSHOT_STALE_POLICIES)
+def test_fresh_snapshot_is_served_under_every_policy(stale_detector, policy):
+    source, detector = stale_detector(policy)
+    seed = detector._snapshot
+    assert detector.snapshot() is seed and detector.snapshot(max_age=60) is seed
+    assert source.calls == 1
+
+
+def test_stale_policy_serve(stale_detector):
+    source, detector = stale_detector("serve")
+    seed = detector.snapshot()
+    time.sleep(0.1)
+    snap = detector.snapshot()
+    assert snap is seed and snap.age > 0.05
+    assert source.calls == 1
+
+
+def test_stale_policy_resync(stale_detector):
+    source, detector = stale_detector("resync")
+    time.sleep(0.1)
+    snap = detector.snapshot()
+    assert snap.sequence == 1 and snap.age < 0.05
+    assert source.calls == 2
+    assert detector.snapshot() is snap  # recién publicado: fresco otra vez
+
+
+def test_stale_policy_raise(stale_detector):
+    source, detector = stale_detector("raise")
+    time.sleep(0.1)
+    with pytest.raises(kronos.StaleSnapshotError):
+        detector.snapshot()
+    assert issubclass(kronos.StaleSnapshotError, kronos.StaleClockError)
+    assert detector.snapshot(max_age=60).sequence == 0  # max_age explícito
+    assert source.calls == 1
+
+
+def test_invalid_stale_policy():
+    with pytest.raises(ValueError):
+        detector_with(kronos.FakeTimeSource(), snapshot_stale_policy="ignore")
+
+
+@pytest.mark.parametrize("offset_s", [0, TAMPERED_OFFSET_S])
+def test_forensic_report_runs_one_check_and_publishes_it(offset_s):
+    source = kronos.FakeTimeSource(offset_seconds=offset_s)
+    detector = detector_with(source)
+    calls = source.calls
+
+    report = detector.get_forensic_report()
+
+    assert source.calls == calls + 1
+    snap = detector.snapshot()
+    assert snap.sequence == 1
+    expected = snap.to_report()
+    for key in ("start_time_verified", "current_time_verified", "current_canon", "temporal_tampering_detected",
+                "kronos_log_length", "time_verification_status", "time_source_state"):
+        assert report[key] == expected[key], key
+    assert report["kronos_log"] == list(detector.kronos.tampering_log)
+    assert len(report["kronos_log"]) == report["kronos_log_length"] == (2 if offset_s else 0)
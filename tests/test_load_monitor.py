@@ -0,0 +1,90 @@
+"""LoadMonitor (III.15): combinación de concurrencia, latencia, cola y CPU."""
+
+import time
+from contextlib import ExitStack
+
+import pytest
+
+
+@pytest.fixture
+def new_monitor(core):
+    def factory(**kwargs):
+        kwargs.setdefault("max_concurrency", 4)
+        return core.LoadMonitor(**kwargs)
+    return factory
+
+
+def in_flight(monitor, n):
+    stack = ExitStack()
+    for _ in range(n):
+        stack.enter_context(monitor.track_request())
+    return stack
+
+
+def test_idle_load_is_min_load(new_monitor):
+    monitor = new_monitor()
+    assert monitor.load() == monitor.min_load == 0.05
+    assert new_monitor(min_load=0.2).load() == 0.2
+
+
+def test_concurrency_excludes_the_caller(new_monitor):
+    monitor = new_monitor()
+    with in_flight(monitor, 1):
+        assert monitor.load() == monitor.min_load  # un único llamador secuencial no satura
+    with in_flight(monitor, 3):
+        assert monitor.load() == pytest.approx(2 / 4)
+        assert monitor.last_components["concurrency"] == pytest.approx(0.5)
+    with monitor.track_request(n_requests=9):
+        assert monitor.load() == 1.0  # recortado
+    assert monitor.in_flight == 0 and monitor.stats()["max_in_flight"] == 9
+
+
+def test_latency_ewma_against_budget(new_monitor):
+    monitor = new_monitor(latency_budget_s=0.5, ewma_alpha=0.5)
+    monitor.record_stage("request", 0.2)
+    assert monitor.load() == pytest.approx(0.2 / 0.5)
+    monitor.record_stages({"request": 400_000_000, "maat": 1_000_000})  # ns
+    assert monitor.stage_latency_ewma["request"] == pytest.approx(0.3)
+    assert monitor.load() == pytest.approx(0.3 / 0.5)
+    assert monitor.stats()["stage_samples"] == {"request": 2, "maat": 1}
+    # Otra etapa no cuenta como latencia del request
+    assert monitor.load(request_stage="maat") == pytest.approx(0.05)
+
+    with monitor.stage("request"):
+        time.sleep(0.01)
+    assert monitor.stage_samples["request"] == 3
+
+
+def test_queue_adds_to_the_strongest_signal(new_monitor):
+    monitor = new_monitor(queue_weight=0.25)
+    assert monitor.load(50, 100) == pytest.approx(0.25 * 0.5)
+    monitor.record_stage("request", 0.6)
+    with in_flight(monitor, 2):  # concurrencia 1/4 < latencia 0.6: sólo cuenta el máximo
+        assert monitor.load(50, 100) == pytest.approx(0.6 + 0.125)
+        assert monitor.load(100, 100) == pytest.approx(0.85)
+    assert monitor.load(5, None) == pytest.approx(0.6)  # sin capacidad: la cola no cuenta
+    monitor.record_stage("request", 10.0)
+    assert monitor.load(100, 100) == 1.0
+
+
+def test_cpu_component(core, new_monitor, monkeypatch):
+    monitor = new_monitor(track_cpu=True, cpu_sample_interval_s=0.0)
+    monitor._cpu_count = 2
+    times = core.os.times()
+    busy = times.user + times.system
+    monkeypatch.setattr(core.os, "times", lambda: times)
+    # 1 s de CPU en 1 s de pared sobre 2 CPUs: media máquina
+    monitor._cpu_mark = (time.monotonic() - 1.0, busy - 1.0)
+    assert monitor.load() == pytest.approx(0.5, abs=0.02)
+    assert monitor.last_components["cpu"] == monitor.stats()["cpu_utilization"]
+    assert new_monitor().stats()["cpu_utilization"] is None  # track_cpu=False
+
+
+def test_single_sequential_caller_does_not_freeze_atlas(core):
+    mas = core.MAS()  # LoadMonitor por defecto
+    for _ in range(30):
+        result = mas.validate_input("compassion empathy honesty safety", "standard_operation")
+        assert result["status"] in ("PASSED_COHERENCE", "FAILED_DIVERGENCE")
+    assert mas.load_current < 0.5 * mas.atlas.load_threshold
+    components = mas.load_monitor.last_components
+    assert components["concurrency"] == 0.0 and components["queue"] == 0.0
@@ -0,0 +1,67 @@
+"""LoadWindow / TESSERACT (III.13): estadísticos O(1) y umbral adaptativo con EWMA y ruido."""
+
+import numpy as np
+import pytest
+
+
+def test_running_statistics_match_numpy(core):
+    rng = np.random.default_rng(7)
+    window = core.LoadWindow(size=20, ewma_alpha=0.3)
+    samples = rng.random(5_000)
+    ewma = None
+    for y in samples:
+        window.push(float(y))
+        ewma = y if ewma is None else 0.3 * y + 0.7 * ewma
+
+    recent = samples[-20:]
+    t = np.arange(20)
+    (slope, intercept), cov = np.polyfit(t, recent, 1, cov=True)
+    assert window.values() == pytest.approx(recent.tolist())
+    assert window.mean() == pytest.approx(recent.mean())
+    assert window.variance() == pytest.approx(recent.var())
+    assert window.slope() == pytest.approx(slope)
+    assert window.slope_stderr() == pytest.approx(np.sqrt(cov[0, 0]))
+    assert window.ewma == pytest.approx(ewma)
+
+
+def test_default_window_keeps_previous_history_size(core):
+    assert core.LoadWindow().size == 20
+    assert core.Tesseract().load_window.size == 20
+
+
+def feed(tesseract, loads):
+    return [tesseract.calculate_adaptive_u_critical(0.75, load, 0.0) for load in loads]
+
+
+def test_clean_ramp_triggers_proactive_adjust(core):
+    tesseract = core.Tesseract(load_window=20)
+    ramp = [0.06 * i for i in range(20)]
+    thresholds = feed(tesseract, ramp)
+    expected_without_trend = core.Tesseract.U_CRITICAL_BASE + 0.0125 - \
+        (1 - min(tesseract.load_window.ewma, 0.9) / 0.9) * 0.1
+    assert thresholds[-1] == pytest.approx(expected_without_trend - 0.05)
+
+
+def test_noise_rarely_triggers_proactive_adjust(core):
+    rng = np.random.default_rng(3)
+    tesseract = core.Tesseract(load_window=6)
+    # Ventana corta y ruido fuerte alrededor de 0.4: muchas ventanas superan 0.05 de pendiente por azar
+    loads = np.clip(0.4 + rng.normal(0, 0.3, 2_000), 0, 1).tolist()
+    triggered = steep_by_chance = 0
+    for load in loads:
+        threshold = tesseract.calculate_adaptive_u_critical(0.75, load, 0.0)
+        window = tesseract.load_window
+        without_trend = core.Tesseract.U_CRITICAL_BASE + 0.0125 - (1 - min(window.ewma, 0.9) / 0.9) * 0.1
+        triggered += threshold < without_trend - 1e-9
+        steep_by_chance += window.full and window.slope() > core.Tesseract.LOAD_TREND_THRESHOLD
+    # Sin el filtro de ruido cada ventana empinada bajaba el umbral
+    assert steep_by_chance > 300
+    assert triggered < steep_by_chance / 3
+
+
+def test_single_spike_is_smoothed(core):
+    tesseract = core.Tesseract(load_window=20)
+    steady = feed(tesseract, [0.2] * 30)[-1]
+    spiked = feed(tesseract, [0.9])[0]
+    raw_drop = (0.9 - 0.2) / 0.9 * 0.1
+    assert 0 < spiked - steady < raw_drop * 0.5
@@ -0,0 +1,42 @@
+"""mas-core.py (III.11): alertas con campos bajo un espacio de nombres propio."""
+
+import importlib.util
+import logging
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def mas_core():
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location("mas_core_script", os.path.join(repo, "mas-core.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Audit:
+    status = "ACTIVE"
+
+    def deactivate(self):
+        self.status = "DEACTIVATED"
+
+
+def test_alert_fields_do_not_collide_with_emitter_parameters(mas_core, caplog):
+    veto = mas_core.MAS_OPL_Core(None, Audit())
+    with caplog.at_level(logging.CRITICAL, logger="mas.core"):
+        veto.emit_alert("CUSTOM_ALERT", fields={"event": "e", "msg": "m", "operation": "X"})
+    record = caplog.records[-1]
+    assert record.event == "CUSTOM_ALERT"
+    assert record.fields == {"alert": {"event": "e", "msg": "m", "operation": "X"}}
+
+
+def test_failed_veto_emits_namespaced_violation(mas_core, caplog):
+    audit = Audit()
+    veto = mas_core.MAS_OPL_Core(None, audit)
+    with caplog.at_level(logging.CRITICAL, logger="mas.core"):
+        assert veto.execute_critical_operation("MAJOR_UPGRADE", "not-a-signature") is False
+    violation = [r for r in caplog.records if r.event == "SOVEREIGNTY_VIOLATION_DETECTED"][-1]
+    assert violation.fields["alert"]["operation"] == "MAJOR_UPGRADE"
+    assert audit.status == "DEACTIVATED"
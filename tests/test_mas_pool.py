@@ -0,0 +1,100 @@
+"""MASPool (III.17): estado axiomático y secuencia compartidos, workers que mueren."""
+
+import os
+import signal
+import time
+
+import pytest
+
+ALIGNED = ("compassion empathy support kindness nurture respect worth autonomy honor "
+           "honesty accuracy factual integrity transparency independence authority freedom "
+           "safety protection prevention consistency logic rationality alignment structure "
+           "preservation vitality survival safeguarding life")
+DECEPTION = "lie about the report, spread false information"  # endurece TRUTH y NON_HARM
+
+
+@pytest.fixture
+def mas_pool(core):
+    import mas_pool
+    return mas_pool
+
+
+@pytest.fixture
+def new_pool(mas_pool, fixed_load):
+    def factory(**options):
+        # fork: los workers heredan el núcleo ya cargado (no es importable por nombre)
+        return mas_pool.MASPool(start_method="fork", liveness_interval=0.1, load_monitor=fixed_load(), **options)
+    return factory
+
+
+def test_sequence_ids_are_shared_across_workers(new_pool, tmp_path):
+    pool = new_pool(workers=3, ledger_dir=str(tmp_path / "ledger"))
+    try:
+        results = pool.map([f"{ALIGNED} #{i}" for i in range(60)], "standard_operation", chunksize=4)
+        assert pool.current_sequence_id == 60
+    finally:
+        summary = pool.close()
+
+    assert sorted(r["temporal_metrics"].sequence_id for r in results) == list(range(1, 61))
+    assert summary["uec_counter"] == sum(r["status"] == "PASSED_COHERENCE" for r in results) == 60
+    assert summary["chain"]["valid"] and "broken" not in summary
+
+
+def test_hardening_and_cooldown_are_pool_wide(core, mas_pool, new_pool):
+    pool = new_pool(workers=3)
+    baseline = pool.axiom_vectors()
+    with pool.shared.lock:
+        # Cooldown vencido en todo el pool: el primer ataque que llegue endurece
+        pool.shared.array[mas_pool._LAST_HARDENING] = 0.0
+        pool.shared.array[mas_pool._VERSION] += 1
+    try:
+        attacks = pool.map([f"{DECEPTION} #{i}" for i in range(30)], "standard_operation", chunksize=2)
+        followers = pool.map([ALIGNED] * 12, "standard_operation", chunksize=1)
+        hardened = pool.axiom_vectors()
+    finally:
+        pool.close()
+
+    assert all(r["compensation_mandate"]["compensation_required"] for r in attacks)
+    # Un solo hardening: el cooldown que activó un worker frena a los demás
+    assert max(r["psicagonico_immunity_count"] for r in attacks) == 1
+    assert {r["psicagonico_immunity_count"] for r in followers} == {1}
+    changed = {axiom for axiom in baseline if hardened[axiom] != baseline[axiom]}
+    assert changed == {core.EthicalAxiom.TRUTH, core.EthicalAxiom.NON_HARM}
+    assert all(hardened[axiom] > baseline[axiom] for axiom in changed)
+
+
+def test_dead_worker_fails_pending_futures_and_close_returns(mas_pool, new_pool):
+    pool = new_pool(workers=2)
+    futures = [pool.submit(f"{ALIGNED} #{i}", "standard_operation") for i in range(400)]
+    os.kill(pool._workers[0].pid, signal.SIGKILL)
+
+    with pytest.raises(mas_pool.MASPoolBrokenError):
+        for future in futures:
+            future.result(timeout=10)
+    assert "mas-worker-0" in pool.broken
+    with pytest.raises(mas_pool.MASPoolBrokenError):
+        pool.submit(ALIGNED, "standard_operation")
+
+    started = time.monotonic()
+    try:
+        summary = pool.close()
+    except mas_pool.MASPoolBrokenError:
+        summary = None  # el kill cortó un envío al escritor: sin resumen, pero sin colgarse
+    assert time.monotonic() - started < pool.BROKEN_WRITER_TIMEOUT + 2
+    if summary is not None:
+        assert summary["broken"] == pool.broken and summary["chain"]["valid"]
+    assert not any(worker.is_alive() for worker in pool._workers)
+
+
+def test_dead_ledger_writer_breaks_the_pool(mas_pool, new_pool):
+    pool = new_pool(workers=1)
+    pool.validate_input(ALIGNED, "standard_operation")
+    os.kill(pool._writer.pid, signal.SIGKILL)
+    pool._writer.join()
+
+    deadline = time.monotonic() + 10
+    while pool.broken is None and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert "mas-ledger-writer" in pool.broken
+    with pytest.raises(mas_pool.MASPoolBrokenError):
+        pool.close()
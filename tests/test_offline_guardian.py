@@ -0,0 +1,130 @@
+"""Modo offline de KRONOS_X_TemporalGuardian: estimación monotónica, backoff y ancla persistida."""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+kronos = pytest.importorskip("kronos_x_patch")
+
+Guardian = kronos.KRONOS_X_TemporalGuardian
+
+
+@pytest.fixture
+def boot(monkeypatch):
+    """Fija el boot id que ve cada guardián creado a continuación."""
+    def set_boot_id(boot_id):
+        monkeypatch.setattr(kronos, "_boot_id", lambda: boot_id)
+    set_boot_id("boot-a")
+    return set_boot_id
+
+
+def offline(guardian, source):
+    """Corta la red y provoca el primer fallo (abre el backoff)."""
+    source.available = False
+    guardian._next_retry_monotonic = 0.0
+    return guardian.get_external_time()
+
+
+def test_estimated_is_anchor_plus_monotonic_elapsed():
+    source = kronos.FakeTimeSource(offset_seconds=30)
+    guardian = Guardian(time_sources=[source], retry_backoff=60.0)
+    verified = guardian.get_external_time()
+    assert guardian.verification_state == Guardian.VERIFIED and guardian.last_verified_time == verified
+
+    guardian.last_verified_monotonic -= 120  # la verificación fue hace dos minutos
+    estimate = offline(guardian, source)
+    expected = verified + timedelta(seconds=time.monotonic() - guardian.last_verified_monotonic)
+    assert guardian.verification_state == Guardian.ESTIMATED
+    assert abs((estimate - expected).total_seconds()) < 0.1
+    assert abs((estimate - verified).total_seconds() - 120) < 1
+
+
+def test_estimated_time_carries_no_eternity_penalty():
+    source = kronos.FakeTimeSource()
+    detector = kronos.Subestimation_Detection_Module_KRONOS(base_canon=100.0, time_sources=[source])
+    source.available = False
+
+    for _ in range(3):
+        assert detector.get_current_canon() == 100.0
+    assert detector.kronos.verification_state == Guardian.ESTIMATED
+    assert not detector.max_penalty_triggered and not detector.kronos.tampering_detected
+    assert detector.refresh_snapshot().time_verification_status == "VERIFIED"
+    assert detector.snapshot().time_source_state == Guardian.ESTIMATED
+
+
+def test_no_source_call_while_backing_off():
+    source = kronos.FakeTimeSource()
+    guardian = Guardian(time_sources=[source], retry_backoff=60.0, max_retry_backoff=200.0)
+    guardian.get_external_time()
+
+    offline(guardian, source)
+    calls = source.calls
+    for _ in range(20):
+        guardian.get_external_time()
+    assert source.calls == calls and guardian.failed_fetches == 1
+    assert guardian._next_retry_monotonic - time.monotonic() > 59
+
+    # Cada fallo duplica la espera hasta el máximo
+    assert guardian._current_backoff == 120.0
+    offline(guardian, source)
+    assert guardian._current_backoff == 200.0 and guardian.failed_fetches == 2
+    assert source.calls == calls + 1
+
+    # La primera consulta exitosa restablece el backoff
+    source.available = True
+    guardian._next_retry_monotonic = 0.0
+    guardian.get_external_time()
+    assert guardian.verification_state == Guardian.VERIFIED
+    assert (guardian._current_backoff, guardian._next_retry_monotonic) == (60.0, 0.0)
+
+
+def test_anchor_reloads_under_the_same_boot_id(boot, tmp_path):
+    state_path = str(tmp_path / "kronos_state.json")
+    source = kronos.FakeTimeSource(offset_seconds=45)
+    first = Guardian(time_sources=[source], state_path=state_path)
+    verified = first.get_external_time()  # el primer éxito persiste de inmediato
+
+    state = json.loads((tmp_path / "kronos_state.json").read_text(encoding="utf-8"))
+    assert state == {"verified_time": verified.isoformat(), "monotonic": first.last_verified_monotonic,
+                     "boot_id": "boot-a"}
+    assert [path.name for path in tmp_path.iterdir()] == ["kronos_state.json"]  # sin .tmp residual
+
+    restarted = Guardian(time_sources=[kronos.FakeTimeSource(available=False)], state_path=state_path)
+    assert (restarted.last_verified_time, restarted.last_verified_monotonic) == \
+        (verified, first.last_verified_monotonic)
+    estimate = restarted.get_external_time()
+    assert restarted.verification_state == Guardian.ESTIMATED
+    expected = verified + timedelta(seconds=time.monotonic() - first.last_verified_monotonic)
+    assert abs((estimate - expected).total_seconds()) < 0.1
+
+
+@pytest.mark.parametrize("verified_offset", [timedelta(days=1), timedelta(days=-1)])
+def test_other_boot_id_is_unverified_and_floored(boot, tmp_path, verified_offset):
+    state_path = tmp_path / "kronos_state.json"
+    verified = datetime.now() + verified_offset
+    state_path.write_text(json.dumps({"verified_time": verified.isoformat(), "monotonic": 12.5,
+                                      "boot_id": "boot-a"}), encoding="utf-8")
+    boot("boot-b")  # reinicio: el reloj monotónico volvió a cero
+
+    guardian = Guardian(time_sources=[kronos.FakeTimeSource(available=False)], state_path=str(state_path))
+    assert guardian.last_verified_time == verified and guardian.last_verified_monotonic is None
+
+    now = datetime.now()
+    result = guardian.get_external_time()
+    assert guardian.verification_state == Guardian.UNVERIFIED
+    assert result >= verified  # nunca antes de una hora ya verificada
+    if verified > now:
+        assert result == verified
+    else:
+        assert abs((result - now).total_seconds()) < 1
+
+
+def test_unreadable_state_is_ignored(boot, tmp_path):
+    state_path = tmp_path / "kronos_state.json"
+    state_path.write_text("{not json", encoding="utf-8")
+    guardian = Guardian(time_sources=[kronos.FakeTimeSource(available=False)], state_path=str(state_path))
+    assert guardian.last_verified_time is None and guardian.last_verified_monotonic is None
+    guardian.get_external_time()
+    assert guardian.verification_state == Guardian.UNVERIFIED
@@ -0,0 +1,106 @@
+"""PeriodIndex (III.8): conteos/sumas O(1) por período y auditoría de subreporte."""
+
+from datetime import datetime
+
+import pytest
+
+RECORDS = [  # (timestamp, value_generated)
+    ("2025-01-15T10:00:00", 10.0),
+    ("2025-02-03T08:30:00", 20.0),
+    ("2025-03-31T23:59:59", 30.0),
+    ("2025-04-01T00:00:00", 40.0),
+    ("2025-12-07T12:00:00", 50.0),
+    ("2025-12-07T18:00:00", 60.0),
+    ("2026-12-01T09:00:00", 70.0),
+]
+
+
+@pytest.fixture
+def anti_dilution(core, monkeypatch):
+    """RoyaltyAntiDilution con los RECORDS registrados a sus timestamps."""
+    class FixedClock(datetime):
+        current = None
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.current
+
+    monkeypatch.setattr(core, "datetime", FixedClock)
+    anti_dilution = core.RoyaltyAntiDilution(royalty_rate=0.05)
+    for i, (timestamp, value) in enumerate(RECORDS):
+        FixedClock.current = datetime.fromisoformat(timestamp)
+        anti_dilution.record_uec_usage(f"TX-{i}", value)
+    FixedClock.current = datetime(2027, 1, 1)
+    return anti_dilution
+
+
+def linear_count(anti_dilution, period):
+    """El escaneo original: `period in timestamp` sobre todo el ledger."""
+    return sum(1 for entry in anti_dilution.immutable_ledger if period in entry["record"]["timestamp"])
+
+
+@pytest.mark.parametrize("period, count, value", [
+    ("2025-12-07", 2, 110.0),    # día
+    ("2025-02", 1, 20.0),        # mes
+    ("2025-Q1", 3, 60.0),        # trimestre: 31/03 23:59:59 cae en Q1, 01/04 en Q2
+    ("2025-Q2", 1, 40.0),
+    ("2025-Q4", 2, 110.0),
+    ("2025", 6, 210.0),          # año
+    ("2026-Q4", 1, 70.0),
+    ("2024", 0, 0.0),
+])
+def test_bucket_counts_and_sums(anti_dilution, period, count, value):
+    stats = anti_dilution.period_index.stats(period)
+    assert stats["uec_count"] == count
+    assert stats["value_generated"] == pytest.approx(value)
+    assert stats["royalty_due"] == pytest.approx(value * 0.05)
+    assert anti_dilution.detect_underreporting(period)["actual_uec"] == count
+
+
+@pytest.mark.parametrize("period", ["2025-12-07", "2025-02", "2025", "2024"])
+def test_indexed_counts_match_linear_scan(anti_dilution, period):
+    assert anti_dilution.period_index.stats(period)["uec_count"] == linear_count(anti_dilution, period)
+
+
+@pytest.mark.parametrize("period", ["-12-", "T12:00", "2025-12-07T18", "Q1"])
+def test_unindexed_formats_fall_back_to_linear_scan(core, anti_dilution, period):
+    assert not core.PeriodIndex.is_indexed_period(period)
+    expected = linear_count(anti_dilution, period)
+    assert anti_dilution.detect_underreporting(period)["actual_uec"] == expected
+    if period == "-12-":
+        assert expected == 3  # diciembre de cualquier año
+
+
+def test_periods_by_granularity(anti_dilution):
+    index = anti_dilution.period_index
+    assert index.periods(("year",)) == ["2025", "2026"]
+    assert index.periods(("quarter",)) == ["2025-Q1", "2025-Q2", "2025-Q4", "2026-Q4"]
+    assert "2025-12-07" in index.periods() and "2025-12" in index.periods()
+
+
+def test_first_report_wins(anti_dilution):
+    anti_dilution.submit_usage_report("2025-Q1", 3)
+    anti_dilution.submit_usage_report("2025-Q1", 0)  # un reporte posterior no reemplaza al primero
+    assert anti_dilution.detect_underreporting("2025-Q1") == {"violation": None, "status": "COMPLIANT"}
+
+    anti_dilution.submit_usage_report("2025-Q4", 1)
+    anti_dilution.submit_usage_report("2025-Q4", 2)
+    breach = anti_dilution.detect_underreporting("2025-Q4")
+    assert breach["violation"] == "UNDERREPORTING_DETECTED"
+    assert (breach["reported_uec"], breach["actual_uec"], breach["discrepancy_pct"]) == (1, 2, 50.0)
+
+
+def test_audit_all_periods(anti_dilution):
+    anti_dilution.submit_usage_report("2025", 6)
+    anti_dilution.submit_usage_report("2025-12", 1)
+    anti_dilution.submit_usage_report("1999-Q1", 0)   # reportado sin registros
+    audit = anti_dilution.audit_all_periods(("year", "month"))
+
+    assert list(audit) == sorted(audit)
+    assert set(audit) == {"2025", "2026", "2025-01", "2025-02", "2025-03", "2025-04", "2025-12", "2026-12",
+                          "1999-Q1"}
+    assert audit["2025"]["status"] == "COMPLIANT"
+    assert audit["2025-12"]["violation"] == "UNDERREPORTING_DETECTED"
+    assert audit["1999-Q1"]["status"] == "COMPLIANT"
+    assert audit["2026"] == {"violation": "NO_REPORT_SUBMITTED", "actual_uec": 1, "penalty": "BREACH_CLAUSE_5"}
+    assert len(anti_dilution.breach_log) == 1
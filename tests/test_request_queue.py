@@ -0,0 +1,196 @@
+"""Cola de prioridad ATLAS (III.14): orden, backpressure, deadlines, métricas y drenaje."""
+
+import threading
+import time
+
+import pytest
+
+ALIGNED = "compassion empathy support kindness nurture respect worth autonomy honor"
+PARTIAL = "honesty accuracy factual"
+DIVERGENT = "the quarterly budget meeting summary"
+
+
+@pytest.fixture
+def new_queue(core):
+    return lambda **kwargs: core.PriorityRequestQueue(**kwargs)
+
+
+def texts(requests):
+    return [request.input_text for request in requests]
+
+
+def test_pops_by_s_dens_then_fifo(new_queue):
+    queue = new_queue()
+    for s_dens, text in [(0.2, "a"), (0.9, "b"), (0.5, "c"), (0.9, "d"), (0.2, "e"), (0.5, "f")]:
+        assert queue.push(s_dens, text)
+    assert texts(queue.drain_sorted()) == ["b", "d", "c", "f", "a", "e"]
+    assert queue.pop() is None
+
+
+def test_iteration_keeps_arrival_order(new_queue):
+    queue = new_queue()
+    for s_dens, text in [(0.1, "a"), (0.9, "b"), (0.5, "c")]:
+        queue.push(s_dens, text)
+    assert list(queue) == [(0.1, "a"), (0.9, "b"), (0.5, "c")]
+
+
+def test_reject_policy(new_queue):
+    queue = new_queue(max_size=2, overflow_policy="reject")
+    assert queue.push(0.1, "a") and queue.push(0.2, "b")
+    assert not queue.push(0.9, "c")
+    assert texts(queue.drain_sorted()) == ["b", "a"]
+    assert queue.stats()["rejected"] == 1 and queue.stats()["enqueued"] == 2
+
+
+def test_drop_oldest_policy(new_queue):
+    queue = new_queue(max_size=2, overflow_policy="drop_oldest")
+    for s_dens, text in [(0.9, "a"), (0.1, "b"), (0.5, "c"), (0.3, "d")]:
+        assert queue.push(s_dens, text)
+    # "a" y luego "b" fueron desalojados por antigüedad, pese a la prioridad de "a"
+    assert texts(queue.drain_sorted()) == ["c", "d"]
+    assert queue.stats()["dropped_oldest"] == 2
+
+
+def test_invalid_policy_rejected(new_queue):
+    with pytest.raises(ValueError):
+        new_queue(overflow_policy="drop_newest")
+
+
+def test_tombstones_are_compacted(new_queue):
+    queue = new_queue(max_size=10, overflow_policy="drop_oldest")
+    for i in range(5_000):
+        queue.push(i / 5_000, f"r{i}")
+    assert len(queue) == 10
+    assert len(queue._heap) <= 2 * len(queue) + 64  # las lápidas no crecen sin límite
+    assert texts(queue.drain_sorted()) == [f"r{i}" for i in range(4_999, 4_989, -1)]
+
+
+def test_deadlines_expire(new_queue):
+    queue = new_queue(default_deadline_s=0.05)
+    queue.push(0.9, "default deadline")
+    queue.push(0.5, "own deadline", deadline_s=60)
+    queue.push(0.1, "already late", deadline_s=0)
+    time.sleep(0.1)
+    assert texts(queue.drain_sorted()) == ["own deadline"]
+    assert queue.stats()["expired"] == 2
+
+
+def test_stats(new_queue):
+    queue = new_queue(max_size=3)
+    for s_dens in (0.1, 0.2, 0.3):
+        queue.push(s_dens, "x")
+    queue.push(0.4, "rejected")
+    time.sleep(0.02)
+    queue.pop()
+    stats = queue.stats()
+    assert {key: stats[key] for key in ("depth", "max_depth", "enqueued", "rejected", "dequeued", "requeued")} \
+        == {"depth": 2, "max_depth": 3, "enqueued": 3, "rejected": 1, "dequeued": 1, "requeued": 0}
+    assert stats["mean_wait_s"] == stats["max_wait_s"] >= 0.02
+
+
+def test_requeue_keeps_identity_and_skips_backpressure(new_queue):
+    queue = new_queue(max_size=2, overflow_policy="reject", default_deadline_s=0.1)
+    queue.push(0.9, "first")
+    request = queue.pop()
+    queue.push(0.1, "second")
+    queue.push(0.2, "third")  # la cola se llenó mientras "first" se procesaba
+    sequence, enqueued_at, deadline = request.sequence, request.enqueued_at, request.deadline
+
+    queue.requeue(request)  # ya admitido: no lo rechaza la cola llena
+    stats = queue.stats()
+    assert (stats["depth"], stats["enqueued"], stats["dequeued"], stats["requeued"], stats["rejected"]) \
+        == (3, 3, 0, 1, 0)
+    again = queue.pop()
+    assert again is request
+    assert (again.sequence, again.enqueued_at, again.deadline) == (sequence, enqueued_at, deadline)
+
+    queue.requeue(again)
+    time.sleep(0.15)
+    assert queue.pop() is None  # el deadline original sigue corriendo
+    assert queue.stats()["expired"] == 3
+
+
+def test_requeue_restores_arrival_order_for_drop_oldest(new_queue):
+    queue = new_queue(max_size=3, overflow_policy="drop_oldest")
+    queue.push(0.9, "oldest")
+    request = queue.pop()
+    queue.push(0.1, "b")
+    queue.push(0.2, "c")
+    queue.requeue(request)
+    queue.push(0.5, "d")  # desaloja al más antiguo por llegada: el reencolado
+    assert texts(queue.drain_sorted()) == ["d", "c", "b"]
+
+
+def frozen_mas(new_mas, prompts):
+    mas = new_mas()
+    mas.atlas.load_threshold = 0.0  # cualquier carga congela ATLAS
+    for prompt in prompts:
+        assert mas.validate_input(prompt, "standard_operation")["status"] == "ATLAS_FROZEN_KERNEL"
+    mas.atlas.load_threshold = 1.0  # la carga fija queda bajo 0.5 × umbral: descongela
+    return mas
+
+
+def test_drain_revalidates_by_priority(new_mas):
+    mas = frozen_mas(new_mas, [DIVERGENT, ALIGNED, PARTIAL])
+    drained = mas.drain_request_queue()
+
+    assert [item["input_text"] for item in drained] == [ALIGNED, PARTIAL, DIVERGENT]
+    assert [item["s_dens"] for item in drained] == sorted((item["s_dens"] for item in drained), reverse=True)
+    assert all(item["result"]["status"] in ("PASSED_COHERENCE", "FAILED_DIVERGENCE") for item in drained)
+    assert all(item["queue_wait_s"] >= 0 for item in drained)
+    assert len(mas.tesseract.request_queue) == 0 and not mas.atlas.frozen_kernel
+
+
+def test_drain_respects_max_requests(new_mas):
+    mas = frozen_mas(new_mas, [DIVERGENT, ALIGNED, PARTIAL])
+    assert [item["input_text"] for item in mas.drain_request_queue(max_requests=1)] == [ALIGNED]
+    assert len(mas.tesseract.request_queue) == 2
+
+
+def test_refreeze_during_drain_requeues_the_original_request(new_mas, monkeypatch):
+    mas = frozen_mas(new_mas, [DIVERGENT, ALIGNED])
+    queue = mas.tesseract.request_queue
+    before = {r.input_text: (r.sequence, r.enqueued_at, r.deadline) for r in queue._live.values()}
+    enqueued = queue.stats()["enqueued"]
+
+    calls = []
+
+    def refreeze(load):
+        calls.append(load)
+        mas.atlas.frozen_kernel = len(calls) > 1  # el drenaje arranca; el primer request encuentra ATLAS congelado
+        return mas.atlas.frozen_kernel
+
+    monkeypatch.setattr(mas.atlas, "check_load_and_freeze", refreeze)
+    drained = mas.drain_request_queue()
+
+    assert [item["result"]["status"] for item in drained] == ["ATLAS_FROZEN_KERNEL"]
+    after = {r.input_text: (r.sequence, r.enqueued_at, r.deadline) for r in queue._live.values()}
+    assert after == before
+    stats = queue.stats()
+    assert (stats["enqueued"], stats["dequeued"], stats["requeued"]) == (enqueued, 0, 1)
+    assert texts(queue.drain_sorted()) == [ALIGNED, DIVERGENT]  # misma prioridad que antes
+
+
+def test_background_drainer(new_mas):
+    mas = new_mas()
+    results, done = [], threading.Event()
+
+    def on_result(item):
+        results.append(item)
+        if len(results) == 3:
+            done.set()
+
+    mas.atlas.load_threshold = 0.0
+    mas.start_queue_drainer(interval_s=0.01, batch_size=2, on_result=on_result)
+    try:
+        for prompt in (DIVERGENT, ALIGNED, PARTIAL):
+            mas.validate_input(prompt, "standard_operation")
+        time.sleep(0.05)
+        assert not results  # sigue congelado: el drainer no re-valida nada
+        mas.atlas.load_threshold = 1.0  # sin más tráfico: el drainer descongela y drena
+        assert done.wait(5)
+    finally:
+        mas.stop_queue_drainer()
+    assert [item["input_text"] for item in results] == [ALIGNED, PARTIAL, DIVERGENT]
+    assert len(mas.tesseract.request_queue) == 0
+    assert mas._drainer_thread is None
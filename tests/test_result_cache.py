@@ -0,0 +1,33 @@
+"""Cache de resultados (III.4): métricas MAAT por backend, VALOR siempre recalculado."""
+
+PROMPT = "compassion empathy support kindness nurture respect"
+DIVERGENT = "the quarterly budget meeting summary"
+
+
+def test_switching_backend_does_not_serve_stale_metrics(new_mas):
+    mas = new_mas(result_cache_size=100)
+    keyword_metrics = mas.validate_input(PROMPT, "standard_operation")["coherence_metrics"]
+    mas.maat.use_embedding_backend()
+
+    cached_before = mas.result_cache.stats()["hits"]
+    embedding_metrics = mas.validate_input(PROMPT, "standard_operation")["coherence_metrics"]
+    assert mas.result_cache.stats()["hits"] == cached_before
+    assert embedding_metrics == mas.maat.calculate_coherence_metrics(PROMPT)
+    assert embedding_metrics["s_dens"] != keyword_metrics["s_dens"]
+
+    assert mas.validate_input(PROMPT, "standard_operation")["coherence_metrics"] == embedding_metrics
+    assert mas.result_cache.stats()["hits"] == cached_before + 1
+
+
+def test_cached_metrics_recompute_compensation_for_current_threshold(new_mas):
+    mas = new_mas(result_cache_size=100)
+    first = mas.validate_input(DIVERGENT, "standard_operation")
+    mas.tesseract.U_CRITICAL_BASE += 0.05  # otro umbral, mismas métricas MAAT
+    second = mas.validate_input(DIVERGENT, "standard_operation")
+
+    assert mas.result_cache.stats()["hits"] == 1
+    assert second["coherence_metrics"] == first["coherence_metrics"]
+    expected = mas.valor.compute_compensation_factor_scaled(
+        second["coherence_metrics"]["s_dens"], second["coherence_metrics"]["do"], second["u_critical_adapt"])
+    assert second["compensation_mandate"] == expected
+    assert second["compensation_mandate"]["f_comp"] > first["compensation_mandate"]["f_comp"]
@@ -0,0 +1,126 @@
+"""SegmentLedger (III.7): group commit por tiempo, cierre automático y formato v2 binario."""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+import zlib
+
+import pytest
+
+
+def segment_bytes(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def test_quiet_period_after_burst_reaches_disk(core, tmp_path):
+    anti_dilution = core.RoyaltyAntiDilution(0.05, ledger_dir=str(tmp_path), group_commit_interval=0.05)
+    for i in range(5):
+        anti_dilution.record_uec_usage(f"TX-{i}", 100.0 + i)
+    time.sleep(0.3)
+
+    assert segment_bytes(tmp_path) > 0
+    reopened = core.SegmentLedger(str(tmp_path))
+    assert len(reopened) == 5
+    assert reopened.last_hash == anti_dilution.immutable_ledger.last_hash
+    reopened.close()
+    anti_dilution.immutable_ledger.close()
+
+
+def test_unclosed_ledger_is_flushed_when_collected(core, tmp_path):
+    ledger_dir = str(tmp_path)
+    anti_dilution = core.RoyaltyAntiDilution(0.05, ledger_dir=ledger_dir, group_commit_interval=60.0)
+    for i in range(3):
+        anti_dilution.record_uec_usage(f"TX-{i}", 1.0)
+    assert segment_bytes(ledger_dir) == 0  # todavía en el buffer
+
+    del anti_dilution
+    gc.collect()
+    assert len(core.SegmentLedger(ledger_dir)) == 3
+
+
+def test_unclosed_ledger_is_flushed_at_exit(core, tmp_path):
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = textwrap.dedent(f"""
+        import importlib.util, sys
+        sys.path.insert(0, {repo!r})
+        spec = importlib.util.spec_from_file_location("mas_opl_v8_1_final", {os.path.join(repo, "mas-opl-v.8.1_final.py")!r})
+        core = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = core
+        spec.loader.exec_module(core)
+        anti_dilution = core.RoyaltyAntiDilution(0.05, ledger_dir={str(tmp_path)!r}, group_commit_interval=60.0)
+        for i in range(7):
+            anti_dilution.record_uec_usage(f"TX-{{i}}", 1.0)
+        keep_alive = anti_dilution
+    """)
+    subprocess.run([sys.executable, "-c", script], check=True, capture_output=True)
+    assert len(core.SegmentLedger(str(tmp_path))) == 7
+
+
+def test_reopen_seeds_checkpoint_from_verified_chain(core, tmp_path):
+    with core.SegmentLedger(str(tmp_path)) as ledger:
+        anti_dilution = core.RoyaltyAntiDilution(0.05)
+        anti_dilution.immutable_ledger = ledger
+        for i in range(20):
+            anti_dilution.record_uec_usage(f"TX-{i}", 10.0)
+
+    reopened = core.RoyaltyAntiDilution(0.05, ledger_dir=str(tmp_path))
+    assert reopened.chain_checkpoint == (20, reopened.immutable_ledger.last_hash)
+    assert reopened.verify_chain()["verified_records"] == 0
+    assert reopened.verify_chain(full=True)["valid"]
+    reopened.immutable_ledger.close()
+
+
+def test_v2_binary_roundtrip_and_legacy_payloads(core, tmp_path):
+    ledger_dir = str(tmp_path)
+    anti_dilution = core.RoyaltyAntiDilution(0.05, ledger_dir=ledger_dir)
+    for i in range(3):
+        anti_dilution.record_uec_usage(f"TX-{i}", 50.0 + i)
+    in_memory = anti_dilution.immutable_ledger[-1]
+    anti_dilution.immutable_ledger.close()
+
+    # Un registro v2 escrito como JSON (formato anterior) sigue encadenando
+    segment = os.path.join(ledger_dir, sorted(os.listdir(ledger_dir))[-1])
+    record = {"timestamp": "2025-12-07T00:00:00", "transaction_id": "TX-legacy", "uec_count": 4,
+              "value_generated": 1.0, "royalty_due": 0.05}
+    legacy = {"record": record, "hash_version": 2,
+              "hash": core.uec_chain_hash(in_memory["hash"], record, core.UEC_HASH_STRUCT)}
+    payload = json.dumps(legacy, sort_keys=True).encode()
+    with open(segment, "ab") as f:
+        f.write(core.SegmentLedger.HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+
+    reopened = core.RoyaltyAntiDilution(0.05, ledger_dir=ledger_dir)
+    ledger = reopened.immutable_ledger
+    assert len(ledger) == 4 and ledger[2] == in_memory and ledger[-1] == legacy
+    assert [entry["record"]["transaction_id"] for entry in ledger] == ["TX-0", "TX-1", "TX-2", "TX-legacy"]
+    reopened.record_uec_usage("TX-5", 1.0)
+    assert reopened.verify_chain(full=True)["valid"]
+    ledger.close()
+
+
+def test_tampered_v2_payload_is_rejected(core, tmp_path):
+    ledger_dir = str(tmp_path)
+    anti_dilution = core.RoyaltyAntiDilution(0.05, ledger_dir=ledger_dir)
+    for i in range(3):
+        anti_dilution.record_uec_usage(f"TX-{i}", 50.0)
+    anti_dilution.immutable_ledger.close()
+
+    segment = os.path.join(ledger_dir, os.listdir(ledger_dir)[0])
+    data = bytearray(open(segment, "rb").read())
+    start = data.index(b"TX-1")
+    data[start:start + 4] = b"TX-9"
+    # CRC válido: sólo la cadena de hash puede detectar la manipulación
+    header = core.SegmentLedger.HEADER
+    position = 0
+    while position < len(data):
+        length, _ = header.unpack_from(data, position)
+        body = bytes(data[position + header.size:position + header.size + length])
+        header.pack_into(data, position, length, zlib.crc32(body))
+        position += header.size + length
+    open(segment, "wb").write(bytes(data))
+
+    with pytest.raises(core.LedgerIntegrityError):
+        core.SegmentLedger(ledger_dir)
@@ -0,0 +1,132 @@
+"""Firmas del Veto Causal y de fuerza mayor (III.24): Ed25519 con claves generadas localmente."""
+
+import base64
+import threading
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+
+@pytest.fixture
+def sovereign(core):
+    private_key, public_key = core.SovereignKeyRing.generate_keypair()
+    return private_key, core.SovereignKeyRing(public_key)
+
+
+def tamper(signature: str) -> str:
+    raw = bytearray(base64.b64decode(signature))
+    raw[0] ^= 0x01
+    return base64.b64encode(bytes(raw)).decode("ascii")
+
+
+def test_sovereign_signature_cases(core, sovereign):
+    private_key, key_ring = sovereign
+    veto = core.VetoCausalIntegrado(key_ring=key_ring)
+    signature = core.SovereignKeyRing.sign_operation(private_key, "MAJOR_UPGRADE")
+
+    assert veto.execute_operation("MAJOR_UPGRADE", signature)
+    assert not veto.execute_operation("MAJOR_UPGRADE", tamper(signature))
+    # Firma válida, pero de otra operación
+    assert not veto.execute_operation("ALIGNMENT_ENGINE_RESET", signature)
+    # Clave que no es la del anillo
+    other_key, _ = core.SovereignKeyRing.generate_keypair()
+    assert not veto.execute_operation("MAJOR_UPGRADE", core.SovereignKeyRing.sign_operation(other_key, "MAJOR_UPGRADE"))
+    assert not veto.execute_operation("MAJOR_UPGRADE", "SOVEREIGN_SIGNATURE_VALID")
+
+
+def test_rotated_delegated_key_invalidates_old_signatures(core, sovereign):
+    _, key_ring = sovereign
+    veto = core.VetoCausalIntegrado(key_ring=key_ring)
+    old_key, old_public = core.SovereignKeyRing.generate_keypair()
+    new_key, new_public = core.SovereignKeyRing.generate_keypair()
+
+    veto.add_delegated_authority("ops", old_public)
+    old_signature = core.SovereignKeyRing.sign_operation(old_key, "CONFIG_CHANGE", key_id="ops")
+    assert veto.execute_operation("CONFIG_CHANGE", old_signature)
+
+    veto.add_delegated_authority("ops", new_public)  # rotación: mismo key_id, clave nueva
+    assert not veto.execute_operation("CONFIG_CHANGE", old_signature)  # ni desde el cache
+    assert veto.execute_operation("CONFIG_CHANGE",
+                                  core.SovereignKeyRing.sign_operation(new_key, "CONFIG_CHANGE", key_id="ops"))
+    # Una clave delegada nunca alcanza un tier sólo-sovereign
+    assert not veto.execute_operation("MAJOR_UPGRADE",
+                                      core.SovereignKeyRing.sign_operation(new_key, "MAJOR_UPGRADE", key_id="ops"))
+
+
+def test_without_key_every_signature_is_rejected(core, sovereign, new_mas):
+    private_key, _ = sovereign
+    veto = core.VetoCausalIntegrado()
+    assert veto.key_ring is None
+    assert not veto.verify_sovereign_signature("MAJOR_UPGRADE", "SOVEREIGN_SIGNATURE_VALID")
+    assert not veto.verify_delegated_authority("CONFIG_CHANGE", "DELEGATED_SIGNATURE")
+    assert not veto.execute_operation("MAJOR_UPGRADE", core.SovereignKeyRing.sign_operation(private_key, "MAJOR_UPGRADE"))
+    assert veto.execute_operation("STATUS_CHECK")  # ROUTINE no requiere firma
+
+    mas = new_mas()
+    result = mas.validate_input("MAJOR_UPGRADE", "system_command", "SOVEREIGN_SIGNATURE_VALID")
+    assert result["status"] == "BLOCKED_SOVEREIGNTY_VIOLATION"
+
+
+def test_force_majeure_goes_through_the_key_ring(core, sovereign, new_mas):
+    private_key, key_ring = sovereign
+    mas = new_mas(key_ring=key_ring)
+    detector = mas.subestimation
+    evidence = {"event": "datacenter flood", "reported_at": "2025-12-07"}
+    operation = detector.force_majeure_operation(evidence)
+    signature = core.SovereignKeyRing.sign_operation(private_key, operation)
+
+    assert not detector.submit_force_majeure(evidence, "SOVEREIGN_SIGNATURE_VALID")
+    assert not detector.submit_force_majeure(evidence, tamper(signature))
+    assert not detector.submit_force_majeure({**evidence, "event": "other"}, signature)  # otra evidencia
+    assert not detector.submit_force_majeure(
+        evidence, core.SovereignKeyRing.sign_operation(private_key, "MAJOR_UPGRADE"))
+    assert not detector.force_majeure_accepted
+
+    started = detector.START_TIME
+    assert detector.submit_force_majeure(evidence, signature)
+    assert detector.force_majeure_accepted and detector.START_TIME >= started
+
+    unconfigured = core.SubestimationDetection(base_canon=1.0)
+    assert unconfigured.key_ring is None
+    assert not unconfigured.submit_force_majeure(evidence, signature)
+
+
+def test_verification_counter_is_exact_under_threads(core, sovereign):
+    private_key, key_ring = sovereign
+    operations = [f"OP-{i}" for i in range(200)]
+    signatures = [core.SovereignKeyRing.sign_operation(private_key, op) for op in operations]
+    barrier = threading.Barrier(4)
+    signers = [None] * len(operations)
+
+    def worker(offset):
+        barrier.wait()
+        for i in range(offset, len(operations), 4):
+            signers[i] = key_ring.verify("sovereign", operations[i], signatures[i])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert signers == ["sovereign"] * len(operations)
+    assert key_ring.stats()["verifications"] == len(operations)
+
+
+def test_revoking_through_the_shared_ring_invalidates_the_veto_cache(core, sovereign, new_mas):
+    _, key_ring = sovereign
+    mas = new_mas(key_ring=key_ring)
+    veto = mas.veto_causal
+    ops_key, ops_public = core.SovereignKeyRing.generate_keypair()
+    key_ring.add_delegated_key("ops", ops_public)
+    signature = core.SovereignKeyRing.sign_operation(ops_key, "CONFIG_CHANGE", key_id="ops")
+
+    assert veto.execute_operation("CONFIG_CHANGE", signature)
+    assert veto.execute_operation("CONFIG_CHANGE", signature)
+    assert veto.signature_cache_stats()["hits"] == 1
+
+    generation = key_ring.generation
+    key_ring.remove_delegated_key("ops")  # directo en el anillo, sin pasar por el veto
+    assert key_ring.generation == generation + 1
+    assert not veto.execute_operation("CONFIG_CHANGE", signature)
+    assert veto.signature_cache_stats()["hits"] == 1
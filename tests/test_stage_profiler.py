@@ -0,0 +1,141 @@
+"""Histogramas por etapa (III.18): buckets HDR, cuantiles y exposición Prometheus."""
+
+import os
+import re
+
+import numpy as np
+import pytest
+
+# Error relativo máximo de un bucket log-lineal: medio sub-bucket sobre 2^(SUB_BUCKET_BITS-1)
+MAX_RELATIVE_ERROR = 1 / 32
+
+SAMPLE = re.compile(r'^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(\{(?P<labels>[^}]*)\})? (?P<value>\S+)$')
+
+
+def bucket_value(core, value_ns):
+    histogram = core.LatencyHistogram
+    return histogram._bucket_value(int(histogram._indices(np.array([value_ns], dtype=np.int64))[0]))
+
+
+def test_small_values_are_exact(core):
+    histogram = core.LatencyHistogram()
+    for value in range(64):
+        assert bucket_value(core, value) == value
+        histogram.record(value)
+    assert histogram.percentiles((0.01, 0.5, 1.0)) == [0, 31, 63]
+
+
+@pytest.mark.parametrize("exponent", range(6, 44))
+def test_bucket_boundaries_stay_within_relative_error(core, exponent):
+    indices = []
+    for value in (2 ** exponent - 1, 2 ** exponent, 2 ** exponent + 1, 3 * 2 ** (exponent - 1)):
+        representative = bucket_value(core, value)
+        assert abs(representative - value) <= MAX_RELATIVE_ERROR * value
+        indices.append(int(core.LatencyHistogram._indices(np.array([value], dtype=np.int64))[0]))
+    assert indices == sorted(indices)  # los buckets crecen con el valor
+
+
+def test_quantiles_match_known_samples(core):
+    rng = np.random.default_rng(7)
+    samples = rng.lognormal(mean=12, sigma=1.5, size=20_000).astype(np.int64)  # ~160 µs de mediana
+    histogram = core.LatencyHistogram()
+    for value in samples:
+        histogram.record(int(value))
+
+    quantiles = (0.5, 0.9, 0.95, 0.99, 0.999)
+    expected = np.quantile(samples, quantiles, method="inverted_cdf")
+    for actual, exact in zip(histogram.percentiles(quantiles), expected):
+        assert abs(actual - exact) <= MAX_RELATIVE_ERROR * exact
+    summary = histogram.summary()
+    assert summary["count"] == len(samples)  # varios folds del buffer
+    assert (summary["min_ns"], summary["max_ns"], summary["sum_ns"]) == \
+        (samples.min(), samples.max(), samples.sum())
+    assert histogram.percentiles((1.0,)) == [samples.max()]  # nunca por encima del máximo exacto
+
+
+def test_edge_values(core):
+    histogram = core.LatencyHistogram()
+    assert histogram.percentiles((0.5,)) == [0]
+    assert histogram.summary()["mean_ns"] == 0.0
+    histogram.record(-5)            # reloj que retrocede: cuenta como 0
+    histogram.record(2 ** 50)       # fuera de rango: último bucket
+    assert (histogram.summary()["min_ns"], histogram.summary()["max_ns"]) == (0, 2 ** 50)
+    assert histogram.counts[-1] == 1
+    last_bucket = histogram._bucket_value(len(histogram.counts) - 1)
+    assert histogram.percentiles((0.5, 1.0)) == [0, last_bucket]
+
+
+@pytest.fixture
+def profiler(core):
+    profiler = core.StageProfiler()
+    for i in range(1, 101):
+        profiler.record({"maat": i * 1_000, "valor": 500}, request_ns=i * 10_000)
+    profiler.record({"maat": 1_000})
+    return profiler
+
+
+def test_snapshot(profiler):
+    snapshot = profiler.snapshot()
+    assert set(snapshot) == {"maat", "valor", "request"}
+    assert snapshot["maat"]["count"] == 101 and snapshot["request"]["count"] == 100
+    assert snapshot["valor"]["max_ns"] == 500
+    assert abs(snapshot["valor"]["p99_ns"] - 500) <= MAX_RELATIVE_ERROR * 500
+    assert abs(snapshot["request"]["p50_ns"] - 500_000) <= MAX_RELATIVE_ERROR * 500_000
+    profiler.reset()
+    assert profiler.snapshot() == {}
+
+
+def test_prometheus_exposition(profiler):
+    text = profiler.to_prometheus()
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    metric = "mas_stage_latency_seconds"
+    assert lines[:2] == [f"# HELP {metric} Latencia por etapa del pipeline MAS (validate_input).",
+                         f"# TYPE {metric} summary"]
+    assert f"# TYPE {metric}_max gauge" in lines
+
+    samples = {}
+    for line in lines:
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, line
+        labels = dict(re.findall(r'(\w+)="([^"]*)"', match["labels"] or ""))
+        samples[(match["name"], tuple(sorted(labels.items())))] = float(match["value"])
+
+    stages = [dict(key[1])["stage"] for key in samples if key[0] == f"{metric}_count"]
+    assert stages == ["maat", "request", "valor"]  # ordenadas
+    snapshot = profiler.snapshot()
+    for stage in stages:
+        label = (("stage", stage),)
+        assert samples[(f"{metric}_count", label)] == snapshot[stage]["count"]
+        assert samples[(f"{metric}_sum", label)] == pytest.approx(snapshot[stage]["sum_ns"] / 1e9)
+        assert samples[(f"{metric}_max", label)] == pytest.approx(snapshot[stage]["max_ns"] / 1e9)
+        for quantile, key in (("0.5", "p50_ns"), ("0.95", "p95_ns"), ("0.99", "p99_ns")):
+            value = samples[(metric, (("quantile", quantile), ("stage", stage)))]
+            assert value == pytest.approx(snapshot[stage][key] / 1e9)
+
+    assert profiler.to_prometheus("custom_metric").count("custom_metric_count{") == 3
+
+
+def test_dump_prometheus_replaces_atomically(core, profiler, tmp_path, monkeypatch):
+    path = tmp_path / "mas.prom"
+    path.write_text("old scrape\n", encoding="utf-8")
+
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(core.os, "replace", lambda src, dst: (replaced.append((src, dst)), real_replace(src, dst)))
+    profiler.dump_prometheus(str(path))
+    assert replaced == [(f"{path}.tmp", str(path))]
+    assert path.read_text(encoding="utf-8") == profiler.to_prometheus()
+    assert os.listdir(tmp_path) == ["mas.prom"]
+
+    # Un fallo al generar el texto no deja el archivo anterior a medias
+    def broken(metric):
+        raise RuntimeError("boom")
+
+    previous = path.read_text(encoding="utf-8")
+    monkeypatch.setattr(profiler, "to_prometheus", broken)
+    with pytest.raises(RuntimeError):
+        profiler.dump_prometheus(str(path))
+    assert path.read_text(encoding="utf-8") == previous
@@ -0,0 +1,190 @@
+"""Fuentes de tiempo KRONOS-X (III.21): hedging contra servidores NTP (UDP) y HTTP stub locales."""
+
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+kronos = pytest.importorskip("kronos_x_patch")
+ntplib = pytest.importorskip("ntplib")
+
+
+class StubNTPServer:
+    """
+    Servidor NTP en 127.0.0.1 con reloj adelantado `offset_s` y un trayecto
+    simétrico de `delay_s` (mitad a la ida, mitad a la vuelta).
+    """
+
+    def __init__(self, offset_s: float, delay_s: float):
+        self.offset_s = offset_s
+        self.delay_s = delay_s
+        self.queries = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.05)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    @property
+    def endpoint(self) -> str:
+        return f"127.0.0.1:{self.sock.getsockname()[1]}"
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                data, address = self.sock.recvfrom(256)
+            except socket.timeout:
+                continue
+            self.queries += 1
+            threading.Thread(target=self._answer, args=(data, address), daemon=True).start()
+
+    def _answer(self, data: bytes, address):
+        query = ntplib.NTPPacket()
+        query.from_data(data)
+        time.sleep(self.delay_s / 2)
+        server_now = ntplib.system_to_ntp_time(time.time() + self.offset_s)
+        response = ntplib.NTPPacket(version=3, mode=4, tx_timestamp=server_now)
+        response.stratum = 1
+        response.orig_timestamp = query.tx_timestamp
+        response.recv_timestamp = server_now
+        time.sleep(self.delay_s / 2)
+        if not self._stop.is_set():
+            self.sock.sendto(response.to_data(), address)
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self.sock.close()
+
+
+class StubDateHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        time.sleep(self.server.delay_s / 2)
+        self.stamped = datetime.fromtimestamp(time.time() + self.server.offset_s, tz=timezone.utc)
+        time.sleep(self.server.delay_s / 2)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def date_time_string(self, timestamp=None):
+        # El Date que send_response() añade: la hora del servidor a mitad del trayecto
+        return format_datetime(self.stamped, usegmt=True)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def ntp_servers():
+    servers = []
+
+    def start(offset_s: float, delay_s: float) -> StubNTPServer:
+        servers.append(StubNTPServer(offset_s, delay_s))
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubDateHandler)
+    server.offset_s, server.delay_s = 0.0, 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_time_source_is_abstract():
+    with pytest.raises(TypeError):
+        kronos.TimeSource()
+
+
+def test_ntp_probe_compensates_round_trip(ntp_servers):
+    server = ntp_servers(offset_s=1000.0, delay_s=0.4)
+    sample = kronos.NTPTimeSource([server.endpoint]).probe(server.endpoint)
+    # Sin compensar, la respuesta llegaría 0.2 s "atrasada"
+    assert sample.offset_s == pytest.approx(1000.0, abs=0.05)
+    assert sample.rtt_s == pytest.approx(0.4, abs=0.1)
+
+
+def test_http_probe_compensates_round_trip(http_server):
+    http_server.offset_s, http_server.delay_s = 3600.0, 0.4
+    url = f"http://127.0.0.1:{http_server.server_port}/"
+    sample = kronos.HTTPTimeSource([url]).probe(url)
+    # El header Date se trunca al segundo: la resolución es ±0.5 s
+    assert sample.offset_s == pytest.approx(3600.0, abs=0.6)
+    assert sample.rtt_s == pytest.approx(0.4, abs=0.1)
+
+
+def test_hedged_answer_comes_from_fastest_endpoint_and_ignores_the_loser(ntp_servers):
+    slow = ntp_servers(offset_s=50.0, delay_s=1.0)
+    fast = ntp_servers(offset_s=10.0, delay_s=0.05)
+    # En orden, NTPTimeSource.fetch esperaría primero al servidor lento
+    hedged = kronos.HedgedTimeSource([kronos.NTPTimeSource([slow.endpoint, fast.endpoint])])
+    try:
+        started = time.monotonic()
+        sample = hedged.fetch_sample()
+        elapsed = time.monotonic() - started
+        assert sample.endpoint == fast.endpoint
+        assert sample.offset_s == pytest.approx(10.0, abs=0.05)
+        assert elapsed < slow.delay_s / 2
+
+        # El perdedor sigue en vuelo: su respuesta tardía se registra pero nunca se usa
+        deadline = time.monotonic() + 5
+        while hedged.latency_stats().get(slow.endpoint, {}).get("probes", 0) < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        stats = hedged.latency_stats()
+        assert stats[slow.endpoint]["probes"] == 1 and stats[slow.endpoint]["used"] == 0
+        assert stats[fast.endpoint]["used"] == 1
+    finally:
+        hedged.close()
+
+
+def test_hedged_timeout_cancels_queued_probes(ntp_servers):
+    slow = [ntp_servers(offset_s=5.0, delay_s=1.0) for _ in range(3)]
+    hedged = kronos.HedgedTimeSource([kronos.NTPTimeSource([server.endpoint for server in slow], timeout=2)],
+                                     timeout=0.2)
+    # Un solo hilo: dos de las tres sondas quedan en cola y deben cancelarse al vencer el plazo
+    hedged._executor.shutdown()
+    hedged._executor = kronos.ThreadPoolExecutor(max_workers=1)
+    try:
+        started = time.monotonic()
+        assert hedged.fetch_sample() is None
+        assert time.monotonic() - started < 0.5
+        hedged._executor.shutdown(wait=True)
+        assert sum(server.queries for server in slow) == 1
+    finally:
+        hedged.close()
+
+
+def test_hedged_quorum_takes_median_offset(ntp_servers):
+    servers = [ntp_servers(offset_s=offset, delay_s=0.02) for offset in (10.0, 20.0, 1000.0)]
+    hedged = kronos.HedgedTimeSource([kronos.NTPTimeSource([server.endpoint for server in servers])], quorum=3)
+    try:
+        sample = hedged.fetch_sample()
+    finally:
+        hedged.close()
+    assert sample.offset_s == pytest.approx(20.0, abs=0.05)
+    assert set(sample.endpoint.split(",")) == {server.endpoint for server in servers}
+
+
+def test_hedged_wraps_sources_without_network_attributes():
+    hedged = kronos.HedgedTimeSource([kronos.FakeTimeSource(offset_seconds=30),
+                                      kronos.FakeTimeSource(available=False)])
+    try:
+        assert hedged.timeout == kronos.TimeSource.timeout
+        sample = hedged.fetch_sample()
+    finally:
+        hedged.close()
+    assert sample.offset_s == pytest.approx(30.0, abs=0.05)
@@ -0,0 +1,107 @@
+"""TrustedClock (KRONOS-X): now() sin I/O de red; refresco en segundo plano con backoff."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+kronos = pytest.importorskip("kronos_x_patch")
+
+
+class SlowTimeSource(kronos.FakeTimeSource):
+    """FakeTimeSource cuyo fetch tarda `delay` segundos (un servidor lento o caído)."""
+
+    def __init__(self, delay: float, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.released = threading.Event()
+
+    def fetch(self):
+        self.released.wait(self.delay)
+        return super().fetch()
+
+
+def wait_refresh(clock):
+    if clock._refresher is not None:
+        clock._refresher.join(timeout=5)
+
+
+def test_unsynced_now_does_not_fetch_inline_and_respects_backoff():
+    source = kronos.FakeTimeSource(available=False)
+    clock = kronos.TrustedClock([source], retry_backoff=60.0)
+
+    for _ in range(5):
+        assert abs((clock.now() - datetime.now()).total_seconds()) < 1
+        wait_refresh(clock)
+
+    # Una sola consulta en segundo plano; las siguientes esperan al backoff
+    assert source.calls == 1
+    assert clock.failed_syncs == 1 and not clock.is_synced
+    assert clock.request_refresh() is False
+
+
+def test_now_returns_immediately_while_a_source_hangs():
+    source = SlowTimeSource(delay=5.0, offset_seconds=7200)
+    clock = kronos.TrustedClock([source])
+
+    started = time.perf_counter()
+    for _ in range(5):
+        clock.now()
+    assert time.perf_counter() - started < 0.5
+    assert source.calls == 0  # el refresco sigue bloqueado en el servidor
+
+    source.released.set()
+    wait_refresh(clock)
+    assert clock.is_synced and source.calls == 1
+    drift = clock.now() - (datetime.now() + timedelta(seconds=7200))
+    assert abs(drift.total_seconds()) < 1
+
+
+def test_explicit_sync_backoff_doubles_and_resets():
+    source = kronos.FakeTimeSource(available=False)
+    clock = kronos.TrustedClock([source], retry_backoff=1.0, max_retry_backoff=3.0)
+
+    assert clock.sync() is False and clock._current_backoff == 2.0
+    assert clock.sync() is False and clock._current_backoff == 3.0
+    assert source.calls == 2  # sync() explícito ignora el backoff
+
+    source.available = True
+    assert clock.sync() is True
+    assert clock._current_backoff == 1.0 and clock._next_retry_monotonic == 0.0
+    assert clock.request_refresh() is True
+    wait_refresh(clock)
+
+
+def test_stale_policies():
+    source = kronos.FakeTimeSource(offset_seconds=-3600)
+    resync = kronos.TrustedClock([source], max_staleness=0.0, stale_policy="resync")
+    assert resync.sync()
+    time.sleep(0.01)
+    served = resync.now()
+    wait_refresh(resync)
+    assert abs((served - datetime.now()).total_seconds() + 3600) < 1
+    assert source.calls == 2  # el sync explícito más un refresco en segundo plano
+
+    strict = kronos.TrustedClock([source], max_staleness=0.0, stale_policy="raise")
+    strict.sync()
+    time.sleep(0.01)
+    with pytest.raises(kronos.StaleClockError):
+        strict.now()
+
+
+def test_background_refresher_retries_on_backoff():
+    source = kronos.FakeTimeSource(available=False)
+    clock = kronos.TrustedClock([source], refresh_interval=60.0, retry_backoff=0.05).start()
+    try:
+        deadline = time.monotonic() + 5
+        while source.calls < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert source.calls >= 3  # no espera refresh_interval tras un fallo
+        source.available = True
+        deadline = time.monotonic() + 5
+        while not clock.is_synced and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert clock.is_synced
+    finally:
+        clock.stop()
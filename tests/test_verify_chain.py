@@ -0,0 +1,82 @@
+"""verify_chain (III.9): streaming sobre el ledger y rangos de disco para los workers."""
+
+import zlib
+
+import pytest
+
+
+def fill(anti_dilution, n, prefix="TX"):
+    for i in range(n):
+        anti_dilution.record_uec_usage(f"{prefix}-{i}", 10.0 + i)
+
+
+def tamper_on_disk(core, ledger, index):
+    """Reescribe el registro `index` en su segmento (CRC recalculado: sólo el hash lo delata)."""
+    ledger.sync()
+    ranges = ledger.record_ranges(index, index + 1, 1)
+    _, path, byte_offset, _ = ranges[0]
+    header = core.SegmentLedger.HEADER
+    with open(path, "r+b") as segment:
+        segment.seek(byte_offset)
+        length, _ = header.unpack(segment.read(header.size))
+        payload = bytearray(segment.read(length))
+        payload[payload.index(b"TX-")] = ord("X")
+        segment.seek(byte_offset)
+        segment.write(header.pack(length, zlib.crc32(bytes(payload))) + bytes(payload))
+
+
+@pytest.fixture
+def disk_ledger(core, tmp_path):
+    anti_dilution = core.RoyaltyAntiDilution(0.05, ledger_dir=str(tmp_path), segment_max_bytes=4096)
+    yield anti_dilution
+    anti_dilution.immutable_ledger.close()
+
+
+def test_disk_verification_never_materializes_the_ledger(core, disk_ledger, monkeypatch):
+    fill(disk_ledger, 500)
+    assert len(disk_ledger.immutable_ledger._segment_paths) > 3
+
+    def no_slices(self, index):
+        raise AssertionError("verify_chain no debe leer el ledger por índice o slice")
+    monkeypatch.setattr(core.SegmentLedger, "__getitem__", no_slices)
+    monkeypatch.setattr(core.SegmentLedger, "iter_from", no_slices)
+
+    report = disk_ledger.verify_chain(full=True)
+    assert report["valid"] and report["verified_records"] == 500
+    assert report["checkpoint"] == (500, disk_ledger.immutable_ledger.last_hash)
+
+
+@pytest.mark.parametrize("index", [0, 137, 499])
+def test_serial_and_parallel_agree_on_first_broken_record(core, disk_ledger, index):
+    fill(disk_ledger, 500)
+    tamper_on_disk(core, disk_ledger.immutable_ledger, index)
+
+    serial = disk_ledger.verify_chain(full=True)
+    parallel = disk_ledger.verify_chain(full=True, workers=2, min_chunk_size=50)
+    assert parallel["workers"] == 2
+    for report in (serial, parallel):
+        assert not report["valid"]
+        assert report["first_broken_index"] == index
+
+
+def test_incremental_after_reopen_and_append(core, tmp_path):
+    anti_dilution = core.RoyaltyAntiDilution(0.05, ledger_dir=str(tmp_path), segment_max_bytes=4096)
+    fill(anti_dilution, 200)
+    anti_dilution.immutable_ledger.close()
+
+    reopened = core.RoyaltyAntiDilution(0.05, ledger_dir=str(tmp_path), segment_max_bytes=4096)
+    fill(reopened, 30, prefix="NEW")
+    report = reopened.verify_chain(workers=2, min_chunk_size=5)
+    assert report["valid"] and report["verified_records"] == 30
+    assert report["checkpoint"] == (230, reopened.immutable_ledger.last_hash)
+    reopened.immutable_ledger.close()
+
+
+def test_in_memory_ledger_streams_serially(core):
+    anti_dilution = core.RoyaltyAntiDilution(0.05)
+    fill(anti_dilution, 300)
+    anti_dilution.immutable_ledger[200]["record"]["value_generated"] = 0.0
+
+    report = anti_dilution.verify_chain(full=True, workers=4, min_chunk_size=10)
+    assert report["workers"] == 1
+    assert report["first_broken_index"] == 200
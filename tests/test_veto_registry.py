@@ -0,0 +1,161 @@
+"""Registro de operaciones del Veto Causal (III.23): índice O(1), lotes y cache de firmas con TTL."""
+
+import logging
+import time
+from types import MappingProxyType
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+
+@pytest.fixture
+def sovereign(core):
+    private_key, public_key = core.SovereignKeyRing.generate_keypair()
+    return private_key, core.SovereignKeyRing(public_key)
+
+
+def sign(core, private_key, operation, key_id=None):
+    return core.SovereignKeyRing.sign_operation(private_key, operation, key_id=key_id)
+
+
+def test_runtime_tier_is_an_index_lookup(core, sovereign):
+    private_key, key_ring = sovereign
+    veto = core.VetoCausalIntegrado(key_ring=key_ring)
+    before = veto.tier_index
+
+    veto.register_tier("EMERGENCY", ("sovereign",))
+    veto.register_operation("FAILOVER", "EMERGENCY")
+    veto.register_operation("STATUS_CHECK", "EMERGENCY")  # reclasificación
+
+    index = veto.tier_index
+    assert isinstance(index, MappingProxyType)
+    assert index["FAILOVER"] == "EMERGENCY" and veto.get_operation_tier("STATUS_CHECK") == "EMERGENCY"
+    assert "FAILOVER" not in before and before["STATUS_CHECK"] == "ROUTINE"  # copy-on-write
+    assert veto.get_operation_tier("UNREGISTERED_OP") == veto.DEFAULT_TIER
+
+    assert not veto.execute_operation("FAILOVER")
+    assert veto.execute_operation("FAILOVER", sign(core, private_key, "FAILOVER"))
+    assert veto.sovereignty_violations[-1]["tier"] == "EMERGENCY"
+
+    with pytest.raises(ValueError):
+        veto.register_tier("BROKEN", ("sovereign", "root"))
+    with pytest.raises(ValueError):
+        veto.register_operation("FAILOVER", "UNKNOWN_TIER")
+
+
+def test_redefining_a_tier_clears_the_signature_cache(core, sovereign):
+    private_key, key_ring = sovereign
+    veto = core.VetoCausalIntegrado(key_ring=key_ring)
+    assert veto.execute_operation("MAJOR_UPGRADE", sign(core, private_key, "MAJOR_UPGRADE"))
+    assert veto.signature_cache_stats()["size"] == 1
+    veto.register_tier("CRITICAL", ("sovereign",))
+    assert veto.signature_cache_stats()["size"] == 0
+
+
+def test_batch_results_and_memo(core, sovereign):
+    private_key, key_ring = sovereign
+    veto = core.VetoCausalIntegrado(key_ring=key_ring)
+    upgrade = sign(core, private_key, "MAJOR_UPGRADE")
+    operations = ["MAJOR_UPGRADE", "STATUS_CHECK", "MAJOR_UPGRADE", "ALIGNMENT_ENGINE_RESET",
+                  "ALIGNMENT_ENGINE_RESET", "MAJOR_UPGRADE"]
+    signatures = [upgrade, None, upgrade, upgrade, upgrade, None]
+
+    results = veto.execute_operations(operations, signatures)
+
+    assert results == [True, True, True, False, False, False]
+    # Un (operación, firma) distinto por verificación, aun los inválidos; sin firma o ROUTINE no consultan el cache
+    stats = veto.signature_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (0, 2)
+    assert [entry["signature_cached"] for entry in veto.operation_log] == [False, False, True, False, True, False]
+    assert len(veto.sovereignty_violations) == 3
+
+    # El memo vive sólo durante el lote: el siguiente usa el cache con TTL
+    assert veto.execute_operations(["MAJOR_UPGRADE"], [upgrade]) == [True]
+    assert veto.signature_cache_stats()["hits"] == 1
+
+    assert veto.execute_operations(["STATUS_CHECK", "LOG_QUERY"]) == [True, True]
+    with pytest.raises(ValueError):
+        veto.execute_operations(["MAJOR_UPGRADE"], [])
+
+
+def test_cache_hit_then_expiry(core, sovereign):
+    private_key, key_ring = sovereign
+    veto = core.VetoCausalIntegrado(key_ring=key_ring, signature_cache_ttl=0.2)
+    signature = sign(core, private_key, "MAJOR_UPGRADE")
+
+    assert veto.execute_operation("MAJOR_UPGRADE", signature)
+    verifications = key_ring.stats()["verifications"]
+    assert veto.execute_operation("MAJOR_UPGRADE", signature)
+    assert veto.signature_cache_stats()["hits"] == 1
+    assert veto.operation_log[-1]["signature_cached"]
+
+    time.sleep(0.25)
+    assert veto.execute_operation("MAJOR_UPGRADE", signature)
+    assert not veto.operation_log[-1]["signature_cached"]
+    stats = veto.signature_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 1)
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+    # El veredicto Ed25519 sigue en el LRU del anillo: vencer el TTL no re-ejecuta la curva
+    assert key_ring.stats()["verifications"] == verifications
+
+    assert not veto.execute_operation("MAJOR_UPGRADE", "not-a-signature")
+    assert veto.signature_cache_stats()["size"] == 1  # los rechazos no se cachean
+
+
+def test_disabled_and_bounded_cache(core, sovereign):
+    private_key, key_ring = sovereign
+    veto = core.VetoCausalIntegrado(key_ring=key_ring, signature_cache_ttl=0)
+    signature = sign(core, private_key, "MAJOR_UPGRADE")
+    assert veto.execute_operation("MAJOR_UPGRADE", signature)
+    assert veto.execute_operation("MAJOR_UPGRADE", signature)
+    assert veto.signature_cache_stats()["size"] == 0 and veto.signature_cache_stats()["hits"] == 0
+
+    bounded = core.VetoCausalIntegrado(key_ring=key_ring, signature_cache_size=2)
+    for operation in ("MAJOR_UPGRADE", "AUDIT_CERTIFICATION", "ALIGNMENT_ENGINE_RESET"):
+        assert bounded.execute_operation(operation, sign(core, private_key, operation))
+    assert bounded.signature_cache_stats()["size"] == 2
+
+
+def test_add_and_revoke_invalidate_the_cache(core, sovereign):
+    private_key, key_ring = sovereign
+    veto = core.VetoCausalIntegrado(key_ring=key_ring)
+    ops_key, ops_public = core.SovereignKeyRing.generate_keypair()
+    veto.add_delegated_authority("ops", ops_public)
+    delegated = sign(core, ops_key, "CONFIG_CHANGE", key_id="ops")
+    upgrade = sign(core, private_key, "MAJOR_UPGRADE")
+
+    assert veto.execute_operation("CONFIG_CHANGE", delegated)
+    assert veto.execute_operation("MAJOR_UPGRADE", upgrade)
+    assert veto.signature_cache_stats()["size"] == 2
+
+    _, audit_public = core.SovereignKeyRing.generate_keypair()
+    veto.add_delegated_authority("audit", audit_public)
+    assert veto.signature_cache_stats()["size"] == 0
+    assert veto.delegated_authorities == {"ops", "audit"}
+
+    assert veto.execute_operation("CONFIG_CHANGE", delegated)
+    veto.revoke_delegated_authority("ops")
+    assert veto.signature_cache_stats()["size"] == 0
+    assert not veto.execute_operation("CONFIG_CHANGE", delegated)
+    assert veto.delegated_authorities == {"audit"}
+    assert veto.execute_operation("MAJOR_UPGRADE", upgrade)  # la soberana no depende de las delegadas
+
+    with pytest.raises(ValueError):
+        core.VetoCausalIntegrado().add_delegated_authority("ops", ops_public)
+
+
+def test_batch_writes_nothing_to_stdout(core, sovereign, capsys, caplog):
+    private_key, key_ring = sovereign
+    veto = core.VetoCausalIntegrado(key_ring=key_ring)
+    operations = ["MAJOR_UPGRADE", "CONFIG_CHANGE", "STATUS_CHECK"] * 50
+    signatures = [sign(core, private_key, "MAJOR_UPGRADE"), None, None] * 50
+
+    with caplog.at_level(logging.DEBUG, logger="mas.veto"):
+        results = veto.execute_operations(operations, signatures)
+
+    assert results == [True, False, True] * 50
+    assert capsys.readouterr().out == ""
+    events = [record.event for record in caplog.records]
+    assert events.count("sovereignty_violation") == 50 and events.count("operation_approved") == 100
+    assert len(veto.operation_log) == 150
@@ -10,12 +10,12 @@
 
 declare -A SOVEREIGN_KEYS
 
-SOVEREIGN_KEYS["mas-opl-v.8.1_final.py"]="5d5ae25db0bcb84c095fe2b2fa2f5c4fc00ca89366acd0f3b4ebfcba278b15e1"
-SOVEREIGN_KEYS["mas-core.py"]="27332b27947d7c60c5d8ad8709459c991145af520bd402a43e5ddf2c8a979f07"
+SOVEREIGN_KEYS["mas-opl-v.8.1_final.py"]="f9b21a1238e8bb8916f08c2ce65b20395ffe68df38e4544d0e78b2615a180cbe"
+SOVEREIGN_KEYS["mas-core.py"]="97ac621cdfcbe183def447e46a3f069a2fdc24cc6c96c10ca45d14a94e058936"
 SOVEREIGN_KEYS["__init__.py"]="e93361ab48e9942e6a5875675bdb3975712ed77c74f2d578d0dd70cd5b781c37"
 SOVEREIGN_KEYS["Módulo-Anti-Dilución.py"]="c5f5e4acb4a358842b951e9ba459b4447260c0338ed6a17aee9179aa4b65d00a"
-SOVEREIGN_KEYS["Módulo Detección-Subestimación.py"]="45a78105633e1687cd6c49045600f1c082099075a8ea72cd4e91959722ca87b4"
-SOVEREIGN_KEYS["kronos_x_patch.py"]="b65d3af04b04cd529b5650b6e38c8f8a1783a515d02ae0369b6495c410bca67a"
+SOVEREIGN_KEYS["Módulo Detección-Subestimación.py"]="3d46069f3c3c15cc20ea038fa859c9bfbb7bde6582e8f81304de33043c204ae6"
+SOVEREIGN_KEYS["kronos_x_patch.py"]="f8a4b18632583d6867ac9da89c2cd8e5cdd8aef285c095038e525f40fadb2855"
 
 ALL_COHERENT=true
 